@@ -4,6 +4,7 @@ using AutoMapper;
 using BeautyCenterApi.Interfaces;
 using BeautyCenterApi.DTOs;
 using BeautyCenterApi.Models;
+using BeautyCenterApi.Services;
 
 namespace BeautyCenterApi.Controllers
 {
@@ -14,12 +15,14 @@ namespace BeautyCenterApi.Controllers
     {
         private readonly IAppointmentRepository _appointmentRepository;
         private readonly IServiceTypeRepository _serviceTypeRepository;
+        private readonly AppointmentScheduler _scheduler;
         private readonly IMapper _mapper;
 
-        public AppointmentsController(IAppointmentRepository appointmentRepository, IServiceTypeRepository serviceTypeRepository, IMapper mapper)
+        public AppointmentsController(IAppointmentRepository appointmentRepository, IServiceTypeRepository serviceTypeRepository, AppointmentScheduler scheduler, IMapper mapper)
         {
             _appointmentRepository = appointmentRepository;
             _serviceTypeRepository = serviceTypeRepository;
+            _scheduler = scheduler;
             _mapper = mapper;
         }
 
@@ -38,6 +41,25 @@ namespace BeautyCenterApi.Controllers
             }
         }
 
+        [HttpGet("paged")]
+        public async Task<ActionResult<PagedResultDto<AppointmentDto>>> GetAppointmentsPaged([FromQuery] AppointmentQueryDto query)
+        {
+            try
+            {
+                if (!KeysetCursor.IsValid(query.Cursor))
+                {
+                    return BadRequest(new { message = "Invalid cursor" });
+                }
+
+                var page = await _appointmentRepository.GetPagedAsync(query);
+                return Ok(page);
+            }
+            catch (Exception ex)
+            {
+                return StatusCode(500, new { message = "Internal server error", error = ex.Message });
+            }
+        }
+
         [HttpGet("{id}")]
         public async Task<ActionResult<AppointmentDto>> GetAppointment(int id)
         {
@@ -148,6 +170,36 @@ namespace BeautyCenterApi.Controllers
             }
         }
 
+        [HttpGet("availability")]
+        public async Task<ActionResult<IEnumerable<StaffAvailabilityDto>>> GetAvailability([FromQuery] int serviceTypeId, [FromQuery] DateTime startDate, [FromQuery] DateTime endDate, [FromQuery] int? userId)
+        {
+            try
+            {
+                if (endDate.Date < startDate.Date)
+                {
+                    return BadRequest(new { message = "End date must be on or after start date" });
+                }
+
+                if ((endDate.Date - startDate.Date).TotalDays >= _scheduler.MaxRangeDays)
+                {
+                    return BadRequest(new { message = $"Date range cannot exceed {_scheduler.MaxRangeDays} days" });
+                }
+
+                var serviceType = await _serviceTypeRepository.GetByIdAsync(serviceTypeId);
+                if (serviceType == null)
+                {
+                    return NotFound(new { message = "Service type not found" });
+                }
+
+                var availability = await _scheduler.GetAvailabilityAsync(serviceType, startDate, endDate, userId, HttpContext.RequestAborted);
+                return Ok(availability);
+            }
+            catch (Exception ex)
+            {
+                return StatusCode(500, new { message = "Internal server error", error = ex.Message });
+            }
+        }
+
         [HttpGet("revenue")]
         public async Task<ActionResult<object>> GetRevenue([FromQuery] DateTime startDate, [FromQuery] DateTime endDate)
         {
@@ -176,13 +228,23 @@ namespace BeautyCenterApi.Controllers
                     return BadRequest(new { message = "Service type not found" });
                 }
 
+                appointment.TenantId = serviceType.TenantId;
                 appointment.TotalPrice = serviceType.Price;
                 appointment.FinalPrice = serviceType.Price - (createAppointmentDto.DiscountAmount ?? 0);
                 
-                var createdAppointment = await _appointmentRepository.AddAsync(appointment);
-                var createdAppointmentDto = _mapper.Map<AppointmentDto>(createdAppointment);
+                var conflict = await _scheduler.SaveAsync(appointment, HttpContext.RequestAborted);
+                if (conflict != null)
+                {
+                    return Conflict(new { message = "Staff member already has an appointment at this time", conflict });
+                }
+
+                var createdAppointmentDto = _mapper.Map<AppointmentDto>(appointment);
 
-                return CreatedAtAction(nameof(GetAppointment), new { id = createdAppointment.Id }, createdAppointmentDto);
+                return CreatedAtAction(nameof(GetAppointment), new { id = appointment.Id }, createdAppointmentDto);
+            }
+            catch (TimeoutException)
+            {
+                return StatusCode(503, new { message = "Staff calendar is busy, please retry" });
             }
             catch (Exception ex)
             {
@@ -215,9 +277,18 @@ namespace BeautyCenterApi.Controllers
                     appointment.SessionsRemaining = appointment.SessionsTotal.Value - updateAppointmentDto.SessionsCompleted.Value;
                 }
 
-                await _appointmentRepository.UpdateAsync(appointment);
+                var conflict = await _scheduler.SaveAsync(appointment, HttpContext.RequestAborted);
+                if (conflict != null)
+                {
+                    return Conflict(new { message = "Staff member already has an appointment at this time", conflict });
+                }
+
                 return NoContent();
             }
+            catch (TimeoutException)
+            {
+                return StatusCode(503, new { message = "Staff calendar is busy, please retry" });
+            }
             catch (Exception ex)
             {
                 return StatusCode(500, new { message = "Internal server error", error = ex.Message });
@@ -249,9 +320,20 @@ namespace BeautyCenterApi.Controllers
                 }
 
                 appointment.Status = newStatus;
-                await _appointmentRepository.UpdateAsync(appointment);
+
+                // İptal edilmiş randevu yeniden planlanırsa saat bu arada dolmuş olabilir
+                var conflict = await _scheduler.SaveAsync(appointment, HttpContext.RequestAborted);
+                if (conflict != null)
+                {
+                    return Conflict(new { message = "Staff member already has an appointment at this time", conflict });
+                }
+
                 return NoContent();
             }
+            catch (TimeoutException)
+            {
+                return StatusCode(503, new { message = "Staff calendar is busy, please retry" });
+            }
             catch (Exception ex)
             {
                 return StatusCode(500, new { message = "Internal server error", error = ex.Message });
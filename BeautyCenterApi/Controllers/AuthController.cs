@@ -24,28 +24,47 @@ namespace BeautyCenterApi.Controllers
         {
             try
             {
-                var token = await _authService.LoginAsync(loginDto.Username, loginDto.Password);
+                var result = await _authService.LoginAsync(loginDto.Username, loginDto.Password, HttpContext.RequestAborted);
                 
-                if (token == null)
+                if (result == null)
                 {
                     return Unauthorized(new { message = "Invalid username or password" });
                 }
 
-                var user = await _authService.GetUserByUsernameAsync(loginDto.Username);
-                
-                return Ok(new
+                return Ok(CreateTokenResponse(result));
+            }
+            catch (Exception ex)
+            {
+                return StatusCode(500, new { message = "Internal server error", error = ex.Message });
+            }
+        }
+
+        [HttpPost("refresh")]
+        public async Task<IActionResult> Refresh([FromBody] RefreshTokenDto refreshTokenDto)
+        {
+            try
+            {
+                var result = await _authService.RefreshAsync(refreshTokenDto.RefreshToken);
+                if (result == null)
                 {
-                    token = token,
-                    user = new
-                    {
-                        id = user!.Id,
-                        username = user.Username,
-                        email = user.Email,
-                        firstName = user.FirstName,
-                        lastName = user.LastName,
-                        role = user.Role
-                    }
-                });
+                    return Unauthorized(new { message = "Invalid or expired refresh token" });
+                }
+
+                return Ok(CreateTokenResponse(result));
+            }
+            catch (Exception ex)
+            {
+                return StatusCode(500, new { message = "Internal server error", error = ex.Message });
+            }
+        }
+
+        [HttpPost("logout")]
+        public async Task<IActionResult> Logout([FromBody] RefreshTokenDto refreshTokenDto)
+        {
+            try
+            {
+                await _authService.LogoutAsync(refreshTokenDto.RefreshToken);
+                return NoContent();
             }
             catch (Exception ex)
             {
@@ -85,5 +104,25 @@ namespace BeautyCenterApi.Controllers
                 return StatusCode(500, new { message = "Internal server error", error = ex.Message });
             }
         }
+
+        private static object CreateTokenResponse(AuthResult result)
+        {
+            return new
+            {
+                token = result.Token,
+                expiresAt = result.ExpiresAt,
+                refreshToken = result.RefreshToken,
+                refreshTokenExpiresAt = result.RefreshTokenExpiresAt,
+                user = new
+                {
+                    id = result.User.Id,
+                    username = result.User.Username,
+                    email = result.User.Email,
+                    firstName = result.User.FirstName,
+                    lastName = result.User.LastName,
+                    role = result.User.Role
+                }
+            };
+        }
     }
 }
\ No newline at end of file
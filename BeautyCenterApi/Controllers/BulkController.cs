@@ -0,0 +1,142 @@
+using Microsoft.AspNetCore.Mvc;
+using Microsoft.AspNetCore.Authorization;
+using BeautyCenterApi.DTOs;
+using BeautyCenterApi.Services;
+
+namespace BeautyCenterApi.Controllers
+{
+    [ApiController]
+    [Route("api/[controller]")]
+    [Authorize(Roles = "SuperAdmin,TenantAdmin")]
+    public class BulkController : ControllerBase
+    {
+        private readonly BulkImportService _importService;
+        private readonly BulkExportService _exportService;
+        private readonly ITenantService _tenantService;
+
+        public BulkController(BulkImportService importService, BulkExportService exportService, ITenantService tenantService)
+        {
+            _importService = importService;
+            _exportService = exportService;
+            _tenantService = tenantService;
+        }
+
+        [HttpPost("customers/import")]
+        [DisableRequestSizeLimit]
+        public Task<ActionResult<BulkImportResultDto>> ImportCustomers([FromQuery] int? tenantId, [FromQuery] string? format, [FromQuery] int batchSize = BulkImportService.DefaultBatchSize)
+        {
+            return ImportAsync(tenantId, format, (records, targetTenantId) =>
+                _importService.ImportCustomersAsync(records, targetTenantId, batchSize, HttpContext.RequestAborted));
+        }
+
+        [HttpPost("appointments/import")]
+        [DisableRequestSizeLimit]
+        public Task<ActionResult<BulkImportResultDto>> ImportAppointments([FromQuery] int? tenantId, [FromQuery] string? format, [FromQuery] int batchSize = BulkImportService.DefaultBatchSize)
+        {
+            return ImportAsync(tenantId, format, (records, targetTenantId) =>
+                _importService.ImportAppointmentsAsync(records, targetTenantId, batchSize, HttpContext.RequestAborted));
+        }
+
+        [HttpPost("payments/import")]
+        [DisableRequestSizeLimit]
+        public Task<ActionResult<BulkImportResultDto>> ImportPayments([FromQuery] int? tenantId, [FromQuery] string? format, [FromQuery] int batchSize = BulkImportService.DefaultBatchSize)
+        {
+            return ImportAsync(tenantId, format, (records, targetTenantId) =>
+                _importService.ImportPaymentsAsync(records, targetTenantId, batchSize, HttpContext.RequestAborted));
+        }
+
+        [HttpGet("customers/export")]
+        public Task<ActionResult> ExportCustomers([FromQuery] int? tenantId, [FromQuery] string? format = "csv")
+        {
+            return ExportAsync(tenantId, format, "customers", (output, targetTenantId, bulkFormat) =>
+                _exportService.ExportCustomersAsync(output, targetTenantId, bulkFormat, HttpContext.RequestAborted));
+        }
+
+        [HttpGet("appointments/export")]
+        public Task<ActionResult> ExportAppointments([FromQuery] int? tenantId, [FromQuery] string? format = "csv")
+        {
+            return ExportAsync(tenantId, format, "appointments", (output, targetTenantId, bulkFormat) =>
+                _exportService.ExportAppointmentsAsync(output, targetTenantId, bulkFormat, HttpContext.RequestAborted));
+        }
+
+        [HttpGet("payments/export")]
+        public Task<ActionResult> ExportPayments([FromQuery] int? tenantId, [FromQuery] string? format = "csv")
+        {
+            return ExportAsync(tenantId, format, "payments", (output, targetTenantId, bulkFormat) =>
+                _exportService.ExportPaymentsAsync(output, targetTenantId, bulkFormat, HttpContext.RequestAborted));
+        }
+
+        private async Task<ActionResult<BulkImportResultDto>> ImportAsync(int? tenantId, string? format,
+            Func<IAsyncEnumerable<BulkRecord>, int, Task<BulkImportResultDto>> import)
+        {
+            try
+            {
+                var targetTenantId = _tenantService.IsSuperAdmin() ? tenantId : _tenantService.GetCurrentTenantId();
+                if (!targetTenantId.HasValue)
+                {
+                    return BadRequest(new { message = "Tenant is required" });
+                }
+
+                if (!_tenantService.HasTenantAccess(targetTenantId.Value))
+                {
+                    return Forbid();
+                }
+
+                // Biçim sorgu parametresinden, yoksa Content-Type başlığından belirlenir
+                var bulkFormat = BulkRecordReader.ResolveFormat(format, Request.ContentType);
+                if (!bulkFormat.HasValue)
+                {
+                    return BadRequest(new { message = "Unsupported format. Use csv or ndjson" });
+                }
+
+                var records = BulkRecordReader.ReadAsync(Request.Body, bulkFormat.Value, HttpContext.RequestAborted);
+                var result = await import(records, targetTenantId.Value);
+                return Ok(result);
+            }
+            catch (InvalidDataException ex)
+            {
+                return BadRequest(new { message = ex.Message });
+            }
+            catch (Exception ex)
+            {
+                return StatusCode(500, new { message = "Internal server error", error = ex.Message });
+            }
+        }
+
+        private async Task<ActionResult> ExportAsync(int? tenantId, string? format, string entity,
+            Func<Stream, int, BulkFormat, Task> export)
+        {
+            try
+            {
+                var targetTenantId = _tenantService.IsSuperAdmin() ? tenantId : _tenantService.GetCurrentTenantId();
+                if (!targetTenantId.HasValue)
+                {
+                    return BadRequest(new { message = "Tenant is required" });
+                }
+
+                if (!_tenantService.HasTenantAccess(targetTenantId.Value))
+                {
+                    return Forbid();
+                }
+
+                var bulkFormat = BulkRecordReader.ResolveFormat(format, null);
+                if (!bulkFormat.HasValue)
+                {
+                    return BadRequest(new { message = "Unsupported format. Use csv or ndjson" });
+                }
+
+                var extension = bulkFormat == BulkFormat.Csv ? "csv" : "ndjson";
+                Response.ContentType = bulkFormat == BulkFormat.Csv ? "text/csv; charset=utf-8" : "application/x-ndjson";
+                Response.Headers.ContentDisposition = $"attachment; filename=\"{entity}-{targetTenantId.Value}-{DateTime.UtcNow:yyyyMMddHHmmss}.{extension}\"";
+
+                // Satırlar sorgudan doğrudan yanıt gövdesine yazılır
+                await export(Response.Body, targetTenantId.Value, bulkFormat.Value);
+                return new EmptyResult();
+            }
+            catch (Exception ex) when (!Response.HasStarted)
+            {
+                return StatusCode(500, new { message = "Internal server error", error = ex.Message });
+            }
+        }
+    }
+}
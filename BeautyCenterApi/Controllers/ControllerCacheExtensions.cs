@@ -0,0 +1,25 @@
+using Microsoft.AspNetCore.Mvc;
+using Microsoft.Net.Http.Headers;
+using BeautyCenterApi.Services;
+
+namespace BeautyCenterApi.Controllers
+{
+    public static class ControllerCacheExtensions
+    {
+        // İstemci elindeki ETag'i gönderirse gövde yerine 304 döner; istemci her istekte yeniden doğrulamalıdır
+        public static ActionResult CachedOk<T>(this ControllerBase controller, CachedValue<T> cached)
+        {
+            var response = controller.Response;
+            response.Headers[HeaderNames.ETag] = cached.ETag;
+            response.Headers[HeaderNames.CacheControl] = "private, no-cache";
+
+            var ifNoneMatch = controller.Request.GetTypedHeaders().IfNoneMatch;
+            if (ifNoneMatch != null && ifNoneMatch.Any(tag => tag.Tag == "*" || tag.Tag == cached.ETag))
+            {
+                return controller.StatusCode(StatusCodes.Status304NotModified);
+            }
+
+            return controller.Ok(cached.Value);
+        }
+    }
+}
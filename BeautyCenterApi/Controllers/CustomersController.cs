@@ -4,6 +4,7 @@ using AutoMapper;
 using BeautyCenterApi.Interfaces;
 using BeautyCenterApi.DTOs;
 using BeautyCenterApi.Models;
+using BeautyCenterApi.Services;
 
 namespace BeautyCenterApi.Controllers
 {
@@ -15,12 +16,17 @@ namespace BeautyCenterApi.Controllers
         private readonly ICustomerRepository _customerRepository;
         private readonly IPaymentRepository _paymentRepository;
         private readonly IMapper _mapper;
+        private readonly ReferenceDataCache _cache;
+        private readonly ITenantService _tenantService;
 
-        public CustomersController(ICustomerRepository customerRepository, IPaymentRepository paymentRepository, IMapper mapper)
+        public CustomersController(ICustomerRepository customerRepository, IPaymentRepository paymentRepository, IMapper mapper,
+            ReferenceDataCache cache, ITenantService tenantService)
         {
             _customerRepository = customerRepository;
             _paymentRepository = paymentRepository;
             _mapper = mapper;
+            _cache = cache;
+            _tenantService = tenantService;
         }
 
         [HttpGet]
@@ -43,9 +49,10 @@ namespace BeautyCenterApi.Controllers
         {
             try
             {
-                var customers = await _customerRepository.GetActiveCustomersAsync();
-                var customerDtos = _mapper.Map<IEnumerable<CustomerDto>>(customers);
-                return Ok(customerDtos);
+                // Randevu formlarındaki müşteri listesi; bakiye içermediği için ödemelerden etkilenmez
+                var cached = await _cache.GetOrCreateAsync(ReferenceDataCache.Customers, _tenantService.GetCurrentTenantId(), "active",
+                    async () => _mapper.Map<List<CustomerDto>>(await _customerRepository.GetActiveCustomersAsync()));
+                return this.CachedOk(cached);
             }
             catch (Exception ex)
             {
@@ -123,6 +130,27 @@ namespace BeautyCenterApi.Controllers
             }
         }
 
+        // Yazarken öneri listesi: en iyi N eşleşme (ad/soyad öneki, telefon veya e-posta)
+        [HttpGet("typeahead")]
+        public async Task<ActionResult<IEnumerable<CustomerDto>>> TypeaheadCustomers([FromQuery] string? q, [FromQuery] int limit = 10, [FromQuery] bool activeOnly = false)
+        {
+            try
+            {
+                if (string.IsNullOrWhiteSpace(q) || q.Trim().Length < 2)
+                {
+                    return Ok(new List<CustomerDto>());
+                }
+
+                var customers = await _customerRepository.TypeaheadAsync(q, Math.Clamp(limit, 1, 50), activeOnly);
+                var customerDtos = _mapper.Map<IEnumerable<CustomerDto>>(customers);
+                return Ok(customerDtos);
+            }
+            catch (Exception ex)
+            {
+                return StatusCode(500, new { message = "Internal server error", error = ex.Message });
+            }
+        }
+
         [HttpPost]
         public async Task<ActionResult<CustomerDto>> CreateCustomer([FromBody] CustomerDto customerDto)
         {
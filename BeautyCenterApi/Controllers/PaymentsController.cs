@@ -17,6 +17,7 @@ namespace BeautyCenterApi.Controllers
     {
         private readonly IPaymentRepository _paymentRepository;
         private readonly IAppointmentRepository _appointmentRepository;
+        private readonly IReportRepository _reportRepository;
         private readonly BeautyCenterDbContext _context;
         private readonly IMapper _mapper;
         private readonly ITenantService _tenantService;
@@ -24,12 +25,14 @@ namespace BeautyCenterApi.Controllers
         public PaymentsController(
             IPaymentRepository paymentRepository,
             IAppointmentRepository appointmentRepository,
+            IReportRepository reportRepository,
             BeautyCenterDbContext context,
             IMapper mapper,
             ITenantService tenantService)
         {
             _paymentRepository = paymentRepository;
             _appointmentRepository = appointmentRepository;
+            _reportRepository = reportRepository;
             _context = context;
             _mapper = mapper;
             _tenantService = tenantService;
@@ -43,9 +46,8 @@ namespace BeautyCenterApi.Controllers
                 // Ödemesi tamamlanmamış randevuları getir
                 var tenantId = _tenantService.GetCurrentTenantId();
                 var pendingAppointments = await _context.Appointments
-                    .Include(a => a.Customer)
-                    .Include(a => a.ServiceType)
-                    .Where(a => a.TenantId == tenantId && a.Status != "Cancelled" && a.Status != "Completed")
+                    .Where(a => a.TenantId == tenantId && a.RemainingAmount > 0 && a.Status != "Cancelled" && a.Status != "Completed")
+                    .OrderBy(a => a.AppointmentDate)
                     .Select(a => new
                     {
                         a.Id,
@@ -56,15 +58,9 @@ namespace BeautyCenterApi.Controllers
                         a.ServiceType.Price,
                         a.FinalPrice,
                         a.AppointmentDate,
-                        PaidAmount = _context.Payments
-                            .Where(p => p.AppointmentId == a.Id && p.TenantId == tenantId)
-                            .Sum(p => (decimal?)p.PaidAmount) ?? 0,
-                        RemainingAmount = a.FinalPrice - (_context.Payments
-                            .Where(p => p.AppointmentId == a.Id && p.TenantId == tenantId)
-                            .Sum(p => (decimal?)p.PaidAmount) ?? 0)
+                        a.PaidAmount,
+                        a.RemainingAmount
                     })
-                    .Where(a => a.RemainingAmount > 0)
-                    .OrderBy(a => a.AppointmentDate)
                     .ToListAsync();
 
                 return Ok(pendingAppointments);
@@ -75,6 +71,25 @@ namespace BeautyCenterApi.Controllers
             }
         }
 
+        [HttpGet("paged")]
+        public async Task<ActionResult<PagedResultDto<PaymentDto>>> GetPaymentsPaged([FromQuery] PaymentQueryDto query)
+        {
+            try
+            {
+                if (!KeysetCursor.IsValid(query.Cursor))
+                {
+                    return BadRequest(new { message = "Invalid cursor" });
+                }
+
+                var page = await _paymentRepository.GetPagedAsync(query);
+                return Ok(page);
+            }
+            catch (Exception ex)
+            {
+                return StatusCode(500, new { message = "Internal server error", error = ex.Message });
+            }
+        }
+
         [HttpGet("summary")]
         public async Task<ActionResult<PaymentSummaryDto>> GetPaymentSummary()
         {
@@ -83,28 +98,21 @@ namespace BeautyCenterApi.Controllers
                 var summary = new PaymentSummaryDto();
                 var tenantId = _tenantService.GetCurrentTenantId();
 
-                // Tüm ödemeleri getir
-                var allPayments = await _context.Payments
-                    .Where(p => p.TenantId == tenantId)
-                    .Include(p => p.Customer)
-                    .Include(p => p.Appointment)
-                        .ThenInclude(a => a.ServiceType)
-                    .Include(p => p.Installments)
-                    .ToListAsync();
+                // Toplamlar günlük özet tablolarından okunur
+                var totals = await _reportRepository.GetPeriodSummaryAsync(null, null);
+
+                summary.TotalPayments = totals.PaymentCount;
+                summary.TotalRevenue = totals.TotalBilled;
+                summary.TotalPaid = totals.TotalRevenue;
+                summary.TotalRemaining = totals.TotalRemaining;
+                summary.CompletedPayments = totals.PaymentStatusStats.Where(s => s.Status == "Completed").Sum(s => s.Count);
+                summary.PartialPayments = totals.PaymentStatusStats.Where(s => s.Status == "Partial").Sum(s => s.Count);
+                summary.PendingPayments = totals.PaymentStatusStats.Where(s => s.Status == "Pending").Sum(s => s.Count);
 
-                summary.TotalPayments = allPayments.Count;
-                summary.TotalRevenue = allPayments.Sum(p => p.TotalAmount);
-                summary.TotalPaid = allPayments.Sum(p => p.PaidAmount);
-                summary.TotalRemaining = allPayments.Sum(p => p.RemainingAmount);
-                summary.CompletedPayments = allPayments.Count(p => p.PaymentStatus == "Completed");
-                summary.PartialPayments = allPayments.Count(p => p.PaymentStatus == "Partial");
-                summary.PendingPayments = allPayments.Count(p => p.PaymentStatus == "Pending");
-                
                 // Son 10 ödeme
-                summary.RecentPayments = _mapper.Map<List<PaymentDto>>(
-                    allPayments.OrderByDescending(p => p.PaymentDate).Take(10)
-                );
-                
+                var recentPayments = await _paymentRepository.GetPagedAsync(new PaymentQueryDto { PageSize = 10 });
+                summary.RecentPayments = recentPayments.Items;
+
                 // Yaklaşan taksitler
                 var upcomingInstallments = await _context.PaymentInstallments
                     .Include(pi => pi.Payment)
@@ -432,6 +440,28 @@ namespace BeautyCenterApi.Controllers
             }
         }
 
+        [HttpPost("reconcile-balances")]
+        [Authorize(Roles = "SuperAdmin,TenantAdmin")]
+        public async Task<ActionResult<BalanceReconciliationResult>> ReconcileBalances()
+        {
+            try
+            {
+                // SuperAdmin tüm tenant'ları, TenantAdmin yalnızca kendi tenant'ını düzeltir
+                var tenantId = _tenantService.IsSuperAdmin() ? null : _tenantService.GetCurrentTenantId();
+                if (!_tenantService.IsSuperAdmin() && !tenantId.HasValue)
+                {
+                    return BadRequest(new { message = "Tenant is required" });
+                }
+
+                var result = await BalanceBuilder.ReconcileAsync(_context, tenantId);
+                return Ok(result);
+            }
+            catch (Exception ex)
+            {
+                return StatusCode(500, new { message = "Internal server error", error = ex.Message });
+            }
+        }
+
         [HttpDelete("{id}")]
         public async Task<IActionResult> DeletePayment(int id)
         {
@@ -0,0 +1,82 @@
+using Microsoft.AspNetCore.Mvc;
+using Microsoft.AspNetCore.Authorization;
+using BeautyCenterApi.Interfaces;
+using BeautyCenterApi.DTOs;
+using BeautyCenterApi.Services;
+
+namespace BeautyCenterApi.Controllers
+{
+    [ApiController]
+    [Route("api/[controller]")]
+    [Authorize]
+    public class ReportsController : ControllerBase
+    {
+        private readonly IReportRepository _reportRepository;
+        private readonly ITenantService _tenantService;
+
+        public ReportsController(IReportRepository reportRepository, ITenantService tenantService)
+        {
+            _reportRepository = reportRepository;
+            _tenantService = tenantService;
+        }
+
+        [HttpGet("dashboard")]
+        public async Task<ActionResult<ReportDashboardDto>> GetDashboard(
+            [FromQuery] DateTime startDate,
+            [FromQuery] DateTime endDate,
+            [FromQuery] DateTime? previousStartDate,
+            [FromQuery] DateTime? previousEndDate)
+        {
+            try
+            {
+                if (endDate <= startDate)
+                {
+                    return BadRequest(new { message = "End date must be after start date" });
+                }
+
+                var dashboard = new ReportDashboardDto
+                {
+                    Current = await _reportRepository.GetPeriodSummaryAsync(startDate, endDate),
+                    ActiveCustomers = await _reportRepository.GetActiveCustomerCountAsync()
+                };
+
+                if (previousStartDate.HasValue && previousEndDate.HasValue)
+                {
+                    dashboard.Previous = await _reportRepository.GetPeriodSummaryAsync(previousStartDate, previousEndDate);
+                }
+
+                return Ok(dashboard);
+            }
+            catch (Exception ex)
+            {
+                return StatusCode(500, new { message = "Internal server error", error = ex.Message });
+            }
+        }
+
+        [HttpPost("rebuild")]
+        [Authorize(Roles = "SuperAdmin,TenantAdmin")]
+        public async Task<ActionResult> RebuildRollups([FromQuery] int? tenantId)
+        {
+            try
+            {
+                var targetTenantId = _tenantService.IsSuperAdmin() ? tenantId : _tenantService.GetCurrentTenantId();
+                if (!targetTenantId.HasValue)
+                {
+                    return BadRequest(new { message = "Tenant is required" });
+                }
+
+                if (!_tenantService.HasTenantAccess(targetTenantId.Value))
+                {
+                    return Forbid();
+                }
+
+                await _reportRepository.RebuildAsync(targetTenantId.Value);
+                return Ok(new { message = "Report rollups rebuilt successfully" });
+            }
+            catch (Exception ex)
+            {
+                return StatusCode(500, new { message = "Internal server error", error = ex.Message });
+            }
+        }
+    }
+}
@@ -4,6 +4,7 @@ using AutoMapper;
 using BeautyCenterApi.Interfaces;
 using BeautyCenterApi.DTOs;
 using BeautyCenterApi.Models;
+using BeautyCenterApi.Services;
 
 namespace BeautyCenterApi.Controllers
 {
@@ -14,11 +15,15 @@ namespace BeautyCenterApi.Controllers
     {
         private readonly IServiceTypeRepository _serviceTypeRepository;
         private readonly IMapper _mapper;
+        private readonly ReferenceDataCache _cache;
+        private readonly ITenantService _tenantService;
 
-        public ServiceTypesController(IServiceTypeRepository serviceTypeRepository, IMapper mapper)
+        public ServiceTypesController(IServiceTypeRepository serviceTypeRepository, IMapper mapper, ReferenceDataCache cache, ITenantService tenantService)
         {
             _serviceTypeRepository = serviceTypeRepository;
             _mapper = mapper;
+            _cache = cache;
+            _tenantService = tenantService;
         }
 
         [HttpGet]
@@ -26,9 +31,9 @@ namespace BeautyCenterApi.Controllers
         {
             try
             {
-                var serviceTypes = await _serviceTypeRepository.GetAllAsync();
-                var serviceTypeDtos = _mapper.Map<IEnumerable<ServiceTypeDto>>(serviceTypes);
-                return Ok(serviceTypeDtos);
+                var cached = await _cache.GetOrCreateAsync(ReferenceDataCache.ServiceTypes, _tenantService.GetCurrentTenantId(), "all",
+                    async () => _mapper.Map<List<ServiceTypeDto>>(await _serviceTypeRepository.GetAllAsync()));
+                return this.CachedOk(cached);
             }
             catch (Exception ex)
             {
@@ -41,9 +46,9 @@ namespace BeautyCenterApi.Controllers
         {
             try
             {
-                var serviceTypes = await _serviceTypeRepository.GetActiveServicesAsync();
-                var serviceTypeDtos = _mapper.Map<IEnumerable<ServiceTypeDto>>(serviceTypes);
-                return Ok(serviceTypeDtos);
+                var cached = await _cache.GetOrCreateAsync(ReferenceDataCache.ServiceTypes, _tenantService.GetCurrentTenantId(), "active",
+                    async () => _mapper.Map<List<ServiceTypeDto>>(await _serviceTypeRepository.GetActiveServicesAsync()));
+                return this.CachedOk(cached);
             }
             catch (Exception ex)
             {
@@ -56,14 +61,18 @@ namespace BeautyCenterApi.Controllers
         {
             try
             {
-                var serviceType = await _serviceTypeRepository.GetByIdAsync(id);
-                if (serviceType == null)
+                var cached = await _cache.GetOrCreateAsync(ReferenceDataCache.ServiceTypes, _tenantService.GetCurrentTenantId(), $"id:{id}",
+                    async () =>
+                    {
+                        var serviceType = await _serviceTypeRepository.GetByIdAsync(id);
+                        return serviceType == null ? null : _mapper.Map<ServiceTypeDto>(serviceType);
+                    });
+                if (cached.Value == null)
                 {
                     return NotFound(new { message = "Service type not found" });
                 }
 
-                var serviceTypeDto = _mapper.Map<ServiceTypeDto>(serviceType);
-                return Ok(serviceTypeDto);
+                return this.CachedOk(cached);
             }
             catch (Exception ex)
             {
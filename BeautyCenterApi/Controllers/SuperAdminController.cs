@@ -5,7 +5,6 @@ using BeautyCenterApi.Repositories;
 using BeautyCenterApi.Interfaces;
 using BeautyCenterApi.Services;
 using BeautyCenterApi.DTOs;
-using BCrypt.Net;
 
 namespace BeautyCenterApi.Controllers
 {
@@ -17,15 +16,21 @@ namespace BeautyCenterApi.Controllers
         private readonly ITenantRepository _tenantRepository;
         private readonly IUserRepository _userRepository;
         private readonly ITenantService _tenantService;
+        private readonly ReferenceDataCache _referenceDataCache;
+        private readonly PasswordHasher _passwordHasher;
 
         public SuperAdminController(
             ITenantRepository tenantRepository,
             IUserRepository userRepository,
-            ITenantService tenantService)
+            ITenantService tenantService,
+            ReferenceDataCache referenceDataCache,
+            PasswordHasher passwordHasher)
         {
             _tenantRepository = tenantRepository;
             _userRepository = userRepository;
             _tenantService = tenantService;
+            _referenceDataCache = referenceDataCache;
+            _passwordHasher = passwordHasher;
         }
 
         // Tenant yönetimi
@@ -271,7 +276,7 @@ namespace BeautyCenterApi.Controllers
                 Phone = createUserDto.Phone,
                 Role = createUserDto.Role,
                 TenantId = createUserDto.Role == "SuperAdmin" ? null : createUserDto.TenantId,
-                PasswordHash = BCrypt.Net.BCrypt.HashPassword(createUserDto.Password),
+                PasswordHash = await _passwordHasher.HashAsync(createUserDto.Password),
                 IsActive = true,
                 CreatedAt = DateTime.UtcNow
             };
@@ -334,7 +339,7 @@ namespace BeautyCenterApi.Controllers
             // Şifre değiştiriliyorsa
             if (!string.IsNullOrEmpty(updateUserDto.Password))
             {
-                user.PasswordHash = BCrypt.Net.BCrypt.HashPassword(updateUserDto.Password);
+                user.PasswordHash = await _passwordHasher.HashAsync(updateUserDto.Password);
             }
 
             await _userRepository.UpdateAsync(user);
@@ -390,5 +395,12 @@ namespace BeautyCenterApi.Controllers
 
             return Ok(dashboard);
         }
+
+        // Referans veri önbelleğinin isabet/ıskalama sayaçları (izleme için)
+        [HttpGet("cache-stats")]
+        public ActionResult<CacheStatisticsDto> GetCacheStatistics()
+        {
+            return Ok(_referenceDataCache.GetStatistics());
+        }
     }
 }
\ No newline at end of file
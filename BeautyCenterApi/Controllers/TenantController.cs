@@ -0,0 +1,80 @@
+using Microsoft.AspNetCore.Mvc;
+using Microsoft.AspNetCore.Authorization;
+using BeautyCenterApi.DTOs;
+using BeautyCenterApi.Repositories;
+using BeautyCenterApi.Services;
+
+namespace BeautyCenterApi.Controllers
+{
+    [ApiController]
+    [Route("api/[controller]")]
+    [Authorize]
+    public class TenantController : ControllerBase
+    {
+        private readonly ITenantRepository _tenantRepository;
+        private readonly ITenantService _tenantService;
+        private readonly ReferenceDataCache _cache;
+
+        public TenantController(ITenantRepository tenantRepository, ITenantService tenantService, ReferenceDataCache cache)
+        {
+            _tenantRepository = tenantRepository;
+            _tenantService = tenantService;
+            _cache = cache;
+        }
+
+        // Oturumdaki kullanıcının tenant bilgisi (başlık, iletişim bilgileri vb.)
+        [HttpGet("current")]
+        public async Task<ActionResult<TenantDto>> GetCurrentTenant()
+        {
+            try
+            {
+                var tenantId = _tenantService.GetCurrentTenantId();
+                if (!tenantId.HasValue)
+                {
+                    return NotFound(new { message = "Tenant not found" });
+                }
+
+                var cached = await _cache.GetOrCreateAsync(ReferenceDataCache.Tenants, tenantId, "info", async () =>
+                {
+                    var tenant = await _tenantRepository.GetTenantInfoAsync(tenantId.Value);
+                    if (tenant == null)
+                        return null;
+
+                    return new TenantDto
+                    {
+                        Id = tenant.Id,
+                        Name = tenant.Name,
+                        SubDomain = tenant.SubDomain,
+                        Description = tenant.Description,
+                        Address = tenant.Address,
+                        Phone = tenant.Phone,
+                        Email = tenant.Email,
+                        Website = tenant.Website,
+                        City = tenant.City,
+                        Country = tenant.Country,
+                        PostalCode = tenant.PostalCode,
+                        IsActive = tenant.IsActive,
+                        SubscriptionPlan = tenant.SubscriptionPlan,
+                        SubscriptionStartDate = tenant.SubscriptionStartDate,
+                        SubscriptionEndDate = tenant.SubscriptionEndDate,
+                        MaxUsers = tenant.MaxUsers,
+                        MaxCustomers = tenant.MaxCustomers,
+                        CreatedAt = tenant.CreatedAt,
+                        UpdatedAt = tenant.UpdatedAt
+                    };
+                });
+
+                if (cached.Value == null)
+                {
+                    return NotFound(new { message = "Tenant not found" });
+                }
+
+                return this.CachedOk(cached);
+            }
+            catch (Exception ex)
+            {
+                return StatusCode(500, new { message = "Internal server error", error = ex.Message });
+            }
+        }
+    }
+}
@@ -100,4 +100,20 @@ namespace BeautyCenterApi.DTOs
         [StringLength(1000)]
         public string? Notes { get; set; }
     }
+
+    public class AppointmentQueryDto : PageQueryDto
+    {
+        [StringLength(50)]
+        public string? Status { get; set; }
+
+        // [StartDate, EndDate) aralığı
+        public DateTime? StartDate { get; set; }
+
+        public DateTime? EndDate { get; set; }
+
+        [StringLength(100)]
+        public string? Search { get; set; }
+
+        public int? CustomerId { get; set; }
+    }
 }
\ No newline at end of file
@@ -0,0 +1,23 @@
+namespace BeautyCenterApi.DTOs
+{
+    public class StaffAvailabilityDto
+    {
+        public int UserId { get; set; }
+        public string UserName { get; set; } = string.Empty;
+        public List<AvailableSlotDto> Slots { get; set; } = new();
+    }
+
+    public class AvailableSlotDto
+    {
+        public DateTime Start { get; set; }
+        public DateTime End { get; set; }
+    }
+
+    public class AppointmentConflictDto
+    {
+        public int AppointmentId { get; set; }
+        public int UserId { get; set; }
+        public DateTime Start { get; set; }
+        public DateTime End { get; set; }
+    }
+}
@@ -0,0 +1,29 @@
+namespace BeautyCenterApi.DTOs
+{
+    public class BulkImportResultDto
+    {
+        public string Entity { get; set; } = string.Empty;
+        public int TotalRows { get; set; }
+        public int ImportedRows { get; set; }
+        public int FailedRows { get; set; }
+        public List<BulkImportErrorDto> Errors { get; set; } = new();
+        public bool ErrorsTruncated { get; set; } // Hata listesi üst sınıra ulaştığında kalan hatalar yalnızca sayılır
+    }
+
+    public class BulkImportErrorDto
+    {
+        public int RowNumber { get; set; }
+        public string Message { get; set; } = string.Empty;
+    }
+
+    // Ödeme satırlarındaki "Installments" alanı (NDJSON'da dizi, CSV'de JSON metni)
+    public class BulkInstallmentDto
+    {
+        public decimal Amount { get; set; }
+        public DateTime DueDate { get; set; }
+        public DateTime? PaidDate { get; set; }
+        public bool IsPaid { get; set; }
+        public string? PaymentMethod { get; set; }
+        public string? Notes { get; set; }
+    }
+}
@@ -0,0 +1,22 @@
+namespace BeautyCenterApi.DTOs
+{
+    public class CacheStatisticsDto
+    {
+        public long Hits { get; set; }
+        public long Misses { get; set; }
+        public double HitRatio { get; set; }
+        public long EntryCount { get; set; }
+        public long EstimatedSize { get; set; }
+        public long SizeLimit { get; set; }
+        public List<CacheCategoryStatisticsDto> Categories { get; set; } = new();
+    }
+
+    public class CacheCategoryStatisticsDto
+    {
+        public string Category { get; set; } = string.Empty;
+        public long Hits { get; set; }
+        public long Misses { get; set; }
+        public long Invalidations { get; set; }
+        public long Evictions { get; set; }
+    }
+}
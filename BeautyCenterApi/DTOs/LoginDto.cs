@@ -10,4 +10,10 @@ namespace BeautyCenterApi.DTOs
         [Required]
         public string Password { get; set; } = string.Empty;
     }
+
+    public class RefreshTokenDto
+    {
+        [Required]
+        public string RefreshToken { get; set; } = string.Empty;
+    }
 }
\ No newline at end of file
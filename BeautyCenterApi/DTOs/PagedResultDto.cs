@@ -0,0 +1,92 @@
+using System.Globalization;
+using System.Text;
+using Microsoft.AspNetCore.WebUtilities;
+
+namespace BeautyCenterApi.DTOs
+{
+    public class PagedResultDto<T>
+    {
+        public List<T> Items { get; set; } = new();
+        public int PageSize { get; set; }
+        public bool HasMore { get; set; }
+        public string? NextCursor { get; set; }
+
+        // Sorgu pageSize + 1 satır getirir; fazladan gelen satır bir sonraki sayfanın varlığını gösterir
+        public static PagedResultDto<T> Create(List<T> rows, int pageSize, Func<T, string> cursorSelector)
+        {
+            var hasMore = rows.Count > pageSize;
+            if (hasMore)
+            {
+                rows.RemoveRange(pageSize, rows.Count - pageSize);
+            }
+
+            return new PagedResultDto<T>
+            {
+                Items = rows,
+                PageSize = pageSize,
+                HasMore = hasMore,
+                NextCursor = hasMore && rows.Count > 0 ? cursorSelector(rows[^1]) : null
+            };
+        }
+    }
+
+    public class PageQueryDto
+    {
+        public const int DefaultPageSize = 50;
+        public const int MaxPageSize = 200;
+
+        // Bir önceki sayfanın NextCursor değeri; ilk sayfa için boş bırakılır
+        public string? Cursor { get; set; }
+
+        public int PageSize { get; set; } = DefaultPageSize;
+
+        public bool Descending { get; set; } = true;
+
+        public int GetEffectivePageSize() => Math.Clamp(PageSize, 1, MaxPageSize);
+    }
+
+    // (tarih, id) çiftini istemciye opak bir token olarak taşır
+    public static class KeysetCursor
+    {
+        public static string Encode(DateTime date, int id)
+        {
+            var raw = $"{date.Ticks.ToString(CultureInfo.InvariantCulture)}:{id.ToString(CultureInfo.InvariantCulture)}";
+            return WebEncoders.Base64UrlEncode(Encoding.UTF8.GetBytes(raw));
+        }
+
+        public static bool TryDecode(string? cursor, out DateTime date, out int id)
+        {
+            date = default;
+            id = default;
+
+            if (string.IsNullOrWhiteSpace(cursor))
+                return false;
+
+            try
+            {
+                var raw = Encoding.UTF8.GetString(WebEncoders.Base64UrlDecode(cursor));
+                var parts = raw.Split(':');
+                if (parts.Length != 2 ||
+                    !long.TryParse(parts[0], NumberStyles.None, CultureInfo.InvariantCulture, out var ticks) ||
+                    !int.TryParse(parts[1], NumberStyles.None, CultureInfo.InvariantCulture, out id) ||
+                    ticks < DateTime.MinValue.Ticks || ticks > DateTime.MaxValue.Ticks)
+                {
+                    id = default;
+                    return false;
+                }
+
+                date = new DateTime(ticks);
+                return true;
+            }
+            catch (FormatException)
+            {
+                return false;
+            }
+        }
+
+        public static bool IsValid(string? cursor)
+        {
+            return string.IsNullOrWhiteSpace(cursor) || TryDecode(cursor, out _, out _);
+        }
+    }
+}
@@ -123,4 +123,23 @@ namespace BeautyCenterApi.DTOs
         public List<PaymentDto> RecentPayments { get; set; } = new();
         public List<PaymentInstallmentDto> UpcomingInstallments { get; set; } = new();
     }
+    
+    public class PaymentQueryDto : PageQueryDto
+    {
+        [StringLength(50)]
+        public string? PaymentStatus { get; set; }
+
+        [StringLength(50)]
+        public string? PaymentMethod { get; set; }
+
+        // [StartDate, EndDate) aralığı
+        public DateTime? StartDate { get; set; }
+
+        public DateTime? EndDate { get; set; }
+
+        [StringLength(100)]
+        public string? Search { get; set; }
+
+        public int? CustomerId { get; set; }
+    }
 }
\ No newline at end of file
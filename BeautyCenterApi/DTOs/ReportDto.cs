@@ -0,0 +1,47 @@
+namespace BeautyCenterApi.DTOs
+{
+    public class ReportPeriodDto
+    {
+        public DateTime? StartDate { get; set; }
+        public DateTime? EndDate { get; set; }
+        public decimal TotalRevenue { get; set; } // Tahsil edilen (PaidAmount) toplamı
+        public decimal TotalBilled { get; set; }
+        public decimal TotalRemaining { get; set; }
+        public int PaymentCount { get; set; }
+        public int AppointmentCount { get; set; }
+        public decimal AppointmentRevenue { get; set; } // Randevu FinalPrice toplamı
+        public int NewCustomers { get; set; }
+        public List<ServiceStatDto> ServiceStats { get; set; } = new();
+        public List<PaymentMethodStatDto> PaymentMethodStats { get; set; } = new();
+        public List<StatusCountDto> AppointmentStatusStats { get; set; } = new();
+        public List<StatusCountDto> PaymentStatusStats { get; set; } = new();
+    }
+
+    public class ReportDashboardDto
+    {
+        public ReportPeriodDto Current { get; set; } = new();
+        public ReportPeriodDto? Previous { get; set; }
+        public int ActiveCustomers { get; set; }
+    }
+
+    public class ServiceStatDto
+    {
+        public int ServiceTypeId { get; set; }
+        public string ServiceName { get; set; } = string.Empty;
+        public int AppointmentCount { get; set; }
+        public decimal Revenue { get; set; }
+    }
+
+    public class PaymentMethodStatDto
+    {
+        public string PaymentMethod { get; set; } = string.Empty;
+        public int Count { get; set; }
+        public decimal Amount { get; set; }
+    }
+
+    public class StatusCountDto
+    {
+        public string Status { get; set; } = string.Empty;
+        public int Count { get; set; }
+    }
+}
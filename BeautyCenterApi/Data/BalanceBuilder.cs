@@ -0,0 +1,268 @@
+using BeautyCenterApi.Models;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.EntityFrameworkCore.ChangeTracking;
+
+namespace BeautyCenterApi.Data
+{
+    public class BalanceChangeSet
+    {
+        public HashSet<int> AppointmentIds { get; } = new();
+        public HashSet<int> CustomerIds { get; } = new();
+
+        // Eklenen/güncellenen kayıtların yabancı anahtarları kayıttan sonra okunur (geçici Id'ler gerçek değerini alır)
+        public List<EntityEntry> PendingEntries { get; } = new();
+
+        public bool IsEmpty => AppointmentIds.Count == 0 && CustomerIds.Count == 0 && PendingEntries.Count == 0;
+    }
+
+    public class BalanceReconciliationResult
+    {
+        public int AppointmentsRepaired { get; set; }
+        public int CustomersRepaired { get; set; }
+    }
+
+    // Randevu ve müşteri bakiyelerini (PaidAmount/RemainingAmount, TotalPaid/RemainingBalance) ödemelerle senkron tutar.
+    // Arka plan işinden de çağrıldığı için tenant sorgu filtreleri yok sayılır
+    public static class BalanceBuilder
+    {
+        public static BalanceChangeSet CollectChanges(ChangeTracker changeTracker)
+        {
+            var changes = new BalanceChangeSet();
+
+            foreach (var entry in changeTracker.Entries())
+            {
+                if (entry.State != EntityState.Added && entry.State != EntityState.Modified && entry.State != EntityState.Deleted)
+                    continue;
+
+                switch (entry.Entity)
+                {
+                    case Payment:
+                        AddOriginalId(changes.AppointmentIds, entry, nameof(Payment.AppointmentId));
+                        AddOriginalId(changes.CustomerIds, entry, nameof(Payment.CustomerId));
+                        break;
+
+                    case Appointment:
+                        AddOriginalId(changes.CustomerIds, entry, nameof(Appointment.CustomerId));
+                        break;
+
+                    // Customer güncellemeleri DTO'dan eşlendiğinde bakiye alanlarını ezebilir
+                    case Customer when entry.State == EntityState.Modified:
+                        break;
+
+                    default:
+                        continue;
+                }
+
+                if (entry.State != EntityState.Deleted)
+                    changes.PendingEntries.Add(entry);
+            }
+
+            return changes;
+        }
+
+        // Bakiyesi yeniden hesaplanacak randevu ve müşterileri kilitler. Kayıt yazılmadan önce çağrılmalıdır:
+        // aynı randevuya/müşteriye ödeme yazan iki transaction birbirinin commit edilmemiş ödemesini toplamaya çalışıp kilitlenmesin
+        public static async Task AcquireLocksAsync(BeautyCenterDbContext context, BalanceChangeSet changes, CancellationToken cancellationToken = default)
+        {
+            var appointmentIds = new HashSet<int>(changes.AppointmentIds);
+            var customerIds = new HashSet<int>(changes.CustomerIds);
+
+            // Yeni kayıtların geçici Id'leri başka transaction'larca görülemez; yalnızca var olan satırlar kilitlenir
+            foreach (var entry in changes.PendingEntries)
+            {
+                switch (entry.Entity)
+                {
+                    case Payment:
+                        AddCurrentId(appointmentIds, entry, nameof(Payment.AppointmentId));
+                        AddCurrentId(customerIds, entry, nameof(Payment.CustomerId));
+                        break;
+
+                    case Appointment:
+                        AddCurrentId(appointmentIds, entry, nameof(Appointment.Id));
+                        AddCurrentId(customerIds, entry, nameof(Appointment.CustomerId));
+                        break;
+
+                    case Customer:
+                        AddCurrentId(customerIds, entry, nameof(Customer.Id));
+                        break;
+                }
+            }
+
+            // Kilitler her zaman aynı sırayla ve tek gidiş-dönüşte alınır: önce randevular, sonra müşteriler, her biri Id sırasıyla
+            var resources = appointmentIds.OrderBy(id => id).Select(id => $"balances:appointment:{id}")
+                .Concat(customerIds.OrderBy(id => id).Select(id => $"balances:customer:{id}"))
+                .ToList();
+
+            await SqlAppLock.AcquireManyAsync(context, resources, cancellationToken: cancellationToken);
+        }
+
+        // Etkilenen satırları Payments/Appointments üzerinden tek UPDATE ile yeniden hesaplar; kilitler AcquireLocksAsync ile alınmış olmalıdır
+        public static async Task RefreshAsync(BeautyCenterDbContext context, BalanceChangeSet changes, CancellationToken cancellationToken = default)
+        {
+            foreach (var entry in changes.PendingEntries)
+            {
+                switch (entry.Entity)
+                {
+                    case Payment payment:
+                        changes.AppointmentIds.Add(payment.AppointmentId);
+                        changes.CustomerIds.Add(payment.CustomerId);
+                        break;
+
+                    case Appointment appointment:
+                        changes.AppointmentIds.Add(appointment.Id);
+                        changes.CustomerIds.Add(appointment.CustomerId);
+                        break;
+
+                    case Customer customer:
+                        changes.CustomerIds.Add(customer.Id);
+                        break;
+                }
+            }
+
+            if (changes.AppointmentIds.Count > 0)
+            {
+                var appointmentIds = changes.AppointmentIds.ToList();
+                await RecalculateAppointmentsAsync(context, context.Appointments.IgnoreQueryFilters().Where(a => appointmentIds.Contains(a.Id)), cancellationToken);
+                await SyncTrackedAppointmentsAsync(context, changes.AppointmentIds, cancellationToken);
+            }
+
+            if (changes.CustomerIds.Count > 0)
+            {
+                var customerIds = changes.CustomerIds.ToList();
+                await RecalculateCustomersAsync(context, context.Customers.IgnoreQueryFilters().Where(c => customerIds.Contains(c.Id)), cancellationToken);
+                await SyncTrackedCustomersAsync(context, changes.CustomerIds, cancellationToken);
+            }
+        }
+
+        // Saklanan bakiyesi kaynaktan farklı olan satırları bulur ve düzeltir; tenantId null ise tüm tenant'lar
+        public static async Task<BalanceReconciliationResult> ReconcileAsync(BeautyCenterDbContext context, int? tenantId = null, CancellationToken cancellationToken = default)
+        {
+            var appointments = context.Appointments
+                .IgnoreQueryFilters()
+                .Where(a => a.PaidAmount != (context.Payments.IgnoreQueryFilters().Where(p => p.AppointmentId == a.Id).Sum(p => (decimal?)p.PaidAmount) ?? 0)
+                    || a.RemainingAmount != a.FinalPrice - (context.Payments.IgnoreQueryFilters().Where(p => p.AppointmentId == a.Id).Sum(p => (decimal?)p.PaidAmount) ?? 0));
+
+            var customers = context.Customers
+                .IgnoreQueryFilters()
+                .Where(c => c.TotalPaid != (context.Payments.IgnoreQueryFilters().Where(p => p.CustomerId == c.Id).Sum(p => (decimal?)p.PaidAmount) ?? 0)
+                    || c.RemainingBalance != (context.Appointments.IgnoreQueryFilters().Where(a => a.CustomerId == c.Id).Sum(a => (decimal?)a.FinalPrice) ?? 0)
+                        - (context.Payments.IgnoreQueryFilters().Where(p => p.CustomerId == c.Id).Sum(p => (decimal?)p.PaidAmount) ?? 0));
+
+            if (tenantId.HasValue)
+            {
+                appointments = appointments.Where(a => a.TenantId == tenantId.Value);
+                customers = customers.Where(c => c.TenantId == tenantId.Value);
+            }
+
+            await using var transaction = context.Database.CurrentTransaction == null
+                ? await context.Database.BeginTransactionAsync(cancellationToken)
+                : null;
+
+            var result = new BalanceReconciliationResult
+            {
+                AppointmentsRepaired = await RecalculateAppointmentsAsync(context, appointments, cancellationToken),
+                CustomersRepaired = await RecalculateCustomersAsync(context, customers, cancellationToken)
+            };
+
+            if (transaction != null)
+                await transaction.CommitAsync(cancellationToken);
+
+            return result;
+        }
+
+        private static Task<int> RecalculateAppointmentsAsync(BeautyCenterDbContext context, IQueryable<Appointment> appointments, CancellationToken cancellationToken)
+        {
+            return appointments.ExecuteUpdateAsync(s => s
+                .SetProperty(a => a.PaidAmount,
+                    a => context.Payments.IgnoreQueryFilters().Where(p => p.AppointmentId == a.Id).Sum(p => (decimal?)p.PaidAmount) ?? 0)
+                .SetProperty(a => a.RemainingAmount,
+                    a => a.FinalPrice - (context.Payments.IgnoreQueryFilters().Where(p => p.AppointmentId == a.Id).Sum(p => (decimal?)p.PaidAmount) ?? 0)),
+                cancellationToken);
+        }
+
+        private static Task<int> RecalculateCustomersAsync(BeautyCenterDbContext context, IQueryable<Customer> customers, CancellationToken cancellationToken)
+        {
+            return customers.ExecuteUpdateAsync(s => s
+                .SetProperty(c => c.TotalPaid,
+                    c => context.Payments.IgnoreQueryFilters().Where(p => p.CustomerId == c.Id).Sum(p => (decimal?)p.PaidAmount) ?? 0)
+                .SetProperty(c => c.RemainingBalance,
+                    c => (context.Appointments.IgnoreQueryFilters().Where(a => a.CustomerId == c.Id).Sum(a => (decimal?)a.FinalPrice) ?? 0)
+                        - (context.Payments.IgnoreQueryFilters().Where(p => p.CustomerId == c.Id).Sum(p => (decimal?)p.PaidAmount) ?? 0)),
+                cancellationToken);
+        }
+
+        // Takipteki varlıklar ExecuteUpdate'ten haberdar olmaz; bakiye alanlarını veritabanındaki değerle eşitle
+        private static async Task SyncTrackedAppointmentsAsync(BeautyCenterDbContext context, HashSet<int> appointmentIds, CancellationToken cancellationToken)
+        {
+            var tracked = context.ChangeTracker.Entries<Appointment>()
+                .Where(e => appointmentIds.Contains(e.Entity.Id))
+                .ToList();
+            if (tracked.Count == 0)
+                return;
+
+            var trackedIds = tracked.Select(e => e.Entity.Id).ToList();
+            var balances = await context.Appointments
+                .IgnoreQueryFilters()
+                .AsNoTracking()
+                .Where(a => trackedIds.Contains(a.Id))
+                .Select(a => new { a.Id, a.PaidAmount, a.RemainingAmount })
+                .ToDictionaryAsync(a => a.Id, cancellationToken);
+
+            foreach (var entry in tracked)
+            {
+                if (balances.TryGetValue(entry.Entity.Id, out var balance))
+                {
+                    SetStoreValue(entry, nameof(Appointment.PaidAmount), balance.PaidAmount);
+                    SetStoreValue(entry, nameof(Appointment.RemainingAmount), balance.RemainingAmount);
+                }
+            }
+        }
+
+        private static async Task SyncTrackedCustomersAsync(BeautyCenterDbContext context, HashSet<int> customerIds, CancellationToken cancellationToken)
+        {
+            var tracked = context.ChangeTracker.Entries<Customer>()
+                .Where(e => customerIds.Contains(e.Entity.Id))
+                .ToList();
+            if (tracked.Count == 0)
+                return;
+
+            var trackedIds = tracked.Select(e => e.Entity.Id).ToList();
+            var balances = await context.Customers
+                .IgnoreQueryFilters()
+                .AsNoTracking()
+                .Where(c => trackedIds.Contains(c.Id))
+                .Select(c => new { c.Id, c.TotalPaid, c.RemainingBalance })
+                .ToDictionaryAsync(c => c.Id, cancellationToken);
+
+            foreach (var entry in tracked)
+            {
+                if (balances.TryGetValue(entry.Entity.Id, out var balance))
+                {
+                    SetStoreValue(entry, nameof(Customer.TotalPaid), balance.TotalPaid);
+                    SetStoreValue(entry, nameof(Customer.RemainingBalance), balance.RemainingBalance);
+                }
+            }
+        }
+
+        private static void SetStoreValue(EntityEntry entry, string propertyName, decimal value)
+        {
+            var property = entry.Property(propertyName);
+            property.CurrentValue = value;
+            property.OriginalValue = value;
+            property.IsModified = false;
+        }
+
+        private static void AddCurrentId(HashSet<int> ids, EntityEntry entry, string property)
+        {
+            var propertyEntry = entry.Property(property);
+            if (!propertyEntry.IsTemporary && propertyEntry.CurrentValue is int id && id > 0)
+                ids.Add(id);
+        }
+
+        private static void AddOriginalId(HashSet<int> ids, EntityEntry entry, string property)
+        {
+            if (entry.State != EntityState.Added)
+                ids.Add((int)entry.OriginalValues[property]!);
+        }
+    }
+}
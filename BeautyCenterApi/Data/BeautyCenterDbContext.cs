@@ -1,12 +1,34 @@
+﻿using System.Data.Common;
 using Microsoft.EntityFrameworkCore;
+using Microsoft.EntityFrameworkCore.Diagnostics;
 using BeautyCenterApi.Models;
+using BeautyCenterApi.Services;
 
 namespace BeautyCenterApi.Data
 {
     public class BeautyCenterDbContext : DbContext
     {
-        public BeautyCenterDbContext(DbContextOptions<BeautyCenterDbContext> options) : base(options)
+        private readonly ITenantService? _tenantService;
+        private readonly ReferenceDataCache? _referenceDataCache;
+
+        public BeautyCenterDbContext(DbContextOptions<BeautyCenterDbContext> options, ITenantService? tenantService = null, ReferenceDataCache? referenceDataCache = null) : base(options)
+        {
+            _tenantService = tenantService;
+            _referenceDataCache = referenceDataCache;
+        }
+
+        // Global sorgu filtreleri bu üyeyi her çalıştırmada parametre olarak okur;
+        // böylece tüm tenant'lar aynı derlenmiş sorguyu ve SQL planını paylaşır.
+        // Filtre yalnızca "TenantId = @p" olmalı: "@ignore = 1 OR ..." gibi bir koşul
+        // (TenantId, ...) indekslerinde seek yerine tarama planı üretir. Tenant'sız istek 0 ile hiçbir kaydı görmez.
+        private int CurrentTenantId => _tenantService?.GetCurrentTenantId() ?? 0;
+
+        // Tenant'a ait okumalar için giriş noktası: SuperAdmin tüm tenant'ları görmek için
+        // filtreyi açıkça kaldırır, diğer tüm istekler global filtreyle çalışır
+        public IQueryable<T> TenantScoped<T>() where T : class
         {
+            var set = Set<T>();
+            return _tenantService != null && _tenantService.IsSuperAdmin() ? set.IgnoreQueryFilters() : set;
         }
 
         public DbSet<Tenant> Tenants { get; set; }
@@ -16,6 +38,141 @@ namespace BeautyCenterApi.Data
         public DbSet<Appointment> Appointments { get; set; }
         public DbSet<Payment> Payments { get; set; }
         public DbSet<PaymentInstallment> PaymentInstallments { get; set; }
+        public DbSet<DailyPaymentRollup> DailyPaymentRollups { get; set; }
+        public DbSet<DailyAppointmentRollup> DailyAppointmentRollups { get; set; }
+        public DbSet<RefreshToken> RefreshTokens { get; set; }
+
+        private bool _refreshingDerivedData;
+        private readonly HashSet<(string Category, int? TenantId)> _pendingCacheInvalidations = new();
+
+        // Toplu içe aktarma partileri özetleri ve bakiyeleri kayıt başına yenilemez; içe aktarma sonunda
+        // etkilenen tenant ve tarih aralığı tek seferde yeniden hesaplanır (BulkImportService)
+        public bool DerivedDataRefreshSuspended { get; set; }
+
+        public override async Task<int> SaveChangesAsync(bool acceptAllChangesOnSuccess, CancellationToken cancellationToken = default)
+        {
+            if (_refreshingDerivedData)
+                return await base.SaveChangesAsync(acceptAllChangesOnSuccess, cancellationToken);
+
+            CustomerSearchNormalizer.Apply(ChangeTracker);
+
+            var cacheInvalidations = _referenceDataCache != null
+                ? ReferenceDataCache.CollectInvalidations(ChangeTracker)
+                : null;
+
+            var result = await SaveChangesWithDerivedDataAsync(acceptAllChangesOnSuccess, cancellationToken);
+
+            // Önbellek ancak değişiklik kalıcı olduktan sonra geçersiz kılınır; aksi halde eski veri yeniden önbelleğe girebilir.
+            // Çağıranın açtığı bir transaction sürüyorsa geçersiz kılma commit'e ertelenir (CacheInvalidationInterceptor)
+            if (cacheInvalidations != null && cacheInvalidations.Count > 0)
+            {
+                if (Database.CurrentTransaction != null)
+                    _pendingCacheInvalidations.UnionWith(cacheInvalidations);
+                else
+                    _referenceDataCache!.Invalidate(cacheInvalidations);
+            }
+
+            return result;
+        }
+
+        protected override void OnConfiguring(DbContextOptionsBuilder optionsBuilder)
+        {
+            optionsBuilder.AddInterceptors(CacheInvalidationInterceptor.Instance);
+        }
+
+        private void CompletePendingCacheInvalidations(bool committed)
+        {
+            if (_pendingCacheInvalidations.Count == 0)
+                return;
+
+            if (committed)
+                _referenceDataCache?.Invalidate(_pendingCacheInvalidations);
+
+            _pendingCacheInvalidations.Clear();
+        }
+
+        // Dış transaction commit edildiğinde bekleyen önbellek geçersiz kılmalarını uygular, geri alındığında atar
+        private sealed class CacheInvalidationInterceptor : DbTransactionInterceptor
+        {
+            public static readonly CacheInvalidationInterceptor Instance = new();
+
+            public override void TransactionCommitted(DbTransaction transaction, TransactionEndEventData eventData)
+            {
+                (eventData.Context as BeautyCenterDbContext)?.CompletePendingCacheInvalidations(committed: true);
+            }
+
+            public override Task TransactionCommittedAsync(DbTransaction transaction, TransactionEndEventData eventData, CancellationToken cancellationToken = default)
+            {
+                (eventData.Context as BeautyCenterDbContext)?.CompletePendingCacheInvalidations(committed: true);
+                return Task.CompletedTask;
+            }
+
+            public override void TransactionRolledBack(DbTransaction transaction, TransactionEndEventData eventData)
+            {
+                (eventData.Context as BeautyCenterDbContext)?.CompletePendingCacheInvalidations(committed: false);
+            }
+
+            public override Task TransactionRolledBackAsync(DbTransaction transaction, TransactionEndEventData eventData, CancellationToken cancellationToken = default)
+            {
+                (eventData.Context as BeautyCenterDbContext)?.CompletePendingCacheInvalidations(committed: false);
+                return Task.CompletedTask;
+            }
+        }
+
+        private async Task<int> SaveChangesWithDerivedDataAsync(bool acceptAllChangesOnSuccess, CancellationToken cancellationToken)
+        {
+            if (DerivedDataRefreshSuspended)
+                return await base.SaveChangesAsync(acceptAllChangesOnSuccess, cancellationToken);
+
+            // Rapor özetlerini ve bakiyeleri etkileyen kayıtları kaydetmeden önce topla (orijinal değerler kaybolmadan)
+            var rollupChanges = ReportRollupBuilder.CollectChanges(ChangeTracker);
+            var balanceChanges = BalanceBuilder.CollectChanges(ChangeTracker);
+            if (rollupChanges.IsEmpty && balanceChanges.IsEmpty)
+                return await base.SaveChangesAsync(acceptAllChangesOnSuccess, cancellationToken);
+
+            // Türetilmiş veriler asıl değişiklikle aynı transaction içinde güncellenir
+            var transaction = Database.CurrentTransaction == null
+                ? await Database.BeginTransactionAsync(cancellationToken)
+                : null;
+
+            try
+            {
+                // Aynı türetilmiş satırları yeniden hesaplayan eşzamanlı kayıtlar sıraya girer; kilitler kayıt
+                // yazılmadan önce alınır ki transaction'lar birbirinin commit edilmemiş satırında beklerken kilitlenmesin
+                // Sıra sabittir (önce bakiyeler, sonra özetler); iki kayıt kilitleri ters sırayla alıp birbirini beklemesin
+                if (!balanceChanges.IsEmpty)
+                    await BalanceBuilder.AcquireLocksAsync(this, balanceChanges, cancellationToken);
+
+                if (!rollupChanges.IsEmpty)
+                    await ReportRollupBuilder.AcquireLocksAsync(this, rollupChanges, cancellationToken);
+
+                var result = await base.SaveChangesAsync(acceptAllChangesOnSuccess, cancellationToken);
+
+                _refreshingDerivedData = true;
+                try
+                {
+                    if (!balanceChanges.IsEmpty)
+                        await BalanceBuilder.RefreshAsync(this, balanceChanges, cancellationToken);
+
+                    if (!rollupChanges.IsEmpty)
+                        await ReportRollupBuilder.RefreshAsync(this, rollupChanges, cancellationToken);
+                }
+                finally
+                {
+                    _refreshingDerivedData = false;
+                }
+
+                if (transaction != null)
+                    await transaction.CommitAsync(cancellationToken);
+
+                return result;
+            }
+            finally
+            {
+                if (transaction != null)
+                    await transaction.DisposeAsync();
+            }
+        }
 
         protected override void OnModelCreating(ModelBuilder modelBuilder)
         {
@@ -54,6 +211,42 @@ namespace BeautyCenterApi.Data
                 .Property(pi => pi.Amount)
                 .HasPrecision(10, 2);
 
+            // Denormalize bakiyeler
+            modelBuilder.Entity<Appointment>()
+                .Property(a => a.PaidAmount)
+                .HasPrecision(10, 2);
+
+            modelBuilder.Entity<Appointment>()
+                .Property(a => a.RemainingAmount)
+                .HasPrecision(10, 2);
+
+            modelBuilder.Entity<Customer>()
+                .Property(c => c.TotalPaid)
+                .HasPrecision(18, 2);
+
+            modelBuilder.Entity<Customer>()
+                .Property(c => c.RemainingBalance)
+                .HasPrecision(18, 2);
+
+            // Rapor özet tabloları
+            modelBuilder.Entity<DailyPaymentRollup>(entity =>
+            {
+                entity.Property(r => r.Date).HasColumnType("date");
+                entity.Property(r => r.TotalAmount).HasPrecision(18, 2);
+                entity.Property(r => r.PaidAmount).HasPrecision(18, 2);
+                entity.Property(r => r.RemainingAmount).HasPrecision(18, 2);
+                entity.HasIndex(r => new { r.TenantId, r.Date, r.ServiceTypeId, r.PaymentMethod, r.PaymentStatus })
+                    .IsUnique();
+            });
+
+            modelBuilder.Entity<DailyAppointmentRollup>(entity =>
+            {
+                entity.Property(r => r.Date).HasColumnType("date");
+                entity.Property(r => r.Revenue).HasPrecision(18, 2);
+                entity.HasIndex(r => new { r.TenantId, r.Date, r.ServiceTypeId, r.Status })
+                    .IsUnique();
+            });
+
             // Configure relationships
             modelBuilder.Entity<Appointment>()
                 .HasOne(a => a.Customer)
@@ -73,6 +266,12 @@ namespace BeautyCenterApi.Data
                 .HasForeignKey(a => a.UserId)
                 .OnDelete(DeleteBehavior.Restrict);
 
+            modelBuilder.Entity<RefreshToken>()
+                .HasOne(r => r.User)
+                .WithMany()
+                .HasForeignKey(r => r.UserId)
+                .OnDelete(DeleteBehavior.Cascade);
+
             modelBuilder.Entity<Payment>()
                 .HasOne(p => p.Customer)
                 .WithMany(c => c.Payments)
@@ -116,6 +315,59 @@ namespace BeautyCenterApi.Data
                 .HasForeignKey(p => p.TenantId)
                 .OnDelete(DeleteBehavior.Restrict);
 
+            // Keyset sayfalama indeksleri: tenant içinde (tarih, Id) sırasıyla aralık taraması
+            modelBuilder.Entity<Appointment>()
+                .HasIndex(a => new { a.TenantId, a.AppointmentDate, a.Id });
+
+            modelBuilder.Entity<Payment>()
+                .HasIndex(p => new { p.TenantId, p.PaymentDate, p.Id });
+
+            // Personel takvimi: müsaitlik ve çakışma kontrolü tek personelin tarih aralığını indeksten okur
+            modelBuilder.Entity<Appointment>()
+                .HasIndex(a => new { a.TenantId, a.UserId, a.AppointmentDate })
+                .IncludeProperties(a => new { a.ServiceTypeId, a.Status });
+
+            // Yenileme token'ı özetle bulunur
+            modelBuilder.Entity<RefreshToken>()
+                .HasIndex(r => r.TokenHash)
+                .IsUnique();
+
+            // Bekleyen ödemeler listesi: yalnızca açık bakiyeli randevular üzerinde aralık taraması
+            modelBuilder.Entity<Appointment>()
+                .HasIndex(a => new { a.TenantId, a.AppointmentDate }, "IX_Appointments_OpenBalance")
+                .HasFilter("[RemainingAmount] > 0");
+
+            // Müşteri arama: katlanmış ad/soyad ve normalize telefon üzerinde tenant içi önek taraması
+            modelBuilder.Entity<Customer>(entity =>
+            {
+                entity.HasIndex(c => new { c.TenantId, c.SearchFullName });
+                entity.HasIndex(c => new { c.TenantId, c.SearchLastName });
+                entity.HasIndex(c => new { c.TenantId, c.SearchPhone });
+                entity.HasIndex(c => new { c.TenantId, c.Email });
+            });
+
+            // Tenant izolasyonu (SuperAdmin okumaları TenantScoped/IgnoreQueryFilters ile filtreyi açıkça kaldırır)
+            modelBuilder.Entity<User>()
+                .HasQueryFilter(u => u.TenantId == CurrentTenantId);
+
+            modelBuilder.Entity<Customer>()
+                .HasQueryFilter(c => c.TenantId == CurrentTenantId);
+
+            modelBuilder.Entity<ServiceType>()
+                .HasQueryFilter(s => s.TenantId == CurrentTenantId);
+
+            modelBuilder.Entity<Appointment>()
+                .HasQueryFilter(a => a.TenantId == CurrentTenantId);
+
+            modelBuilder.Entity<Payment>()
+                .HasQueryFilter(p => p.TenantId == CurrentTenantId);
+
+            modelBuilder.Entity<DailyPaymentRollup>()
+                .HasQueryFilter(r => r.TenantId == CurrentTenantId);
+
+            modelBuilder.Entity<DailyAppointmentRollup>()
+                .HasQueryFilter(r => r.TenantId == CurrentTenantId);
+
             // Seed data
             // İlk tenant oluştur
             modelBuilder.Entity<Tenant>().HasData(
@@ -0,0 +1,153 @@
+using System.Globalization;
+using System.Text;
+using BeautyCenterApi.Models;
+using Microsoft.Data.SqlClient;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.EntityFrameworkCore.ChangeTracking;
+
+namespace BeautyCenterApi.Data
+{
+    // Müşteri arama sütunlarını üretir. Aynı kurallar hem kayıtta hem arama teriminde uygulanır;
+    // böylece sorgular indeksli sütunlarda yalnızca önek (LIKE 'x%') araması yapar
+    public static class CustomerSearchNormalizer
+    {
+        public const int FullNameMaxLength = 201;
+        public const int LastNameMaxLength = 100;
+        public const int PhoneMaxLength = 15;
+
+        // Satır başına 4 parametre; SQL Server'ın istek başına 2100 parametre sınırının altında kalır
+        private const int MaxBackfillBatchSize = 500;
+
+        private static readonly CultureInfo TurkishCulture = CultureInfo.GetCultureInfo("tr-TR");
+
+        public static void Apply(ChangeTracker changeTracker)
+        {
+            foreach (var entry in changeTracker.Entries<Customer>())
+            {
+                if (entry.State != EntityState.Added && entry.State != EntityState.Modified)
+                    continue;
+
+                var customer = entry.Entity;
+                customer.SearchFullName = Truncate(FoldName($"{customer.FirstName} {customer.LastName}"), FullNameMaxLength);
+                customer.SearchLastName = Truncate(FoldName(customer.LastName), LastNameMaxLength);
+                customer.SearchPhone = Truncate(NormalizePhone(customer.Phone), PhoneMaxLength);
+            }
+        }
+
+        // Arama sütunları boş kalan (migration'dan önce eklenmiş) müşterileri FoldName/NormalizePhone ile doldurur.
+        // Id sırasıyla partiler halinde ilerler; her parti tek UPDATE ... FROM (VALUES ...) ile yazılır ve
+        // SaveChanges kullanılmaz ki bakiye/özet yenilemesi tetiklenmesin. CustomerSearchBackfillService arka planda çağırır
+        public static async Task<int> BackfillAsync(BeautyCenterDbContext context, int batchSize = MaxBackfillBatchSize, CancellationToken cancellationToken = default)
+        {
+            batchSize = Math.Clamp(batchSize, 1, MaxBackfillBatchSize);
+            var updated = 0;
+            var lastId = 0;
+
+            while (true)
+            {
+                var batch = await context.Customers
+                    .IgnoreQueryFilters()
+                    .AsNoTracking()
+                    .Where(c => c.Id > lastId && (c.SearchFullName == "" || c.SearchLastName == "" || c.SearchPhone == ""))
+                    .OrderBy(c => c.Id)
+                    .Select(c => new { c.Id, c.FirstName, c.LastName, c.Phone, c.SearchFullName, c.SearchLastName, c.SearchPhone })
+                    .Take(batchSize)
+                    .ToListAsync(cancellationToken);
+
+                if (batch.Count == 0)
+                    return updated;
+
+                var rows = new List<string>(batch.Count);
+                var parameters = new List<object>(batch.Count * 4);
+                foreach (var customer in batch)
+                {
+                    var searchFullName = Truncate(FoldName($"{customer.FirstName} {customer.LastName}"), FullNameMaxLength);
+                    var searchLastName = Truncate(FoldName(customer.LastName), LastNameMaxLength);
+                    var searchPhone = Truncate(NormalizePhone(customer.Phone), PhoneMaxLength);
+
+                    // Adı ya da telefonu gerçekten boş olan müşteriler her açılışta yeniden yazılmaz
+                    if (searchFullName == customer.SearchFullName && searchLastName == customer.SearchLastName && searchPhone == customer.SearchPhone)
+                        continue;
+
+                    var index = rows.Count;
+                    rows.Add($"(@id{index}, @fullName{index}, @lastName{index}, @phone{index})");
+                    parameters.Add(new SqlParameter($"@id{index}", customer.Id));
+                    parameters.Add(new SqlParameter($"@fullName{index}", searchFullName));
+                    parameters.Add(new SqlParameter($"@lastName{index}", searchLastName));
+                    parameters.Add(new SqlParameter($"@phone{index}", searchPhone));
+                }
+
+                if (rows.Count > 0)
+                {
+                    updated += await context.Database.ExecuteSqlRawAsync(
+                        "UPDATE c SET c.SearchFullName = v.SearchFullName, c.SearchLastName = v.SearchLastName, c.SearchPhone = v.SearchPhone " +
+                        "FROM [Customers] AS c INNER JOIN (VALUES " + string.Join(", ", rows) + ") AS v (Id, SearchFullName, SearchLastName, SearchPhone) ON c.Id = v.Id",
+                        parameters,
+                        cancellationToken);
+                }
+
+                lastId = batch[^1].Id;
+            }
+        }
+
+        // "İPEK Işık" -> "ipek isik": Türkçe küçük harfe çevirip aksanları atar (ı/i, ş/s, ğ/g, ü/u, ö/o, ç/c aynı kabul edilir)
+        public static string FoldName(string? value)
+        {
+            if (string.IsNullOrWhiteSpace(value))
+                return string.Empty;
+
+            var decomposed = value.ToLower(TurkishCulture).Normalize(NormalizationForm.FormD);
+            var builder = new StringBuilder(decomposed.Length);
+            var pendingSpace = false;
+
+            foreach (var ch in decomposed)
+            {
+                if (CharUnicodeInfo.GetUnicodeCategory(ch) == UnicodeCategory.NonSpacingMark)
+                    continue;
+
+                if (char.IsWhiteSpace(ch))
+                {
+                    pendingSpace = builder.Length > 0;
+                    continue;
+                }
+
+                if (pendingSpace)
+                {
+                    builder.Append(' ');
+                    pendingSpace = false;
+                }
+
+                builder.Append(ch == 'ı' ? 'i' : ch);
+            }
+
+            return builder.ToString();
+        }
+
+        // "+90 (532) 123 45 67" ve "0532 123 4567" -> "5321234567"
+        public static string NormalizePhone(string? value)
+        {
+            if (string.IsNullOrWhiteSpace(value))
+                return string.Empty;
+
+            var digits = new string(value.Where(char.IsDigit).ToArray());
+            var hasCountryCode = value.TrimStart().StartsWith('+') || digits.Length > 11;
+
+            if (hasCountryCode && digits.StartsWith("90"))
+                digits = digits[2..];
+            else if (digits.StartsWith('0'))
+                digits = digits[1..];
+
+            return digits;
+        }
+
+        public static bool LooksLikePhone(string term)
+        {
+            return term.Any(char.IsDigit) && term.All(ch => char.IsDigit(ch) || ch == '+' || ch == ' ' || ch == '-' || ch == '(' || ch == ')');
+        }
+
+        private static string Truncate(string value, int maxLength)
+        {
+            return value.Length <= maxLength ? value : value[..maxLength];
+        }
+    }
+}
@@ -114,7 +114,7 @@ namespace BeautyCenterApi.Data
             demoTenant = await context.Tenants.FirstAsync(t => t.SubDomain == "demo");
 
             // Kullanıcıları güncelle
-            var gulhanUser = await context.Users.FirstOrDefaultAsync(u => u.Username == "gulhan");
+            var gulhanUser = await context.Users.IgnoreQueryFilters().FirstOrDefaultAsync(u => u.Username == "gulhan");
             if (gulhanUser != null)
             {
                 gulhanUser.Role = "TenantAdmin";
@@ -122,7 +122,7 @@ namespace BeautyCenterApi.Data
                 gulhanUser.UpdatedAt = DateTime.UtcNow;
             }
 
-            var ardaUser = await context.Users.FirstOrDefaultAsync(u => u.Username == "arda");
+            var ardaUser = await context.Users.IgnoreQueryFilters().FirstOrDefaultAsync(u => u.Username == "arda");
             if (ardaUser != null)
             {
                 ardaUser.Role = "TenantAdmin";
@@ -130,7 +130,7 @@ namespace BeautyCenterApi.Data
                 ardaUser.UpdatedAt = DateTime.UtcNow;
             }
 
-            var elifUser = await context.Users.FirstOrDefaultAsync(u => u.Username == "elif");
+            var elifUser = await context.Users.IgnoreQueryFilters().FirstOrDefaultAsync(u => u.Username == "elif");
             if (elifUser != null)
             {
                 elifUser.Role = "TenantAdmin";
@@ -139,7 +139,7 @@ namespace BeautyCenterApi.Data
             }
 
             // Demo kullanıcısını oluştur
-            var demoUser = await context.Users.FirstOrDefaultAsync(u => u.Username == "demo");
+            var demoUser = await context.Users.IgnoreQueryFilters().FirstOrDefaultAsync(u => u.Username == "demo");
             if (demoUser == null)
             {
                 demoUser = new User
@@ -165,7 +165,7 @@ namespace BeautyCenterApi.Data
             }
 
             // SuperAdmin'in sadece 'superadmin' olduğundan emin ol
-            var superadmin = await context.Users.FirstOrDefaultAsync(u => u.Username == "superadmin");
+            var superadmin = await context.Users.IgnoreQueryFilters().FirstOrDefaultAsync(u => u.Username == "superadmin");
             if (superadmin != null)
             {
                 superadmin.Role = "SuperAdmin";
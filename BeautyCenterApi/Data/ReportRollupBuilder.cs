@@ -0,0 +1,320 @@
+﻿using BeautyCenterApi.Models;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.EntityFrameworkCore.ChangeTracking;
+
+namespace BeautyCenterApi.Data
+{
+    public class RollupChangeSet
+    {
+        public HashSet<(int TenantId, DateTime Date)> PaymentDays { get; } = new();
+        public HashSet<(int TenantId, DateTime Date)> AppointmentDays { get; } = new();
+
+        // Hizmeti değişen randevuların ödemeleri de farklı bir hizmet satırına taşınır
+        public HashSet<int> ReassignedAppointmentIds { get; } = new();
+
+        public bool IsEmpty => PaymentDays.Count == 0 && AppointmentDays.Count == 0 && ReassignedAppointmentIds.Count == 0;
+    }
+
+    // Sistem düzeyinde çalışır: tenant sorgu filtreleri yok sayılır, tenant koşulu sorgularda açıkça yazılır
+    public static class ReportRollupBuilder
+    {
+        // Aralık yenilemesinde tek transaction'da kilitlenen gün sayısı
+        private const int RangeWindowDays = 31;
+
+        public static RollupChangeSet CollectChanges(ChangeTracker changeTracker)
+        {
+            var changes = new RollupChangeSet();
+
+            foreach (var entry in changeTracker.Entries())
+            {
+                if (entry.State != EntityState.Added && entry.State != EntityState.Modified && entry.State != EntityState.Deleted)
+                    continue;
+
+                switch (entry.Entity)
+                {
+                    case Appointment appointment:
+                        AddDays(changes.AppointmentDays, entry, nameof(Appointment.TenantId), nameof(Appointment.AppointmentDate));
+                        if (entry.State == EntityState.Modified &&
+                            !Equals(entry.OriginalValues[nameof(Appointment.ServiceTypeId)], entry.CurrentValues[nameof(Appointment.ServiceTypeId)]))
+                        {
+                            changes.ReassignedAppointmentIds.Add(appointment.Id);
+                        }
+                        break;
+
+                    case Payment:
+                        AddDays(changes.PaymentDays, entry, nameof(Payment.TenantId), nameof(Payment.PaymentDate));
+                        break;
+                }
+            }
+
+            return changes;
+        }
+
+        // Etkilenen (tenant, gün) anahtarlarını kilitler. Kayıt yazılmadan önce çağrılmalıdır: aynı güne yazan iki
+        // transaction birbirinin henüz commit edilmemiş satırını GROUP BY ile taramaya çalışıp kilitlenmesin
+        public static async Task AcquireLocksAsync(BeautyCenterDbContext context, RollupChangeSet changes, CancellationToken cancellationToken = default)
+        {
+            // Hizmeti değişen randevuların ödeme günleri de yeniden hesaplanır; ödeme tarihleri bu kayıtta değişmez
+            if (changes.ReassignedAppointmentIds.Count > 0)
+            {
+                var appointmentIds = changes.ReassignedAppointmentIds.ToList();
+                var paymentDays = await context.Payments
+                    .IgnoreQueryFilters()
+                    .Where(p => appointmentIds.Contains(p.AppointmentId))
+                    .Select(p => new { p.TenantId, p.PaymentDate })
+                    .ToListAsync(cancellationToken);
+
+                foreach (var day in paymentDays)
+                {
+                    changes.PaymentDays.Add((day.TenantId, day.PaymentDate.Date));
+                }
+            }
+
+            // Kilitler her zaman aynı sırayla alınır: tenant, gün, ardından tür (önce randevular); yeniden oluşturma da
+            // aynı gün kilitlerini alır, tenant genelinde bir kilit yoktur
+            var resources = changes.PaymentDays.Select(d => (d.TenantId, d.Date, Kind: "payments"))
+                .Concat(changes.AppointmentDays.Select(d => (d.TenantId, d.Date, Kind: "appointments")))
+                .OrderBy(d => d.TenantId).ThenBy(d => d.Date).ThenBy(d => d.Kind, StringComparer.Ordinal)
+                .Select(d => DayLockResource(d.Kind, d.TenantId, d.Date))
+                .ToList();
+
+            await SqlAppLock.AcquireManyAsync(context, resources, cancellationToken: cancellationToken);
+        }
+
+        // Etkilenen (tenant, gün) satırlarını kaynak tablolardan yeniden hesaplar; kilitler AcquireLocksAsync ile alınmış olmalıdır
+        public static async Task RefreshAsync(BeautyCenterDbContext context, RollupChangeSet changes, CancellationToken cancellationToken = default)
+        {
+            foreach (var (tenantId, date) in changes.PaymentDays)
+            {
+                await RefreshPaymentDayAsync(context, tenantId, date, cancellationToken);
+            }
+
+            foreach (var (tenantId, date) in changes.AppointmentDays)
+            {
+                await RefreshAppointmentDayAsync(context, tenantId, date, cancellationToken);
+            }
+
+            await context.SaveChangesAsync(cancellationToken);
+            DetachRollups(context);
+        }
+
+        // Bir tenant'ın tüm özetlerini kaynak tablolardan yeniden oluşturur (ilk kurulum, onarım, periyodik yeniden oluşturma).
+        // Tenant tek seferde kilitlenmez: veri aralığı RefreshRangeAsync pencereleriyle gün kilitleri altında yenilenir,
+        // o sırada diğer günlere yazan istekler beklemez
+        public static async Task RebuildTenantAsync(BeautyCenterDbContext context, int tenantId, CancellationToken cancellationToken = default)
+        {
+            var paymentRange = await context.Payments
+                .IgnoreQueryFilters()
+                .Where(p => p.TenantId == tenantId)
+                .GroupBy(p => p.TenantId)
+                .Select(g => new { From = g.Min(p => p.PaymentDate), To = g.Max(p => p.PaymentDate) })
+                .FirstOrDefaultAsync(cancellationToken);
+            var appointmentRange = await context.Appointments
+                .IgnoreQueryFilters()
+                .Where(a => a.TenantId == tenantId)
+                .GroupBy(a => a.TenantId)
+                .Select(g => new { From = g.Min(a => a.AppointmentDate), To = g.Max(a => a.AppointmentDate) })
+                .FirstOrDefaultAsync(cancellationToken);
+
+            DateTime? from = null;
+            DateTime? to = null;
+            foreach (var date in new[] { paymentRange?.From, paymentRange?.To, appointmentRange?.From, appointmentRange?.To })
+            {
+                if (!date.HasValue)
+                    continue;
+
+                if (!from.HasValue || date.Value.Date < from)
+                    from = date.Value.Date;
+                if (!to.HasValue || date.Value.Date >= to)
+                    to = date.Value.Date.AddDays(1);
+            }
+
+            if (from.HasValue && to.HasValue)
+                await RefreshRangeAsync(context, tenantId, from.Value, to.Value, cancellationToken);
+
+            // Kaynağı kalmamış (aralık dışındaki) özet günleri de kendi kilitleri altında yeniden hesaplanır, yani silinir
+            var paymentRollups = context.DailyPaymentRollups.IgnoreQueryFilters().Where(r => r.TenantId == tenantId);
+            var appointmentRollups = context.DailyAppointmentRollups.IgnoreQueryFilters().Where(r => r.TenantId == tenantId);
+            if (from.HasValue && to.HasValue)
+            {
+                var rangeStart = from.Value;
+                var rangeEnd = to.Value;
+                paymentRollups = paymentRollups.Where(r => r.Date < rangeStart || r.Date >= rangeEnd);
+                appointmentRollups = appointmentRollups.Where(r => r.Date < rangeStart || r.Date >= rangeEnd);
+            }
+
+            var staleDays = await paymentRollups.Select(r => r.Date)
+                .Union(appointmentRollups.Select(r => r.Date))
+                .ToListAsync(cancellationToken);
+
+            foreach (var day in staleDays.OrderBy(d => d))
+            {
+                await RefreshRangeAsync(context, tenantId, day, day.AddDays(1), cancellationToken);
+            }
+        }
+
+        // Bir tenant'ın [from, to) aralığındaki özetlerini küme bazlı yeniden hesaplar (toplu içe aktarma, yeniden oluşturma).
+        // Aralık pencerelere bölünür; her pencere yalnızca kendi gün kilitlerini tutar, diğer günlere yazılar beklemez
+        public static async Task RefreshRangeAsync(BeautyCenterDbContext context, int tenantId, DateTime from, DateTime to, CancellationToken cancellationToken = default)
+        {
+            from = from.Date;
+            to = to.Date;
+
+            for (var windowStart = from; windowStart < to; windowStart = windowStart.AddDays(RangeWindowDays))
+            {
+                var windowEnd = windowStart.AddDays(RangeWindowDays);
+                if (windowEnd > to)
+                    windowEnd = to;
+
+                await RefreshWindowAsync(context, tenantId, windowStart, windowEnd, cancellationToken);
+            }
+        }
+
+        private static async Task RefreshWindowAsync(BeautyCenterDbContext context, int tenantId, DateTime from, DateTime to, CancellationToken cancellationToken)
+        {
+            await using var transaction = context.Database.CurrentTransaction == null
+                ? await context.Database.BeginTransactionAsync(cancellationToken)
+                : null;
+
+            // AcquireLocksAsync ile aynı sıra: her gün için önce randevular, sonra ödemeler
+            var dayLocks = new List<string>();
+            for (var date = from; date < to; date = date.AddDays(1))
+            {
+                dayLocks.Add(DayLockResource("appointments", tenantId, date));
+                dayLocks.Add(DayLockResource("payments", tenantId, date));
+            }
+            await SqlAppLock.AcquireManyAsync(context, dayLocks, cancellationToken: cancellationToken);
+
+            var paymentRows = await context.Payments
+                .IgnoreQueryFilters()
+                .Where(p => p.TenantId == tenantId && p.PaymentDate >= from && p.PaymentDate < to)
+                .GroupBy(p => new { Date = p.PaymentDate.Date, p.Appointment.ServiceTypeId, p.PaymentMethod, p.PaymentStatus })
+                .Select(g => new DailyPaymentRollup
+                {
+                    TenantId = tenantId,
+                    Date = g.Key.Date,
+                    ServiceTypeId = g.Key.ServiceTypeId,
+                    PaymentMethod = g.Key.PaymentMethod,
+                    PaymentStatus = g.Key.PaymentStatus,
+                    PaymentCount = g.Count(),
+                    TotalAmount = g.Sum(p => p.TotalAmount),
+                    PaidAmount = g.Sum(p => p.PaidAmount),
+                    RemainingAmount = g.Sum(p => p.RemainingAmount)
+                })
+                .ToListAsync(cancellationToken);
+
+            var appointmentRows = await context.Appointments
+                .IgnoreQueryFilters()
+                .Where(a => a.TenantId == tenantId && a.AppointmentDate >= from && a.AppointmentDate < to)
+                .GroupBy(a => new { Date = a.AppointmentDate.Date, a.ServiceTypeId, a.Status })
+                .Select(g => new DailyAppointmentRollup
+                {
+                    TenantId = tenantId,
+                    Date = g.Key.Date,
+                    ServiceTypeId = g.Key.ServiceTypeId,
+                    Status = g.Key.Status,
+                    AppointmentCount = g.Count(),
+                    Revenue = g.Sum(a => a.FinalPrice)
+                })
+                .ToListAsync(cancellationToken);
+
+            await context.DailyPaymentRollups
+                .IgnoreQueryFilters()
+                .Where(r => r.TenantId == tenantId && r.Date >= from && r.Date < to)
+                .ExecuteDeleteAsync(cancellationToken);
+            await context.DailyAppointmentRollups
+                .IgnoreQueryFilters()
+                .Where(r => r.TenantId == tenantId && r.Date >= from && r.Date < to)
+                .ExecuteDeleteAsync(cancellationToken);
+
+            context.DailyPaymentRollups.AddRange(paymentRows);
+            context.DailyAppointmentRollups.AddRange(appointmentRows);
+            await context.SaveChangesAsync(cancellationToken);
+            DetachRollups(context);
+
+            if (transaction != null)
+                await transaction.CommitAsync(cancellationToken);
+        }
+
+        private static async Task RefreshPaymentDayAsync(BeautyCenterDbContext context, int tenantId, DateTime date, CancellationToken cancellationToken)
+        {
+            var nextDay = date.AddDays(1);
+            var rows = await context.Payments
+                .IgnoreQueryFilters()
+                .Where(p => p.TenantId == tenantId && p.PaymentDate >= date && p.PaymentDate < nextDay)
+                .GroupBy(p => new { p.Appointment.ServiceTypeId, p.PaymentMethod, p.PaymentStatus })
+                .Select(g => new DailyPaymentRollup
+                {
+                    TenantId = tenantId,
+                    Date = date,
+                    ServiceTypeId = g.Key.ServiceTypeId,
+                    PaymentMethod = g.Key.PaymentMethod,
+                    PaymentStatus = g.Key.PaymentStatus,
+                    PaymentCount = g.Count(),
+                    TotalAmount = g.Sum(p => p.TotalAmount),
+                    PaidAmount = g.Sum(p => p.PaidAmount),
+                    RemainingAmount = g.Sum(p => p.RemainingAmount)
+                })
+                .ToListAsync(cancellationToken);
+
+            await context.DailyPaymentRollups
+                .IgnoreQueryFilters()
+                .Where(r => r.TenantId == tenantId && r.Date == date)
+                .ExecuteDeleteAsync(cancellationToken);
+
+            context.DailyPaymentRollups.AddRange(rows);
+        }
+
+        private static async Task RefreshAppointmentDayAsync(BeautyCenterDbContext context, int tenantId, DateTime date, CancellationToken cancellationToken)
+        {
+            var nextDay = date.AddDays(1);
+            var rows = await context.Appointments
+                .IgnoreQueryFilters()
+                .Where(a => a.TenantId == tenantId && a.AppointmentDate >= date && a.AppointmentDate < nextDay)
+                .GroupBy(a => new { a.ServiceTypeId, a.Status })
+                .Select(g => new DailyAppointmentRollup
+                {
+                    TenantId = tenantId,
+                    Date = date,
+                    ServiceTypeId = g.Key.ServiceTypeId,
+                    Status = g.Key.Status,
+                    AppointmentCount = g.Count(),
+                    Revenue = g.Sum(a => a.FinalPrice)
+                })
+                .ToListAsync(cancellationToken);
+
+            await context.DailyAppointmentRollups
+                .IgnoreQueryFilters()
+                .Where(r => r.TenantId == tenantId && r.Date == date)
+                .ExecuteDeleteAsync(cancellationToken);
+
+            context.DailyAppointmentRollups.AddRange(rows);
+        }
+
+        private static string DayLockResource(string kind, int tenantId, DateTime date) => $"rollups:{kind}:{tenantId}:{date:yyyy-MM-dd}";
+
+        private static void AddDays(HashSet<(int TenantId, DateTime Date)> days, EntityEntry entry, string tenantProperty, string dateProperty)
+        {
+            if (entry.State != EntityState.Deleted)
+            {
+                days.Add(((int)entry.CurrentValues[tenantProperty]!, ((DateTime)entry.CurrentValues[dateProperty]!).Date));
+            }
+
+            if (entry.State != EntityState.Added)
+            {
+                days.Add(((int)entry.OriginalValues[tenantProperty]!, ((DateTime)entry.OriginalValues[dateProperty]!).Date));
+            }
+        }
+
+        // Özet satırları yalnızca yazılır; uzun ömürlü context'lerde takipte birikmesinler
+        private static void DetachRollups(BeautyCenterDbContext context)
+        {
+            foreach (var entry in context.ChangeTracker.Entries()
+                .Where(e => e.Entity is DailyPaymentRollup || e.Entity is DailyAppointmentRollup)
+                .ToList())
+            {
+                entry.State = EntityState.Detached;
+            }
+        }
+    }
+}
@@ -0,0 +1,69 @@
+using System.Data;
+using System.Text;
+using Microsoft.Data.SqlClient;
+using Microsoft.EntityFrameworkCore;
+
+namespace BeautyCenterApi.Data
+{
+    // Açık transaction'a bağlı SQL Server uygulama kilidi; kilit commit ya da rollback ile bırakılır.
+    // Türetilmiş verinin (özetler, bakiyeler) okunup yeniden yazılması aynı anahtar için sıraya sokulur
+    public static class SqlAppLock
+    {
+        public const int DefaultTimeoutMilliseconds = 15000;
+
+        // SQL Server istek başına 2100 parametreye izin verir; çok sayıda kilit bu boyutta parçalara bölünür
+        private const int MaxResourcesPerBatch = 500;
+
+        public static async Task AcquireAsync(DbContext context, string resource, bool exclusive = true,
+            int timeoutMilliseconds = DefaultTimeoutMilliseconds, CancellationToken cancellationToken = default)
+        {
+            var result = new SqlParameter("@result", SqlDbType.Int) { Direction = ParameterDirection.Output };
+
+            await context.Database.ExecuteSqlRawAsync(
+                "EXEC @result = sp_getapplock @Resource = @resource, @LockMode = @mode, @LockOwner = 'Transaction', @LockTimeout = @timeout",
+                new object[]
+                {
+                    result,
+                    new SqlParameter("@resource", resource),
+                    new SqlParameter("@mode", exclusive ? "Exclusive" : "Shared"),
+                    new SqlParameter("@timeout", timeoutMilliseconds)
+                },
+                cancellationToken);
+
+            // 0 ve 1 kilidin alındığını, negatif değerler zaman aşımı veya kilitlenmeyi gösterir
+            if ((int)result.Value < 0)
+                throw new TimeoutException($"Could not acquire lock '{resource}'");
+        }
+
+        // Kilitleri verilen sırayla tek komut içinde alır; kilit başına ayrı bir veritabanı gidiş-dönüşü yapılmaz.
+        // Alınamayan ilk kilitte komut durur, o ana kadar alınanlar transaction sonunda bırakılır
+        public static async Task AcquireManyAsync(DbContext context, IReadOnlyList<string> resources, bool exclusive = true,
+            int timeoutMilliseconds = DefaultTimeoutMilliseconds, CancellationToken cancellationToken = default)
+        {
+            for (var offset = 0; offset < resources.Count; offset += MaxResourcesPerBatch)
+            {
+                var count = Math.Min(MaxResourcesPerBatch, resources.Count - offset);
+                var failed = new SqlParameter("@failed", SqlDbType.Int) { Direction = ParameterDirection.Output };
+                var parameters = new List<object>
+                {
+                    failed,
+                    new SqlParameter("@mode", exclusive ? "Exclusive" : "Shared"),
+                    new SqlParameter("@timeout", timeoutMilliseconds)
+                };
+
+                var sql = new StringBuilder("DECLARE @result int; SET @failed = -1;\n");
+                for (var i = 0; i < count; i++)
+                {
+                    sql.Append($"EXEC @result = sp_getapplock @Resource = @r{i}, @LockMode = @mode, @LockOwner = 'Transaction', @LockTimeout = @timeout; ");
+                    sql.Append($"IF @result < 0 BEGIN SET @failed = {i}; RETURN; END\n");
+                    parameters.Add(new SqlParameter($"@r{i}", resources[offset + i]));
+                }
+
+                await context.Database.ExecuteSqlRawAsync(sql.ToString(), parameters, cancellationToken);
+
+                if (failed.Value is int index && index >= 0)
+                    throw new TimeoutException($"Could not acquire lock '{resources[offset + index]}'");
+            }
+        }
+    }
+}
@@ -1,3 +1,4 @@
+using BeautyCenterApi.DTOs;
 using BeautyCenterApi.Models;
 
 namespace BeautyCenterApi.Interfaces
@@ -12,5 +13,6 @@ namespace BeautyCenterApi.Interfaces
         Task<Appointment?> GetWithDetailsAsync(int appointmentId);
         Task<IEnumerable<Appointment>> GetUpcomingAppointmentsAsync(int customerId);
         Task<decimal> GetTotalRevenueAsync(DateTime startDate, DateTime endDate);
+        Task<PagedResultDto<AppointmentDto>> GetPagedAsync(AppointmentQueryDto filter);
     }
 }
\ No newline at end of file
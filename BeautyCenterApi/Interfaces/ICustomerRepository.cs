@@ -6,6 +6,7 @@ namespace BeautyCenterApi.Interfaces
     {
         Task<Customer?> GetByPhoneAsync(string phone);
         Task<IEnumerable<Customer>> SearchAsync(string searchTerm);
+        Task<IEnumerable<Customer>> TypeaheadAsync(string searchTerm, int limit, bool activeOnly);
         Task<IEnumerable<Customer>> GetActiveCustomersAsync();
         Task<Customer?> GetWithAppointmentsAsync(int customerId);
         Task<Customer?> GetWithPaymentsAsync(int customerId);
@@ -1,3 +1,4 @@
+using BeautyCenterApi.DTOs;
 using BeautyCenterApi.Models;
 
 namespace BeautyCenterApi.Interfaces
@@ -11,5 +12,6 @@ namespace BeautyCenterApi.Interfaces
         Task<decimal> GetTotalPaymentsAsync(DateTime startDate, DateTime endDate);
         Task<decimal> GetCustomerTotalPaymentsAsync(int customerId);
         Task<decimal> GetCustomerRemainingBalanceAsync(int customerId);
+        Task<PagedResultDto<PaymentDto>> GetPagedAsync(PaymentQueryDto filter);
     }
 }
\ No newline at end of file
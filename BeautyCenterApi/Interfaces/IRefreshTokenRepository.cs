@@ -0,0 +1,12 @@
+using BeautyCenterApi.Models;
+
+namespace BeautyCenterApi.Interfaces
+{
+    public interface IRefreshTokenRepository : IGenericRepository<RefreshToken>
+    {
+        Task<RefreshToken?> GetByTokenHashAsync(string tokenHash);
+        Task<bool> TryRevokeAsync(int id, string? replacedByTokenHash);
+        Task RevokeAllForUserAsync(int userId);
+        Task DeleteExpiredForUserAsync(int userId);
+    }
+}
@@ -0,0 +1,11 @@
+using BeautyCenterApi.DTOs;
+
+namespace BeautyCenterApi.Interfaces
+{
+    public interface IReportRepository
+    {
+        Task<ReportPeriodDto> GetPeriodSummaryAsync(DateTime? startDate, DateTime? endDate);
+        Task<int> GetActiveCustomerCountAsync();
+        Task RebuildAsync(int tenantId);
+    }
+}
@@ -1,5 +1,4 @@
 using BeautyCenterApi.Services;
-using System.Security.Claims;
 
 namespace BeautyCenterApi.Middleware
 {
@@ -14,29 +13,18 @@ namespace BeautyCenterApi.Middleware
 
         public async Task InvokeAsync(HttpContext context, ITenantService tenantService)
         {
-            // JWT token'dan tenant bilgisini al
-            if (context.User.Identity?.IsAuthenticated == true)
+            // Tenant bilgisi TenantService'te istek başına bir kez çözülür ve sonraki katmanlarca paylaşılır
+            if (context.User.Identity?.IsAuthenticated == true &&
+                !tenantService.GetCurrentTenantId().HasValue &&
+                !tenantService.IsSuperAdmin())
             {
-                var tenantIdClaim = context.User.FindFirst("TenantId");
-                if (tenantIdClaim != null && int.TryParse(tenantIdClaim.Value, out int tenantId))
-                {
-                    tenantService.SetCurrentTenantId(tenantId);
-                }
-                else
-                {
-                    // SuperAdmin için tenant null olabilir
-                    var roleClaim = context.User.FindFirst(ClaimTypes.Role);
-                    if (roleClaim?.Value != "SuperAdmin")
-                    {
-                        // Normal kullanıcıların tenant bilgisi olmak zorunda
-                        context.Response.StatusCode = 403;
-                        await context.Response.WriteAsync("Tenant bilgisi bulunamadı.");
-                        return;
-                    }
-                }
+                // Normal kullanıcıların tenant bilgisi olmak zorunda (SuperAdmin için tenant null olabilir)
+                context.Response.StatusCode = 403;
+                await context.Response.WriteAsync("Tenant bilgisi bulunamadı.");
+                return;
             }
 
             await _next(context);
         }
     }
-}
\ No newline at end of file
+}
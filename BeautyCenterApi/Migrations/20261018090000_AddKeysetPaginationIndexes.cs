@@ -0,0 +1,54 @@
+﻿using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace BeautyCenterApi.Migrations
+{
+    /// <inheritdoc />
+    public partial class AddKeysetPaginationIndexes : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropIndex(
+                name: "IX_Payments_TenantId",
+                table: "Payments");
+
+            migrationBuilder.DropIndex(
+                name: "IX_Appointments_TenantId",
+                table: "Appointments");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_Payments_TenantId_PaymentDate_Id",
+                table: "Payments",
+                columns: new[] { "TenantId", "PaymentDate", "Id" });
+
+            migrationBuilder.CreateIndex(
+                name: "IX_Appointments_TenantId_AppointmentDate_Id",
+                table: "Appointments",
+                columns: new[] { "TenantId", "AppointmentDate", "Id" });
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropIndex(
+                name: "IX_Payments_TenantId_PaymentDate_Id",
+                table: "Payments");
+
+            migrationBuilder.DropIndex(
+                name: "IX_Appointments_TenantId_AppointmentDate_Id",
+                table: "Appointments");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_Payments_TenantId",
+                table: "Payments",
+                column: "TenantId");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_Appointments_TenantId",
+                table: "Appointments",
+                column: "TenantId");
+        }
+    }
+}
@@ -0,0 +1,90 @@
+﻿using System;
+using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace BeautyCenterApi.Migrations
+{
+    /// <inheritdoc />
+    public partial class AddReportRollups : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.CreateTable(
+                name: "DailyAppointmentRollups",
+                columns: table => new
+                {
+                    Id = table.Column<int>(type: "int", nullable: false)
+                        .Annotation("SqlServer:Identity", "1, 1"),
+                    TenantId = table.Column<int>(type: "int", nullable: false),
+                    Date = table.Column<DateTime>(type: "date", nullable: false),
+                    ServiceTypeId = table.Column<int>(type: "int", nullable: false),
+                    Status = table.Column<string>(type: "nvarchar(50)", maxLength: 50, nullable: false),
+                    AppointmentCount = table.Column<int>(type: "int", nullable: false),
+                    Revenue = table.Column<decimal>(type: "decimal(18,2)", precision: 18, scale: 2, nullable: false)
+                },
+                constraints: table =>
+                {
+                    table.PrimaryKey("PK_DailyAppointmentRollups", x => x.Id);
+                });
+
+            migrationBuilder.CreateTable(
+                name: "DailyPaymentRollups",
+                columns: table => new
+                {
+                    Id = table.Column<int>(type: "int", nullable: false)
+                        .Annotation("SqlServer:Identity", "1, 1"),
+                    TenantId = table.Column<int>(type: "int", nullable: false),
+                    Date = table.Column<DateTime>(type: "date", nullable: false),
+                    ServiceTypeId = table.Column<int>(type: "int", nullable: false),
+                    PaymentMethod = table.Column<string>(type: "nvarchar(50)", maxLength: 50, nullable: false),
+                    PaymentStatus = table.Column<string>(type: "nvarchar(50)", maxLength: 50, nullable: false),
+                    PaymentCount = table.Column<int>(type: "int", nullable: false),
+                    TotalAmount = table.Column<decimal>(type: "decimal(18,2)", precision: 18, scale: 2, nullable: false),
+                    PaidAmount = table.Column<decimal>(type: "decimal(18,2)", precision: 18, scale: 2, nullable: false),
+                    RemainingAmount = table.Column<decimal>(type: "decimal(18,2)", precision: 18, scale: 2, nullable: false)
+                },
+                constraints: table =>
+                {
+                    table.PrimaryKey("PK_DailyPaymentRollups", x => x.Id);
+                });
+
+            migrationBuilder.CreateIndex(
+                name: "IX_DailyAppointmentRollups_TenantId_Date_ServiceTypeId_Status",
+                table: "DailyAppointmentRollups",
+                columns: new[] { "TenantId", "Date", "ServiceTypeId", "Status" },
+                unique: true);
+
+            migrationBuilder.CreateIndex(
+                name: "IX_DailyPaymentRollups_TenantId_Date_ServiceTypeId_PaymentMethod_PaymentStatus",
+                table: "DailyPaymentRollups",
+                columns: new[] { "TenantId", "Date", "ServiceTypeId", "PaymentMethod", "PaymentStatus" },
+                unique: true);
+
+            // Mevcut veriden özetleri doldur
+            migrationBuilder.Sql(@"
+INSERT INTO DailyAppointmentRollups (TenantId, Date, ServiceTypeId, Status, AppointmentCount, Revenue)
+SELECT a.TenantId, CAST(a.AppointmentDate AS date), a.ServiceTypeId, a.Status, COUNT(*), SUM(a.FinalPrice)
+FROM Appointments a
+GROUP BY a.TenantId, CAST(a.AppointmentDate AS date), a.ServiceTypeId, a.Status;");
+
+            migrationBuilder.Sql(@"
+INSERT INTO DailyPaymentRollups (TenantId, Date, ServiceTypeId, PaymentMethod, PaymentStatus, PaymentCount, TotalAmount, PaidAmount, RemainingAmount)
+SELECT p.TenantId, CAST(p.PaymentDate AS date), a.ServiceTypeId, p.PaymentMethod, p.PaymentStatus, COUNT(*), SUM(p.TotalAmount), SUM(p.PaidAmount), SUM(p.RemainingAmount)
+FROM Payments p
+INNER JOIN Appointments a ON a.Id = p.AppointmentId
+GROUP BY p.TenantId, CAST(p.PaymentDate AS date), a.ServiceTypeId, p.PaymentMethod, p.PaymentStatus;");
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropTable(
+                name: "DailyAppointmentRollups");
+
+            migrationBuilder.DropTable(
+                name: "DailyPaymentRollups");
+        }
+    }
+}
@@ -0,0 +1,99 @@
+﻿using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace BeautyCenterApi.Migrations
+{
+    /// <inheritdoc />
+    public partial class AddDenormalizedBalances : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.AddColumn<decimal>(
+                name: "RemainingBalance",
+                table: "Customers",
+                type: "decimal(18,2)",
+                precision: 18,
+                scale: 2,
+                nullable: false,
+                defaultValue: 0m);
+
+            migrationBuilder.AddColumn<decimal>(
+                name: "TotalPaid",
+                table: "Customers",
+                type: "decimal(18,2)",
+                precision: 18,
+                scale: 2,
+                nullable: false,
+                defaultValue: 0m);
+
+            migrationBuilder.AddColumn<decimal>(
+                name: "PaidAmount",
+                table: "Appointments",
+                type: "decimal(10,2)",
+                precision: 10,
+                scale: 2,
+                nullable: false,
+                defaultValue: 0m);
+
+            migrationBuilder.AddColumn<decimal>(
+                name: "RemainingAmount",
+                table: "Appointments",
+                type: "decimal(10,2)",
+                precision: 10,
+                scale: 2,
+                nullable: false,
+                defaultValue: 0m);
+
+            // Mevcut veriden bakiyeleri doldur
+            migrationBuilder.Sql(@"
+UPDATE a
+SET a.PaidAmount = ISNULL(p.PaidAmount, 0),
+    a.RemainingAmount = a.FinalPrice - ISNULL(p.PaidAmount, 0)
+FROM Appointments a
+LEFT JOIN (SELECT AppointmentId, SUM(PaidAmount) AS PaidAmount FROM Payments GROUP BY AppointmentId) p
+    ON p.AppointmentId = a.Id;");
+
+            migrationBuilder.Sql(@"
+UPDATE c
+SET c.TotalPaid = ISNULL(p.PaidAmount, 0),
+    c.RemainingBalance = ISNULL(a.FinalPrice, 0) - ISNULL(p.PaidAmount, 0)
+FROM Customers c
+LEFT JOIN (SELECT CustomerId, SUM(PaidAmount) AS PaidAmount FROM Payments GROUP BY CustomerId) p
+    ON p.CustomerId = c.Id
+LEFT JOIN (SELECT CustomerId, SUM(FinalPrice) AS FinalPrice FROM Appointments GROUP BY CustomerId) a
+    ON a.CustomerId = c.Id;");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_Appointments_OpenBalance",
+                table: "Appointments",
+                columns: new[] { "TenantId", "AppointmentDate" },
+                filter: "[RemainingAmount] > 0");
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropIndex(
+                name: "IX_Appointments_OpenBalance",
+                table: "Appointments");
+
+            migrationBuilder.DropColumn(
+                name: "RemainingBalance",
+                table: "Customers");
+
+            migrationBuilder.DropColumn(
+                name: "TotalPaid",
+                table: "Customers");
+
+            migrationBuilder.DropColumn(
+                name: "PaidAmount",
+                table: "Appointments");
+
+            migrationBuilder.DropColumn(
+                name: "RemainingAmount",
+                table: "Appointments");
+        }
+    }
+}
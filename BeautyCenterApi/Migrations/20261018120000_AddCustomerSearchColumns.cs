@@ -0,0 +1,102 @@
+﻿using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace BeautyCenterApi.Migrations
+{
+    /// <inheritdoc />
+    public partial class AddCustomerSearchColumns : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropIndex(
+                name: "IX_Customers_TenantId",
+                table: "Customers");
+
+            migrationBuilder.AddColumn<string>(
+                name: "SearchFullName",
+                table: "Customers",
+                type: "nvarchar(201)",
+                maxLength: 201,
+                nullable: false,
+                defaultValue: "");
+
+            migrationBuilder.AddColumn<string>(
+                name: "SearchLastName",
+                table: "Customers",
+                type: "nvarchar(100)",
+                maxLength: 100,
+                nullable: false,
+                defaultValue: "");
+
+            migrationBuilder.AddColumn<string>(
+                name: "SearchPhone",
+                table: "Customers",
+                type: "nvarchar(15)",
+                maxLength: 15,
+                nullable: false,
+                defaultValue: "");
+
+            // Mevcut müşterilerin arama sütunları açılışta CustomerSearchNormalizer.BackfillAsync ile doldurulur;
+            // FoldName'in aksan atma ve boşluk sadeleştirmesi SQL'de birebir üretilemez
+
+            migrationBuilder.CreateIndex(
+                name: "IX_Customers_TenantId_Email",
+                table: "Customers",
+                columns: new[] { "TenantId", "Email" });
+
+            migrationBuilder.CreateIndex(
+                name: "IX_Customers_TenantId_SearchFullName",
+                table: "Customers",
+                columns: new[] { "TenantId", "SearchFullName" });
+
+            migrationBuilder.CreateIndex(
+                name: "IX_Customers_TenantId_SearchLastName",
+                table: "Customers",
+                columns: new[] { "TenantId", "SearchLastName" });
+
+            migrationBuilder.CreateIndex(
+                name: "IX_Customers_TenantId_SearchPhone",
+                table: "Customers",
+                columns: new[] { "TenantId", "SearchPhone" });
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropIndex(
+                name: "IX_Customers_TenantId_Email",
+                table: "Customers");
+
+            migrationBuilder.DropIndex(
+                name: "IX_Customers_TenantId_SearchFullName",
+                table: "Customers");
+
+            migrationBuilder.DropIndex(
+                name: "IX_Customers_TenantId_SearchLastName",
+                table: "Customers");
+
+            migrationBuilder.DropIndex(
+                name: "IX_Customers_TenantId_SearchPhone",
+                table: "Customers");
+
+            migrationBuilder.DropColumn(
+                name: "SearchFullName",
+                table: "Customers");
+
+            migrationBuilder.DropColumn(
+                name: "SearchLastName",
+                table: "Customers");
+
+            migrationBuilder.DropColumn(
+                name: "SearchPhone",
+                table: "Customers");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_Customers_TenantId",
+                table: "Customers",
+                column: "TenantId");
+        }
+    }
+}
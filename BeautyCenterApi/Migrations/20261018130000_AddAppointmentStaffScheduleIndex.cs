@@ -0,0 +1,28 @@
+﻿using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace BeautyCenterApi.Migrations
+{
+    /// <inheritdoc />
+    public partial class AddAppointmentStaffScheduleIndex : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.CreateIndex(
+                name: "IX_Appointments_TenantId_UserId_AppointmentDate",
+                table: "Appointments",
+                columns: new[] { "TenantId", "UserId", "AppointmentDate" })
+                .Annotation("SqlServer:Include", new[] { "ServiceTypeId", "Status" });
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropIndex(
+                name: "IX_Appointments_TenantId_UserId_AppointmentDate",
+                table: "Appointments");
+        }
+    }
+}
@@ -3,7 +3,7 @@ using System.ComponentModel.DataAnnotations.Schema;
 
 namespace BeautyCenterApi.Models
 {
-    public class Appointment
+    public class Appointment : ITenantEntity
     {
         [Key]
         public int Id { get; set; }
@@ -34,6 +34,10 @@ namespace BeautyCenterApi.Models
 
         public decimal FinalPrice { get; set; }
 
+        public decimal PaidAmount { get; set; } // Payments toplamı, SaveChanges sırasında güncellenir
+
+        public decimal RemainingAmount { get; set; } // FinalPrice - PaidAmount
+
         public int? SessionsTotal { get; set; }
 
         public int? SessionsCompleted { get; set; }
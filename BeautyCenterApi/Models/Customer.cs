@@ -3,7 +3,7 @@ using System.ComponentModel.DataAnnotations.Schema;
 
 namespace BeautyCenterApi.Models
 {
-    public class Customer
+    public class Customer : ITenantEntity
     {
         [Key]
         public int Id { get; set; }
@@ -40,6 +40,20 @@ namespace BeautyCenterApi.Models
 
         public bool IsActive { get; set; } = true;
 
+        // Arama sütunları: SaveChanges sırasında CustomerSearchNormalizer ile doldurulur
+        [StringLength(201)]
+        public string SearchFullName { get; set; } = string.Empty;
+
+        [StringLength(100)]
+        public string SearchLastName { get; set; } = string.Empty;
+
+        [StringLength(15)]
+        public string SearchPhone { get; set; } = string.Empty;
+
+        public decimal TotalPaid { get; set; } // Payments toplamı, SaveChanges sırasında güncellenir
+
+        public decimal RemainingBalance { get; set; } // Randevu FinalPrice toplamı - TotalPaid
+
         public DateTime CreatedAt { get; set; } = DateTime.UtcNow;
 
         public DateTime? UpdatedAt { get; set; }
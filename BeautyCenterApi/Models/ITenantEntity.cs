@@ -0,0 +1,8 @@
+namespace BeautyCenterApi.Models
+{
+    // Tek bir tenant'a ait varlıklar; yeni kayıtlarda TenantId bu arayüz üzerinden atanır
+    public interface ITenantEntity
+    {
+        int TenantId { get; set; }
+    }
+}
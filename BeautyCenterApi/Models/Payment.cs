@@ -3,7 +3,7 @@ using System.ComponentModel.DataAnnotations.Schema;
 
 namespace BeautyCenterApi.Models
 {
-    public class Payment
+    public class Payment : ITenantEntity
     {
         [Key]
         public int Id { get; set; }
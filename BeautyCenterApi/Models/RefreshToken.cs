@@ -0,0 +1,32 @@
+using System.ComponentModel.DataAnnotations;
+using System.ComponentModel.DataAnnotations.Schema;
+
+namespace BeautyCenterApi.Models
+{
+    // Yenileme token'ı; veritabanında yalnızca SHA-256 özeti tutulur. Her kullanımda yenisiyle değiştirilir
+    public class RefreshToken
+    {
+        [Key]
+        public int Id { get; set; }
+
+        [Required]
+        public int UserId { get; set; }
+
+        [Required]
+        [StringLength(64)]
+        public string TokenHash { get; set; } = string.Empty;
+
+        public DateTime ExpiresAt { get; set; }
+
+        public DateTime CreatedAt { get; set; } = DateTime.UtcNow;
+
+        public DateTime? RevokedAt { get; set; }
+
+        [StringLength(64)]
+        public string? ReplacedByTokenHash { get; set; }
+
+        // Navigation property
+        [ForeignKey("UserId")]
+        public virtual User User { get; set; } = null!;
+    }
+}
@@ -0,0 +1,60 @@
+using System.ComponentModel.DataAnnotations;
+
+namespace BeautyCenterApi.Models
+{
+    // Günlük ödeme özeti: (TenantId, Date, ServiceTypeId, PaymentMethod, PaymentStatus) başına bir satır
+    public class DailyPaymentRollup : ITenantEntity
+    {
+        [Key]
+        public int Id { get; set; }
+
+        [Required]
+        public int TenantId { get; set; }
+
+        [Required]
+        public DateTime Date { get; set; }
+
+        [Required]
+        public int ServiceTypeId { get; set; }
+
+        [Required]
+        [StringLength(50)]
+        public string PaymentMethod { get; set; } = string.Empty;
+
+        [Required]
+        [StringLength(50)]
+        public string PaymentStatus { get; set; } = string.Empty;
+
+        public int PaymentCount { get; set; }
+
+        public decimal TotalAmount { get; set; }
+
+        public decimal PaidAmount { get; set; }
+
+        public decimal RemainingAmount { get; set; }
+    }
+
+    // Günlük randevu özeti: (TenantId, Date, ServiceTypeId, Status) başına bir satır
+    public class DailyAppointmentRollup : ITenantEntity
+    {
+        [Key]
+        public int Id { get; set; }
+
+        [Required]
+        public int TenantId { get; set; }
+
+        [Required]
+        public DateTime Date { get; set; }
+
+        [Required]
+        public int ServiceTypeId { get; set; }
+
+        [Required]
+        [StringLength(50)]
+        public string Status { get; set; } = string.Empty;
+
+        public int AppointmentCount { get; set; }
+
+        public decimal Revenue { get; set; } // FinalPrice toplamı
+    }
+}
\ No newline at end of file
@@ -3,7 +3,7 @@ using System.ComponentModel.DataAnnotations.Schema;
 
 namespace BeautyCenterApi.Models
 {
-    public class ServiceType
+    public class ServiceType : ITenantEntity
     {
         [Key]
         public int Id { get; set; }
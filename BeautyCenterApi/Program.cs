@@ -72,6 +72,9 @@ builder.Services.AddAutoMapper(typeof(MappingProfile));
 builder.Services.AddHttpContextAccessor();
 builder.Services.AddScoped<ITenantService, TenantService>();
 
+// Tenant bazlı referans veri önbelleği (DbContext kayıtlarında geçersiz kılınır)
+builder.Services.AddSingleton<ReferenceDataCache>();
+
 // Register repositories
 builder.Services.AddScoped<ITenantRepository, TenantRepository>();
 builder.Services.AddScoped<IUserRepository, UserRepository>();
@@ -79,9 +82,18 @@ builder.Services.AddScoped<ICustomerRepository, CustomerRepository>();
 builder.Services.AddScoped<IServiceTypeRepository, ServiceTypeRepository>();
 builder.Services.AddScoped<IAppointmentRepository, AppointmentRepository>();
 builder.Services.AddScoped<IPaymentRepository, PaymentRepository>();
+builder.Services.AddScoped<IReportRepository, ReportRepository>();
+builder.Services.AddScoped<IRefreshTokenRepository, RefreshTokenRepository>();
 
 // Register services
+builder.Services.AddSingleton<PasswordHasher>();
 builder.Services.AddScoped<AuthService>();
+builder.Services.AddScoped<BulkImportService>();
+builder.Services.AddScoped<BulkExportService>();
+builder.Services.AddScoped<AppointmentScheduler>();
+builder.Services.AddHostedService<BalanceReconciliationService>();
+builder.Services.AddHostedService<ReportRollupRebuildService>();
+builder.Services.AddHostedService<CustomerSearchBackfillService>();
 
 // Configure CORS
 builder.Services.AddCors(options =>
@@ -100,18 +112,6 @@ var app = builder.Build();
 // Configure the HTTP request pipeline.
 if (app.Environment.IsDevelopment())
 {
-    string testPassword = "admin123";
-    string newHash = BCrypt.Net.BCrypt.HashPassword(testPassword);
-    string existingHash = "$2a$11$dm4AgGac/is.r.qEOtFP5.xAOUJCqrfVWJXzbe9O53OfpJvb0dEmK";
-
-
-    Console.WriteLine($"=== BCRYPT TEST ===");
-    Console.WriteLine($"Password: {testPassword}");
-    Console.WriteLine($"New Hash: {newHash}");
-    Console.WriteLine($"Existing Hash: {existingHash}");
-    Console.WriteLine($"Existing Hash Valid: {BCrypt.Net.BCrypt.Verify(testPassword, existingHash)}");
-    Console.WriteLine($"New Hash Valid: {BCrypt.Net.BCrypt.Verify(testPassword, newHash)}");
-    Console.WriteLine($"===================");
     app.UseSwagger();
     app.UseSwaggerUI();
 }
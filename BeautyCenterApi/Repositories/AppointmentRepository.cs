@@ -1,5 +1,6 @@
 using Microsoft.EntityFrameworkCore;
 using BeautyCenterApi.Data;
+using BeautyCenterApi.DTOs;
 using BeautyCenterApi.Interfaces;
 using BeautyCenterApi.Models;
 using BeautyCenterApi.Services;
@@ -8,15 +9,83 @@ namespace BeautyCenterApi.Repositories
 {
     public class AppointmentRepository : GenericRepository<Appointment>, IAppointmentRepository
     {
+        // Sık çağrılan okumalar önceden derlenir; tenant filtresi context üzerinden parametre olarak eklenir.
+        // SuperAdmin filtreyi açıkça kaldıran ayrı derlenmiş sürümleri kullanır
+        private static readonly Func<BeautyCenterDbContext, int, IAsyncEnumerable<Appointment>> ByCustomerQuery =
+            EF.CompileAsyncQuery((BeautyCenterDbContext context, int customerId) =>
+                context.Appointments
+                    .Include(a => a.ServiceType)
+                    .Include(a => a.User)
+                    .Where(a => a.CustomerId == customerId)
+                    .OrderByDescending(a => a.AppointmentDate));
+
+        private static readonly Func<BeautyCenterDbContext, int, IAsyncEnumerable<Appointment>> ByCustomerAllTenantsQuery =
+            EF.CompileAsyncQuery((BeautyCenterDbContext context, int customerId) =>
+                context.Appointments
+                    .IgnoreQueryFilters()
+                    .Include(a => a.ServiceType)
+                    .Include(a => a.User)
+                    .Where(a => a.CustomerId == customerId)
+                    .OrderByDescending(a => a.AppointmentDate));
+
+        private static readonly Func<BeautyCenterDbContext, DateTime, DateTime, IAsyncEnumerable<Appointment>> ByDateRangeQuery =
+            EF.CompileAsyncQuery((BeautyCenterDbContext context, DateTime startDate, DateTime endDate) =>
+                context.Appointments
+                    .Include(a => a.Customer)
+                    .Include(a => a.ServiceType)
+                    .Include(a => a.User)
+                    .Where(a => a.AppointmentDate >= startDate && a.AppointmentDate <= endDate)
+                    .OrderBy(a => a.AppointmentDate));
+
+        private static readonly Func<BeautyCenterDbContext, DateTime, DateTime, IAsyncEnumerable<Appointment>> ByDateRangeAllTenantsQuery =
+            EF.CompileAsyncQuery((BeautyCenterDbContext context, DateTime startDate, DateTime endDate) =>
+                context.Appointments
+                    .IgnoreQueryFilters()
+                    .Include(a => a.Customer)
+                    .Include(a => a.ServiceType)
+                    .Include(a => a.User)
+                    .Where(a => a.AppointmentDate >= startDate && a.AppointmentDate <= endDate)
+                    .OrderBy(a => a.AppointmentDate));
+
+        private static readonly Func<BeautyCenterDbContext, DateTime, DateTime, IAsyncEnumerable<Appointment>> TodaysQuery =
+            EF.CompileAsyncQuery((BeautyCenterDbContext context, DateTime today, DateTime tomorrow) =>
+                context.Appointments
+                    .Include(a => a.Customer)
+                    .Include(a => a.ServiceType)
+                    .Include(a => a.User)
+                    .Where(a => a.AppointmentDate >= today && a.AppointmentDate < tomorrow)
+                    .OrderBy(a => a.AppointmentDate));
+
+        private static readonly Func<BeautyCenterDbContext, DateTime, DateTime, IAsyncEnumerable<Appointment>> TodaysAllTenantsQuery =
+            EF.CompileAsyncQuery((BeautyCenterDbContext context, DateTime today, DateTime tomorrow) =>
+                context.Appointments
+                    .IgnoreQueryFilters()
+                    .Include(a => a.Customer)
+                    .Include(a => a.ServiceType)
+                    .Include(a => a.User)
+                    .Where(a => a.AppointmentDate >= today && a.AppointmentDate < tomorrow)
+                    .OrderBy(a => a.AppointmentDate));
+
         public AppointmentRepository(BeautyCenterDbContext context, ITenantService tenantService)
             : base(context, tenantService)
         {
         }
 
+        private bool AllTenants => _tenantService.IsSuperAdmin();
+
+        private static async Task<List<Appointment>> MaterializeAsync(IAsyncEnumerable<Appointment> source)
+        {
+            var results = new List<Appointment>();
+            await foreach (var appointment in source)
+            {
+                results.Add(appointment);
+            }
+            return results;
+        }
+
         public new async Task<IEnumerable<Appointment>> GetAllAsync()
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query
+            return await Query
                 .Include(a => a.Customer)
                 .Include(a => a.ServiceType)
                 .Include(a => a.User)
@@ -26,31 +95,17 @@ namespace BeautyCenterApi.Repositories
 
         public async Task<IEnumerable<Appointment>> GetByCustomerIdAsync(int customerId)
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query
-                .Include(a => a.ServiceType)
-                .Include(a => a.User)
-                .Where(a => a.CustomerId == customerId)
-                .OrderByDescending(a => a.AppointmentDate)
-                .ToListAsync();
+            return await MaterializeAsync((AllTenants ? ByCustomerAllTenantsQuery : ByCustomerQuery)(_context, customerId));
         }
 
         public async Task<IEnumerable<Appointment>> GetByDateRangeAsync(DateTime startDate, DateTime endDate)
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query
-                .Include(a => a.Customer)
-                .Include(a => a.ServiceType)
-                .Include(a => a.User)
-                .Where(a => a.AppointmentDate >= startDate && a.AppointmentDate <= endDate)
-                .OrderBy(a => a.AppointmentDate)
-                .ToListAsync();
+            return await MaterializeAsync((AllTenants ? ByDateRangeAllTenantsQuery : ByDateRangeQuery)(_context, startDate, endDate));
         }
 
         public async Task<IEnumerable<Appointment>> GetByStatusAsync(string status)
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query
+            return await Query
                 .Include(a => a.Customer)
                 .Include(a => a.ServiceType)
                 .Include(a => a.User)
@@ -61,8 +116,7 @@ namespace BeautyCenterApi.Repositories
 
         public async Task<IEnumerable<Appointment>> GetByServiceTypeIdAsync(int serviceTypeId)
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query
+            return await Query
                 .Include(a => a.Customer)
                 .Include(a => a.ServiceType)
                 .Include(a => a.User)
@@ -74,22 +128,12 @@ namespace BeautyCenterApi.Repositories
         public async Task<IEnumerable<Appointment>> GetTodaysAppointmentsAsync()
         {
             var today = DateTime.Today;
-            var tomorrow = today.AddDays(1);
-            var query = ApplyTenantFilter(_dbSet);
-
-            return await query
-                .Include(a => a.Customer)
-                .Include(a => a.ServiceType)
-                .Include(a => a.User)
-                .Where(a => a.AppointmentDate >= today && a.AppointmentDate < tomorrow)
-                .OrderBy(a => a.AppointmentDate)
-                .ToListAsync();
+            return await MaterializeAsync((AllTenants ? TodaysAllTenantsQuery : TodaysQuery)(_context, today, today.AddDays(1)));
         }
 
         public async Task<Appointment?> GetWithDetailsAsync(int appointmentId)
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query
+            return await Query
                 .Include(a => a.Customer)
                 .Include(a => a.ServiceType)
                 .Include(a => a.User)
@@ -100,8 +144,7 @@ namespace BeautyCenterApi.Repositories
         public async Task<IEnumerable<Appointment>> GetUpcomingAppointmentsAsync(int customerId)
         {
             var now = DateTime.Now;
-            var query = ApplyTenantFilter(_dbSet);
-            return await query
+            return await Query
                 .Include(a => a.ServiceType)
                 .Include(a => a.User)
                 .Where(a => a.CustomerId == customerId && a.AppointmentDate > now && a.Status == "Scheduled")
@@ -111,10 +154,87 @@ namespace BeautyCenterApi.Repositories
 
         public async Task<decimal> GetTotalRevenueAsync(DateTime startDate, DateTime endDate)
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query
+            return await Query
                 .Where(a => a.AppointmentDate >= startDate && a.AppointmentDate <= endDate && a.Status == "Completed")
                 .SumAsync(a => a.FinalPrice);
         }
+
+        public async Task<PagedResultDto<AppointmentDto>> GetPagedAsync(AppointmentQueryDto filter)
+        {
+            var pageSize = filter.GetEffectivePageSize();
+            var query = Query.AsNoTracking();
+
+            if (!string.IsNullOrWhiteSpace(filter.Status))
+            {
+                var status = filter.Status;
+                query = query.Where(a => a.Status == status);
+            }
+
+            if (filter.CustomerId.HasValue)
+            {
+                var customerId = filter.CustomerId.Value;
+                query = query.Where(a => a.CustomerId == customerId);
+            }
+
+            if (filter.StartDate.HasValue)
+            {
+                var startDate = filter.StartDate.Value;
+                query = query.Where(a => a.AppointmentDate >= startDate);
+            }
+
+            if (filter.EndDate.HasValue)
+            {
+                var endDate = filter.EndDate.Value;
+                query = query.Where(a => a.AppointmentDate < endDate);
+            }
+
+            if (!string.IsNullOrWhiteSpace(filter.Search))
+            {
+                var term = filter.Search.Trim();
+                query = query.Where(a =>
+                    (a.Customer.FirstName + " " + a.Customer.LastName).Contains(term) ||
+                    a.ServiceType.Name.Contains(term) ||
+                    (a.Notes != null && a.Notes.Contains(term)));
+            }
+
+            // Keyset: (AppointmentDate, Id) üzerinden son görülen satırın arkasından devam et
+            if (KeysetCursor.TryDecode(filter.Cursor, out var cursorDate, out var cursorId))
+            {
+                query = filter.Descending
+                    ? query.Where(a => a.AppointmentDate < cursorDate || (a.AppointmentDate == cursorDate && a.Id < cursorId))
+                    : query.Where(a => a.AppointmentDate > cursorDate || (a.AppointmentDate == cursorDate && a.Id > cursorId));
+            }
+
+            query = filter.Descending
+                ? query.OrderByDescending(a => a.AppointmentDate).ThenByDescending(a => a.Id)
+                : query.OrderBy(a => a.AppointmentDate).ThenBy(a => a.Id);
+
+            var rows = await query
+                .Take(pageSize + 1)
+                .Select(a => new AppointmentDto
+                {
+                    Id = a.Id,
+                    CustomerId = a.CustomerId,
+                    ServiceTypeId = a.ServiceTypeId,
+                    UserId = a.UserId,
+                    AppointmentDate = a.AppointmentDate,
+                    Status = a.Status,
+                    TotalPrice = a.TotalPrice,
+                    DiscountAmount = a.DiscountAmount,
+                    FinalPrice = a.FinalPrice,
+                    SessionsTotal = a.SessionsTotal,
+                    SessionsCompleted = a.SessionsCompleted,
+                    SessionsRemaining = a.SessionsRemaining,
+                    Notes = a.Notes,
+                    CustomerName = a.Customer.FirstName + " " + a.Customer.LastName,
+                    ServiceTypeName = a.ServiceType.Name,
+                    UserName = a.User.FirstName + " " + a.User.LastName,
+                    Duration = a.ServiceType.DurationMinutes,
+                    ServicePrice = a.ServiceType.Price
+                })
+                .ToListAsync();
+
+            return PagedResultDto<AppointmentDto>.Create(rows, pageSize, a => KeysetCursor.Encode(a.AppointmentDate, a.Id));
+        }
     }
 }
\ No newline at end of file
@@ -13,34 +13,43 @@ namespace BeautyCenterApi.Repositories
         {
         }
 
+        // Biçimden bağımsız eşleşme: "0532 123 45 67" ile "+90 532 1234567" aynı numaradır
         public async Task<Customer?> GetByPhoneAsync(string phone)
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query.FirstOrDefaultAsync(c => c.Phone == phone);
+            var normalizedPhone = CustomerSearchNormalizer.NormalizePhone(phone);
+            if (normalizedPhone.Length == 0)
+                return await Query.FirstOrDefaultAsync(c => c.Phone == phone);
+
+            return await Query.FirstOrDefaultAsync(c => c.SearchPhone == normalizedPhone);
         }
 
         public async Task<IEnumerable<Customer>> SearchAsync(string searchTerm)
         {
-            var term = searchTerm.ToLower();
-            var query = ApplyTenantFilter(_dbSet);
-            return await query
-                .Where(c => c.FirstName.ToLower().Contains(term) ||
-                           c.LastName.ToLower().Contains(term) ||
-                           c.Phone.Contains(term) ||
-                           (c.Email != null && c.Email.ToLower().Contains(term)))
+            return await BuildSearchQuery(Query, searchTerm)
+                .OrderBy(c => c.SearchFullName)
+                .ToListAsync();
+        }
+
+        public async Task<IEnumerable<Customer>> TypeaheadAsync(string searchTerm, int limit, bool activeOnly)
+        {
+            var customers = activeOnly ? Query.Where(c => c.IsActive) : Query;
+
+            return await BuildSearchQuery(customers, searchTerm)
+                .OrderBy(c => c.SearchFullName)
+                .ThenBy(c => c.Id)
+                .Take(limit)
+                .AsNoTracking()
                 .ToListAsync();
         }
 
         public async Task<IEnumerable<Customer>> GetActiveCustomersAsync()
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query.Where(c => c.IsActive).ToListAsync();
+            return await Query.Where(c => c.IsActive).ToListAsync();
         }
 
         public async Task<Customer?> GetWithAppointmentsAsync(int customerId)
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query
+            return await Query
                 .Include(c => c.Appointments)
                 .ThenInclude(a => a.ServiceType)
                 .FirstOrDefaultAsync(c => c.Id == customerId);
@@ -48,10 +57,28 @@ namespace BeautyCenterApi.Repositories
 
         public async Task<Customer?> GetWithPaymentsAsync(int customerId)
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query
+            return await Query
                 .Include(c => c.Payments)
                 .FirstOrDefaultAsync(c => c.Id == customerId);
         }
+
+        // Arama sütunlarında önek eşleşmesi; her dal kendi (TenantId, ...) indeksinde seek yapar
+        private IQueryable<Customer> BuildSearchQuery(IQueryable<Customer> customers, string searchTerm)
+        {
+            var term = searchTerm.Trim();
+
+            if (CustomerSearchNormalizer.LooksLikePhone(term))
+            {
+                var phone = CustomerSearchNormalizer.NormalizePhone(term);
+                return customers.Where(c => c.SearchPhone.StartsWith(phone));
+            }
+
+            var folded = CustomerSearchNormalizer.FoldName(term);
+            var byFullName = customers.Where(c => c.SearchFullName.StartsWith(folded));
+            var byLastName = customers.Where(c => c.SearchLastName.StartsWith(folded));
+            var byEmail = customers.Where(c => c.Email != null && c.Email.StartsWith(term));
+
+            return byFullName.Union(byLastName).Union(byEmail);
+        }
     }
 }
\ No newline at end of file
@@ -1,9 +1,9 @@
 using Microsoft.EntityFrameworkCore;
 using BeautyCenterApi.Data;
 using BeautyCenterApi.Interfaces;
+using BeautyCenterApi.Models;
 using BeautyCenterApi.Services;
 using System.Linq.Expressions;
-using System.Reflection;
 
 namespace BeautyCenterApi.Repositories
 {
@@ -20,64 +20,39 @@ namespace BeautyCenterApi.Repositories
             _tenantService = tenantService;
         }
 
-        protected IQueryable<T> ApplyTenantFilter(IQueryable<T> query)
-        {
-            // SuperAdmin ise tenant filtresi uygulama
-            if (_tenantService.IsSuperAdmin())
-                return query;
-
-            var currentTenantId = _tenantService.GetCurrentTenantId();
-            if (!currentTenantId.HasValue)
-                return query.Where(x => false); // Tenant bilgisi yoksa hiçbir kayıt döndürme
-
-            // T tipinde TenantId property'si varsa filtre uygula
-            var tenantIdProperty = typeof(T).GetProperty("TenantId");
-            if (tenantIdProperty != null)
-            {
-                var parameter = Expression.Parameter(typeof(T), "x");
-                var property = Expression.Property(parameter, tenantIdProperty);
-                var constant = Expression.Constant(currentTenantId.Value);
-                var equal = Expression.Equal(property, constant);
-                var lambda = Expression.Lambda<Func<T, bool>>(equal, parameter);
-
-                return query.Where(lambda);
-            }
-
-            return query;
-        }
+        // Okumalar bu sorgudan başlar: tenant filtresi global sorgu filtresiyle uygulanır,
+        // SuperAdmin için filtre açıkça kaldırılır (bkz. BeautyCenterDbContext.TenantScoped)
+        protected IQueryable<T> Query => _context.TenantScoped<T>();
 
         public async Task<IEnumerable<T>> GetAllAsync()
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query.ToListAsync();
+            return await Query.ToListAsync();
         }
 
         public async Task<T?> GetByIdAsync(int id)
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query.FirstOrDefaultAsync(e => EF.Property<int>(e, "Id") == id);
+            return await Query.FirstOrDefaultAsync(e => EF.Property<int>(e, "Id") == id);
         }
 
         public async Task<IEnumerable<T>> FindAsync(Expression<Func<T, bool>> predicate)
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query.Where(predicate).ToListAsync();
+            return await Query.Where(predicate).ToListAsync();
         }
 
         public async Task<T> AddAsync(T entity)
         {
-            // TenantId property'si varsa ve değer atanmamışsa mevcut tenant'ı ata
-            var tenantIdProperty = typeof(T).GetProperty("TenantId");
-            if (tenantIdProperty != null && !_tenantService.IsSuperAdmin())
+            // Tenant'a ait varlıkta TenantId atanmamışsa mevcut tenant'ı ata
+            var currentTenantId = _tenantService.GetCurrentTenantId();
+            if (currentTenantId.HasValue && !_tenantService.IsSuperAdmin())
             {
-                var currentTenantId = _tenantService.GetCurrentTenantId();
-                if (currentTenantId.HasValue)
+                switch (entity)
                 {
-                    var currentValue = tenantIdProperty.GetValue(entity);
-                    if (currentValue == null || (int)currentValue == 0)
-                    {
-                        tenantIdProperty.SetValue(entity, currentTenantId.Value);
-                    }
+                    case ITenantEntity tenantEntity when tenantEntity.TenantId == 0:
+                        tenantEntity.TenantId = currentTenantId.Value;
+                        break;
+                    case User user when user.TenantId == null:
+                        user.TenantId = currentTenantId.Value;
+                        break;
                 }
             }
 
@@ -104,19 +79,17 @@ namespace BeautyCenterApi.Repositories
 
         public async Task<bool> ExistsAsync(int id)
         {
-            return await _dbSet.FindAsync(id) != null;
+            return await Query.AnyAsync(e => EF.Property<int>(e, "Id") == id);
         }
 
         public async Task<int> CountAsync()
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query.CountAsync();
+            return await Query.CountAsync();
         }
 
         public async Task<int> CountAsync(Expression<Func<T, bool>> predicate)
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query.CountAsync(predicate);
+            return await Query.CountAsync(predicate);
         }
     }
 }
\ No newline at end of file
@@ -6,6 +6,7 @@ namespace BeautyCenterApi.Repositories
     {
         Task<IEnumerable<Tenant>> GetAllTenantsAsync();
         Task<Tenant?> GetTenantByIdAsync(int id);
+        Task<Tenant?> GetTenantInfoAsync(int id);
         Task<Tenant?> GetTenantBySubDomainAsync(string subDomain);
         Task<Tenant> CreateTenantAsync(Tenant tenant);
         Task<Tenant> UpdateTenantAsync(Tenant tenant);
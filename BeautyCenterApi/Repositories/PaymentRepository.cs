@@ -1,5 +1,6 @@
 using Microsoft.EntityFrameworkCore;
 using BeautyCenterApi.Data;
+using BeautyCenterApi.DTOs;
 using BeautyCenterApi.Interfaces;
 using BeautyCenterApi.Models;
 using BeautyCenterApi.Services;
@@ -15,8 +16,7 @@ namespace BeautyCenterApi.Repositories
 
         public new async Task<IEnumerable<Payment>> GetAllAsync()
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query
+            return await Query
                 .Include(p => p.Customer)
                 .Include(p => p.Appointment)
                     .ThenInclude(a => a!.ServiceType)
@@ -27,8 +27,7 @@ namespace BeautyCenterApi.Repositories
 
         public new async Task<Payment?> GetByIdAsync(int id)
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query
+            return await Query
                 .Include(p => p.Customer)
                 .Include(p => p.Appointment)
                     .ThenInclude(a => a!.ServiceType)
@@ -38,8 +37,7 @@ namespace BeautyCenterApi.Repositories
 
         public async Task<IEnumerable<Payment>> GetByCustomerIdAsync(int customerId)
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query
+            return await Query
                 .Include(p => p.Appointment)
                     .ThenInclude(a => a!.ServiceType)
                 .Include(p => p.Installments)
@@ -50,8 +48,7 @@ namespace BeautyCenterApi.Repositories
 
         public async Task<IEnumerable<Payment>> GetByAppointmentIdAsync(int appointmentId)
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query
+            return await Query
                 .Include(p => p.Installments)
                 .Where(p => p.AppointmentId == appointmentId)
                 .OrderByDescending(p => p.PaymentDate)
@@ -60,8 +57,7 @@ namespace BeautyCenterApi.Repositories
 
         public async Task<IEnumerable<Payment>> GetByDateRangeAsync(DateTime startDate, DateTime endDate)
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query
+            return await Query
                 .Include(p => p.Customer)
                 .Include(p => p.Appointment)
                     .ThenInclude(a => a!.ServiceType)
@@ -73,8 +69,7 @@ namespace BeautyCenterApi.Repositories
 
         public async Task<IEnumerable<Payment>> GetByPaymentMethodAsync(string paymentMethod)
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query
+            return await Query
                 .Include(p => p.Customer)
                 .Include(p => p.Appointment)
                     .ThenInclude(a => a!.ServiceType)
@@ -86,31 +81,125 @@ namespace BeautyCenterApi.Repositories
 
         public async Task<decimal> GetTotalPaymentsAsync(DateTime startDate, DateTime endDate)
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query
+            return await Query
                 .Where(p => p.PaymentDate >= startDate && p.PaymentDate <= endDate)
                 .SumAsync(p => p.PaidAmount);
         }
 
+        // Bakiyeler Customer satırında tutulur (BalanceBuilder); her çağrıda yeniden toplanmaz
         public async Task<decimal> GetCustomerTotalPaymentsAsync(int customerId)
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query
-                .Where(p => p.CustomerId == customerId)
-                .SumAsync(p => p.PaidAmount);
+            return await GetCustomerQuery(customerId)
+                .Select(c => c.TotalPaid)
+                .FirstOrDefaultAsync();
         }
 
         public async Task<decimal> GetCustomerRemainingBalanceAsync(int customerId)
         {
-            var tenantId = _tenantService.GetCurrentTenantId();
+            return await GetCustomerQuery(customerId)
+                .Select(c => c.RemainingBalance)
+                .FirstOrDefaultAsync();
+        }
+
+        private IQueryable<Customer> GetCustomerQuery(int customerId)
+        {
+            return _context.TenantScoped<Customer>().AsNoTracking().Where(c => c.Id == customerId);
+        }
+
+        public async Task<PagedResultDto<PaymentDto>> GetPagedAsync(PaymentQueryDto filter)
+        {
+            var pageSize = filter.GetEffectivePageSize();
+            var query = Query.AsNoTracking();
 
-            var totalAppointmentCost = await _context.Appointments
-                .Where(a => a.CustomerId == customerId && a.TenantId == tenantId)
-                .SumAsync(a => a.FinalPrice);
+            if (!string.IsNullOrWhiteSpace(filter.PaymentStatus))
+            {
+                var paymentStatus = filter.PaymentStatus;
+                query = query.Where(p => p.PaymentStatus == paymentStatus);
+            }
 
-            var totalPayments = await GetCustomerTotalPaymentsAsync(customerId);
+            if (!string.IsNullOrWhiteSpace(filter.PaymentMethod))
+            {
+                var paymentMethod = filter.PaymentMethod;
+                query = query.Where(p => p.PaymentMethod == paymentMethod);
+            }
+
+            if (filter.CustomerId.HasValue)
+            {
+                var customerId = filter.CustomerId.Value;
+                query = query.Where(p => p.CustomerId == customerId);
+            }
+
+            if (filter.StartDate.HasValue)
+            {
+                var startDate = filter.StartDate.Value;
+                query = query.Where(p => p.PaymentDate >= startDate);
+            }
+
+            if (filter.EndDate.HasValue)
+            {
+                var endDate = filter.EndDate.Value;
+                query = query.Where(p => p.PaymentDate < endDate);
+            }
+
+            if (!string.IsNullOrWhiteSpace(filter.Search))
+            {
+                var term = filter.Search.Trim();
+                query = query.Where(p =>
+                    (p.Customer.FirstName + " " + p.Customer.LastName).Contains(term) ||
+                    p.Customer.Phone.Contains(term) ||
+                    (p.ReferenceNumber != null && p.ReferenceNumber.Contains(term)));
+            }
+
+            // Keyset: (PaymentDate, Id) üzerinden son görülen satırın arkasından devam et
+            if (KeysetCursor.TryDecode(filter.Cursor, out var cursorDate, out var cursorId))
+            {
+                query = filter.Descending
+                    ? query.Where(p => p.PaymentDate < cursorDate || (p.PaymentDate == cursorDate && p.Id < cursorId))
+                    : query.Where(p => p.PaymentDate > cursorDate || (p.PaymentDate == cursorDate && p.Id > cursorId));
+            }
+
+            query = filter.Descending
+                ? query.OrderByDescending(p => p.PaymentDate).ThenByDescending(p => p.Id)
+                : query.OrderBy(p => p.PaymentDate).ThenBy(p => p.Id);
+
+            var rows = await query
+                .Take(pageSize + 1)
+                .Select(p => new PaymentDto
+                {
+                    Id = p.Id,
+                    CustomerId = p.CustomerId,
+                    AppointmentId = p.AppointmentId,
+                    TotalAmount = p.TotalAmount,
+                    PaidAmount = p.PaidAmount,
+                    RemainingAmount = p.RemainingAmount,
+                    PaymentMethod = p.PaymentMethod,
+                    PaymentStatus = p.PaymentStatus,
+                    PaymentDate = p.PaymentDate,
+                    Description = p.Description,
+                    ReferenceNumber = p.ReferenceNumber,
+                    CustomerName = p.Customer.FirstName + " " + p.Customer.LastName,
+                    CustomerPhone = p.Customer.Phone,
+                    ServiceTypeName = p.Appointment.ServiceType.Name,
+                    ServicePrice = p.Appointment.ServiceType.Price,
+                    AppointmentDate = p.Appointment.AppointmentDate,
+                    Installments = p.Installments
+                        .OrderBy(pi => pi.DueDate)
+                        .Select(pi => new PaymentInstallmentDto
+                        {
+                            Id = pi.Id,
+                            PaymentId = pi.PaymentId,
+                            Amount = pi.Amount,
+                            DueDate = pi.DueDate,
+                            PaidDate = pi.PaidDate,
+                            IsPaid = pi.IsPaid,
+                            PaymentMethod = pi.PaymentMethod,
+                            Notes = pi.Notes
+                        })
+                        .ToList()
+                })
+                .ToListAsync();
 
-            return totalAppointmentCost - totalPayments;
+            return PagedResultDto<PaymentDto>.Create(rows, pageSize, p => KeysetCursor.Encode(p.PaymentDate, p.Id));
         }
     }
 }
\ No newline at end of file
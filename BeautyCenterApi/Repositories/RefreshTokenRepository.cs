@@ -0,0 +1,54 @@
+using Microsoft.EntityFrameworkCore;
+using BeautyCenterApi.Data;
+using BeautyCenterApi.Interfaces;
+using BeautyCenterApi.Models;
+using BeautyCenterApi.Services;
+
+namespace BeautyCenterApi.Repositories
+{
+    public class RefreshTokenRepository : GenericRepository<RefreshToken>, IRefreshTokenRepository
+    {
+        public RefreshTokenRepository(BeautyCenterDbContext context, ITenantService tenantService)
+            : base(context, tenantService)
+        {
+        }
+
+        public async Task<RefreshToken?> GetByTokenHashAsync(string tokenHash)
+        {
+            // Yenileme isteği kimliksizdir; kullanıcı tenant filtresi uygulanmaz
+            return await _dbSet
+                .IgnoreQueryFilters()
+                .Include(r => r.User)
+                .FirstOrDefaultAsync(r => r.TokenHash == tokenHash);
+        }
+
+        // Koşullu güncelleme: aynı token'la gelen eşzamanlı iki istekten yalnızca biri token'ı döndürebilir
+        public async Task<bool> TryRevokeAsync(int id, string? replacedByTokenHash)
+        {
+            var now = DateTime.UtcNow;
+            var affected = await _dbSet
+                .Where(r => r.Id == id && r.RevokedAt == null)
+                .ExecuteUpdateAsync(s => s
+                    .SetProperty(r => r.RevokedAt, now)
+                    .SetProperty(r => r.ReplacedByTokenHash, replacedByTokenHash));
+
+            return affected == 1;
+        }
+
+        public async Task RevokeAllForUserAsync(int userId)
+        {
+            var now = DateTime.UtcNow;
+            await _dbSet
+                .Where(r => r.UserId == userId && r.RevokedAt == null)
+                .ExecuteUpdateAsync(s => s.SetProperty(r => r.RevokedAt, now));
+        }
+
+        public async Task DeleteExpiredForUserAsync(int userId)
+        {
+            var now = DateTime.UtcNow;
+            await _dbSet
+                .Where(r => r.UserId == userId && r.ExpiresAt < now)
+                .ExecuteDeleteAsync();
+        }
+    }
+}
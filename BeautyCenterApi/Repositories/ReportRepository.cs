@@ -0,0 +1,128 @@
+using Microsoft.EntityFrameworkCore;
+using BeautyCenterApi.Data;
+using BeautyCenterApi.DTOs;
+using BeautyCenterApi.Interfaces;
+using BeautyCenterApi.Models;
+
+namespace BeautyCenterApi.Repositories
+{
+    // Rapor verilerini günlük özet tablolarından okur; ham Payments/Appointments tablolarına dokunmaz.
+    // Tenant filtresi global sorgu filtreleriyle uygulanır (SuperAdmin için TenantScoped filtreyi kaldırır)
+    public class ReportRepository : IReportRepository
+    {
+        private readonly BeautyCenterDbContext _context;
+
+        public ReportRepository(BeautyCenterDbContext context)
+        {
+            _context = context;
+        }
+
+        // endDate hariç tutulur; saat bilgisi içeriyorsa o gün de dahil edilir
+        public async Task<ReportPeriodDto> GetPeriodSummaryAsync(DateTime? startDate, DateTime? endDate)
+        {
+            var paymentRollups = _context.TenantScoped<DailyPaymentRollup>().AsNoTracking();
+            var appointmentRollups = _context.TenantScoped<DailyAppointmentRollup>().AsNoTracking();
+            var customers = _context.TenantScoped<Customer>().AsNoTracking();
+
+            if (startDate.HasValue)
+            {
+                var from = startDate.Value.Date;
+                paymentRollups = paymentRollups.Where(r => r.Date >= from);
+                appointmentRollups = appointmentRollups.Where(r => r.Date >= from);
+                customers = customers.Where(c => c.CreatedAt >= from);
+            }
+
+            if (endDate.HasValue)
+            {
+                var to = endDate.Value.TimeOfDay == TimeSpan.Zero ? endDate.Value : endDate.Value.Date.AddDays(1);
+                paymentRollups = paymentRollups.Where(r => r.Date < to);
+                appointmentRollups = appointmentRollups.Where(r => r.Date < to);
+                customers = customers.Where(c => c.CreatedAt < to);
+            }
+
+            // Her iki sorgu da en fazla (hizmet x yöntem x durum) kadar satır döndürür
+            var paymentGroups = await paymentRollups
+                .GroupBy(r => new { r.PaymentMethod, r.PaymentStatus })
+                .Select(g => new
+                {
+                    g.Key.PaymentMethod,
+                    g.Key.PaymentStatus,
+                    Count = g.Sum(r => r.PaymentCount),
+                    Total = g.Sum(r => r.TotalAmount),
+                    Paid = g.Sum(r => r.PaidAmount),
+                    Remaining = g.Sum(r => r.RemainingAmount)
+                })
+                .ToListAsync();
+
+            var appointmentGroups = await appointmentRollups
+                .GroupBy(r => new { r.ServiceTypeId, r.Status })
+                .Select(g => new
+                {
+                    g.Key.ServiceTypeId,
+                    g.Key.Status,
+                    Count = g.Sum(r => r.AppointmentCount),
+                    Revenue = g.Sum(r => r.Revenue)
+                })
+                .ToListAsync();
+
+            var serviceTypeIds = appointmentGroups.Select(g => g.ServiceTypeId).Distinct().ToList();
+            var serviceNames = await _context.TenantScoped<ServiceType>()
+                .AsNoTracking()
+                .Where(s => serviceTypeIds.Contains(s.Id))
+                .Select(s => new { s.Id, s.Name })
+                .ToDictionaryAsync(s => s.Id, s => s.Name);
+
+            return new ReportPeriodDto
+            {
+                StartDate = startDate,
+                EndDate = endDate,
+                TotalRevenue = paymentGroups.Sum(g => g.Paid),
+                TotalBilled = paymentGroups.Sum(g => g.Total),
+                TotalRemaining = paymentGroups.Sum(g => g.Remaining),
+                PaymentCount = paymentGroups.Sum(g => g.Count),
+                AppointmentCount = appointmentGroups.Sum(g => g.Count),
+                AppointmentRevenue = appointmentGroups.Sum(g => g.Revenue),
+                NewCustomers = await customers.CountAsync(),
+                ServiceStats = appointmentGroups
+                    .GroupBy(g => g.ServiceTypeId)
+                    .Select(g => new ServiceStatDto
+                    {
+                        ServiceTypeId = g.Key,
+                        ServiceName = serviceNames.TryGetValue(g.Key, out var name) ? name : string.Empty,
+                        AppointmentCount = g.Sum(x => x.Count),
+                        Revenue = g.Sum(x => x.Revenue)
+                    })
+                    .OrderByDescending(s => s.Revenue)
+                    .ToList(),
+                PaymentMethodStats = paymentGroups
+                    .GroupBy(g => g.PaymentMethod)
+                    .Select(g => new PaymentMethodStatDto
+                    {
+                        PaymentMethod = g.Key,
+                        Count = g.Sum(x => x.Count),
+                        Amount = g.Sum(x => x.Paid)
+                    })
+                    .OrderByDescending(m => m.Amount)
+                    .ToList(),
+                AppointmentStatusStats = appointmentGroups
+                    .GroupBy(g => g.Status)
+                    .Select(g => new StatusCountDto { Status = g.Key, Count = g.Sum(x => x.Count) })
+                    .ToList(),
+                PaymentStatusStats = paymentGroups
+                    .GroupBy(g => g.PaymentStatus)
+                    .Select(g => new StatusCountDto { Status = g.Key, Count = g.Sum(x => x.Count) })
+                    .ToList()
+            };
+        }
+
+        public async Task<int> GetActiveCustomerCountAsync()
+        {
+            return await _context.TenantScoped<Customer>().AsNoTracking().CountAsync(c => c.IsActive);
+        }
+
+        public async Task RebuildAsync(int tenantId)
+        {
+            await ReportRollupBuilder.RebuildTenantAsync(_context, tenantId);
+        }
+    }
+}
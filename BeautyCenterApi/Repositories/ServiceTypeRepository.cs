@@ -15,20 +15,17 @@ namespace BeautyCenterApi.Repositories
 
         public async Task<IEnumerable<ServiceType>> GetActiveServicesAsync()
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query.Where(s => s.IsActive).ToListAsync();
+            return await Query.Where(s => s.IsActive).ToListAsync();
         }
 
         public async Task<ServiceType?> GetByNameAsync(string name)
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query.FirstOrDefaultAsync(s => s.Name == name);
+            return await Query.FirstOrDefaultAsync(s => s.Name == name);
         }
 
         public async Task<IEnumerable<ServiceType>> GetByPriceRangeAsync(decimal minPrice, decimal maxPrice)
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query
+            return await Query
                 .Where(s => s.Price >= minPrice && s.Price <= maxPrice && s.IsActive)
                 .ToListAsync();
         }
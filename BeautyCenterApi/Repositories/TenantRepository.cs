@@ -13,9 +13,12 @@ namespace BeautyCenterApi.Repositories
             _context = context;
         }
 
+        // Tenant yönetimi yalnızca SuperAdmin'e açıktır; dahil edilen kullanıcı ve müşteriler
+        // tenant filtresine takılmasın diye filtre açıkça kaldırılır
         public async Task<IEnumerable<Tenant>> GetAllTenantsAsync()
         {
             return await _context.Tenants
+                .IgnoreQueryFilters()
                 .Include(t => t.Users)
                 .OrderBy(t => t.Name)
                 .ToListAsync();
@@ -24,11 +27,20 @@ namespace BeautyCenterApi.Repositories
         public async Task<Tenant?> GetTenantByIdAsync(int id)
         {
             return await _context.Tenants
+                .IgnoreQueryFilters()
                 .Include(t => t.Users)
                 .Include(t => t.Customers)
                 .FirstOrDefaultAsync(t => t.Id == id);
         }
 
+        // Kullanıcı ve müşteri listeleri olmadan yalnızca tenant kaydı
+        public async Task<Tenant?> GetTenantInfoAsync(int id)
+        {
+            return await _context.Tenants
+                .AsNoTracking()
+                .FirstOrDefaultAsync(t => t.Id == id);
+        }
+
         public async Task<Tenant?> GetTenantBySubDomainAsync(string subDomain)
         {
             return await _context.Tenants
@@ -82,12 +94,14 @@ namespace BeautyCenterApi.Repositories
         public async Task<int> GetTenantUserCountAsync(int tenantId)
         {
             return await _context.Users
+                .IgnoreQueryFilters()
                 .CountAsync(u => u.TenantId == tenantId && u.IsActive);
         }
 
         public async Task<int> GetTenantCustomerCountAsync(int tenantId)
         {
             return await _context.Customers
+                .IgnoreQueryFilters()
                 .CountAsync(c => c.TenantId == tenantId && c.IsActive);
         }
     }
@@ -16,25 +16,25 @@ namespace BeautyCenterApi.Repositories
         public async Task<User?> GetByUsernameAsync(string username)
         {
             // Username ile giriş yaparken tenant filtresi uygulama (global olarak unique)
-            return await _dbSet.FirstOrDefaultAsync(u => u.Username == username);
+            return await _dbSet.IgnoreQueryFilters().FirstOrDefaultAsync(u => u.Username == username);
         }
 
         public async Task<User?> GetByEmailAsync(string email)
         {
             // Email ile giriş yaparken tenant filtresi uygulama (global olarak unique)
-            return await _dbSet.FirstOrDefaultAsync(u => u.Email == email);
+            return await _dbSet.IgnoreQueryFilters().FirstOrDefaultAsync(u => u.Email == email);
         }
 
         public async Task<IEnumerable<User>> GetActiveUsersAsync()
         {
-            var query = ApplyTenantFilter(_dbSet);
-            return await query.Where(u => u.IsActive).ToListAsync();
+            return await Query.Where(u => u.IsActive).ToListAsync();
         }
 
         public async Task<IEnumerable<User>> GetAllUsersAsync()
         {
             // SuperAdmin için tüm kullanıcıları döndür (tenant filtresi uygulama)
             return await _dbSet
+                .IgnoreQueryFilters()
                 .Include(u => u.Tenant)
                 .OrderByDescending(u => u.CreatedAt)
                 .ToListAsync();
@@ -42,12 +42,12 @@ namespace BeautyCenterApi.Repositories
 
         public async Task<int> GetUserCountAsync()
         {
-            return await _dbSet.CountAsync();
+            return await _dbSet.IgnoreQueryFilters().CountAsync();
         }
 
         public async Task<IEnumerable<User>> GetUsersByTenantAsync(int tenantId)
         {
-            return await _dbSet.Where(u => u.TenantId == tenantId && u.IsActive).ToListAsync();
+            return await _dbSet.IgnoreQueryFilters().Where(u => u.TenantId == tenantId && u.IsActive).ToListAsync();
         }
 
         public async Task<bool> ValidatePasswordAsync(string username, string password)
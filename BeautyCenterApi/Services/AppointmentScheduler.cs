@@ -0,0 +1,246 @@
+using BeautyCenterApi.Data;
+using BeautyCenterApi.DTOs;
+using BeautyCenterApi.Models;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.EntityFrameworkCore.ChangeTracking;
+
+namespace BeautyCenterApi.Services
+{
+    // Randevu müsaitliği ve çakışma kontrolü. Randevunun bitişi hizmet türünün süresinden hesaplanır;
+    // personel takvimi (TenantId, UserId, AppointmentDate) indeksinden tarih aralığı olarak okunur
+    public class AppointmentScheduler
+    {
+        private const string CancelledStatus = "Cancelled";
+
+        private readonly BeautyCenterDbContext _context;
+        private readonly TimeSpan _workdayStart;
+        private readonly TimeSpan _workdayEnd;
+        private readonly int _slotIntervalMinutes;
+        private readonly int _defaultDurationMinutes;
+        private readonly int _lockTimeoutMilliseconds;
+
+        public AppointmentScheduler(BeautyCenterDbContext context, IConfiguration configuration)
+        {
+            _context = context;
+            _workdayStart = configuration.GetValue("Scheduling:WorkdayStart", new TimeSpan(9, 0, 0));
+            _workdayEnd = configuration.GetValue("Scheduling:WorkdayEnd", new TimeSpan(19, 0, 0));
+            _slotIntervalMinutes = Math.Max(5, configuration.GetValue("Scheduling:SlotIntervalMinutes", 15));
+            _defaultDurationMinutes = Math.Max(5, configuration.GetValue("Scheduling:DefaultDurationMinutes", 30));
+            MaxRangeDays = configuration.GetValue("Scheduling:MaxRangeDays", 42);
+            _lockTimeoutMilliseconds = configuration.GetValue("Scheduling:LockTimeoutSeconds", 10) * 1000;
+        }
+
+        public int MaxRangeDays { get; }
+
+        // [startDate, endDate] günleri için çalışma saatleri içindeki boş başlangıç zamanları.
+        // Dolu aralıklar personel başına sıralanıp birleştirilir, slotlar tek geçişte taranır
+        public async Task<List<StaffAvailabilityDto>> GetAvailabilityAsync(ServiceType serviceType, DateTime startDate, DateTime endDate, int? userId, CancellationToken cancellationToken = default)
+        {
+            var tenantId = serviceType.TenantId;
+            var duration = TimeSpan.FromMinutes(GetDurationMinutes(serviceType.DurationMinutes));
+            var windowStart = startDate.Date;
+            var windowEnd = endDate.Date.AddDays(1);
+
+            var staffQuery = _context.Users
+                .IgnoreQueryFilters()
+                .AsNoTracking()
+                .Where(u => u.TenantId == tenantId && u.IsActive);
+
+            if (userId.HasValue)
+            {
+                var staffId = userId.Value;
+                staffQuery = staffQuery.Where(u => u.Id == staffId);
+            }
+
+            var staff = await staffQuery
+                .OrderBy(u => u.FirstName)
+                .ThenBy(u => u.LastName)
+                .Select(u => new { u.Id, Name = u.FirstName + " " + u.LastName })
+                .ToListAsync(cancellationToken);
+
+            if (staff.Count == 0)
+                return new List<StaffAvailabilityDto>();
+
+            var busyByUser = (await LoadBusyIntervalsAsync(tenantId, userId, windowStart, windowEnd, null, cancellationToken))
+                .GroupBy(i => i.UserId)
+                .ToDictionary(g => g.Key, g => MergeIntervals(g));
+
+            var now = DateTime.Now;
+            var result = new List<StaffAvailabilityDto>(staff.Count);
+
+            foreach (var member in staff)
+            {
+                var busy = busyByUser.TryGetValue(member.Id, out var intervals) ? intervals : new List<BusyInterval>();
+                var availability = new StaffAvailabilityDto { UserId = member.Id, UserName = member.Name };
+                var index = 0;
+
+                for (var day = windowStart; day < windowEnd; day = day.AddDays(1))
+                {
+                    var dayEnd = day + _workdayEnd;
+                    for (var slotStart = day + _workdayStart; slotStart + duration <= dayEnd; slotStart = slotStart.AddMinutes(_slotIntervalMinutes))
+                    {
+                        if (slotStart < now)
+                            continue;
+
+                        var slotEnd = slotStart + duration;
+
+                        // Aralıklar ayrık ve sıralı; slot başlangıcı ilerledikçe işaretçi geri dönmez
+                        while (index < busy.Count && busy[index].End <= slotStart)
+                            index++;
+
+                        if (index < busy.Count && busy[index].Start < slotEnd)
+                            continue;
+
+                        availability.Slots.Add(new AvailableSlotDto { Start = slotStart, End = slotEnd });
+                    }
+                }
+
+                result.Add(availability);
+            }
+
+            return result;
+        }
+
+        // Randevuyu çakışma kontrolüyle kaydeder. Aynı personelin takvimine yazan istekler uygulama kilidiyle
+        // sıraya girer; kontrol ve kayıt tek transaction içinde yapıldığından eşzamanlı iki istek aynı saati alamaz.
+        // Çakışma varsa hiçbir şey kaydedilmez ve çakışan randevu döner
+        public async Task<AppointmentConflictDto?> SaveAsync(Appointment appointment, CancellationToken cancellationToken = default)
+        {
+            if (_context.Entry(appointment).State == EntityState.Detached)
+                _context.Appointments.Add(appointment);
+
+            // Takvimi değiştirmeyen güncellemeler (durum, not, fiyat) kontrol edilmez; önceden çakışan kayıtlar da tamamlanabilmeli
+            if (appointment.Status == CancelledStatus || !AffectsCalendar(_context.Entry(appointment)))
+            {
+                await _context.SaveChangesAsync(cancellationToken);
+                return null;
+            }
+
+            var durationMinutes = await _context.ServiceTypes
+                .IgnoreQueryFilters()
+                .Where(s => s.Id == appointment.ServiceTypeId)
+                .Select(s => s.DurationMinutes)
+                .FirstOrDefaultAsync(cancellationToken);
+
+            var start = appointment.AppointmentDate;
+            var end = start.AddMinutes(GetDurationMinutes(durationMinutes));
+
+            await using var transaction = await _context.Database.BeginTransactionAsync(cancellationToken);
+            await AcquireCalendarLockAsync(appointment.TenantId, appointment.UserId, cancellationToken);
+
+            var conflict = (await LoadBusyIntervalsAsync(appointment.TenantId, appointment.UserId, start, end, appointment.Id, cancellationToken))
+                .Where(i => i.Start < end && i.End > start)
+                .OrderBy(i => i.Start)
+                .FirstOrDefault();
+
+            if (conflict != null)
+            {
+                // Transaction geri alınır, kilit bırakılır; eklenen kayıt da izlemeden çıkarılır
+                if (_context.Entry(appointment).State == EntityState.Added)
+                    _context.Entry(appointment).State = EntityState.Detached;
+
+                return new AppointmentConflictDto
+                {
+                    AppointmentId = conflict.AppointmentId,
+                    UserId = conflict.UserId,
+                    Start = conflict.Start,
+                    End = conflict.End
+                };
+            }
+
+            await _context.SaveChangesAsync(cancellationToken);
+            await transaction.CommitAsync(cancellationToken);
+            return null;
+        }
+
+        // Yeni randevu, saat/personel/hizmet (süre) değişikliği ya da iptalden geri alma takvimde yer kaplar
+        private static bool AffectsCalendar(EntityEntry<Appointment> entry)
+        {
+            if (entry.State == EntityState.Added)
+                return true;
+
+            return IsChanged(entry, nameof(Appointment.AppointmentDate))
+                || IsChanged(entry, nameof(Appointment.UserId))
+                || IsChanged(entry, nameof(Appointment.ServiceTypeId))
+                || Equals(entry.OriginalValues[nameof(Appointment.Status)], CancelledStatus);
+        }
+
+        private static bool IsChanged(EntityEntry entry, string propertyName)
+        {
+            return !Equals(entry.OriginalValues[propertyName], entry.CurrentValues[propertyName]);
+        }
+
+        // Aralığa başlangıcından önce başlayıp taşan randevular da girsin diye alt sınır tenant'ın en uzun hizmeti kadar geri çekilir
+        private async Task<List<BusyInterval>> LoadBusyIntervalsAsync(int tenantId, int? userId, DateTime windowStart, DateTime windowEnd,
+            int? excludeAppointmentId, CancellationToken cancellationToken)
+        {
+            var maxDurationMinutes = await _context.ServiceTypes
+                .IgnoreQueryFilters()
+                .Where(s => s.TenantId == tenantId)
+                .MaxAsync(s => (int?)s.DurationMinutes, cancellationToken) ?? 0;
+
+            var lowerBound = windowStart.AddMinutes(-Math.Max(maxDurationMinutes, _defaultDurationMinutes));
+
+            var query = _context.Appointments
+                .IgnoreQueryFilters()
+                .AsNoTracking()
+                .Where(a => a.TenantId == tenantId &&
+                            a.AppointmentDate >= lowerBound &&
+                            a.AppointmentDate < windowEnd &&
+                            a.Status != CancelledStatus);
+
+            if (userId.HasValue)
+            {
+                var staffId = userId.Value;
+                query = query.Where(a => a.UserId == staffId);
+            }
+
+            if (excludeAppointmentId is > 0)
+            {
+                var excludedId = excludeAppointmentId.Value;
+                query = query.Where(a => a.Id != excludedId);
+            }
+
+            var rows = await query
+                .Select(a => new { a.Id, a.UserId, a.AppointmentDate, a.ServiceType.DurationMinutes })
+                .ToListAsync(cancellationToken);
+
+            return rows
+                .Select(r => new BusyInterval(r.Id, r.UserId, r.AppointmentDate, r.AppointmentDate.AddMinutes(GetDurationMinutes(r.DurationMinutes))))
+                .Where(i => i.End > windowStart)
+                .ToList();
+        }
+
+        private Task AcquireCalendarLockAsync(int tenantId, int userId, CancellationToken cancellationToken)
+        {
+            return SqlAppLock.AcquireAsync(_context, $"appointments:{tenantId}:{userId}",
+                timeoutMilliseconds: _lockTimeoutMilliseconds, cancellationToken: cancellationToken);
+        }
+
+        private static List<BusyInterval> MergeIntervals(IEnumerable<BusyInterval> intervals)
+        {
+            var merged = new List<BusyInterval>();
+            foreach (var interval in intervals.OrderBy(i => i.Start))
+            {
+                if (merged.Count > 0 && interval.Start <= merged[^1].End)
+                {
+                    var last = merged[^1];
+                    if (interval.End > last.End)
+                        merged[^1] = last with { End = interval.End };
+                    continue;
+                }
+
+                merged.Add(interval);
+            }
+
+            return merged;
+        }
+
+        private int GetDurationMinutes(int durationMinutes)
+        {
+            return durationMinutes > 0 ? durationMinutes : _defaultDurationMinutes;
+        }
+
+        private record BusyInterval(int AppointmentId, int UserId, DateTime Start, DateTime End);
+    }
+}
@@ -1,53 +1,108 @@
 using System.IdentityModel.Tokens.Jwt;
 using System.Security.Claims;
+using System.Security.Cryptography;
 using System.Text;
+using Microsoft.AspNetCore.WebUtilities;
 using Microsoft.IdentityModel.Tokens;
 using BeautyCenterApi.Interfaces;
 using BeautyCenterApi.Models;
 
 namespace BeautyCenterApi.Services
 {
+    public class AuthResult
+    {
+        public User User { get; set; } = null!;
+        public string Token { get; set; } = string.Empty;
+        public DateTime ExpiresAt { get; set; }
+        public string RefreshToken { get; set; } = string.Empty;
+        public DateTime RefreshTokenExpiresAt { get; set; }
+    }
+
     public class AuthService
     {
+        // Döndürülmüş token'ın bu süre içinde tekrar gelmesi aynı istemcinin eşzamanlı isteği sayılır
+        private static readonly TimeSpan RefreshReuseGracePeriod = TimeSpan.FromSeconds(30);
+
         private readonly IUserRepository _userRepository;
+        private readonly IRefreshTokenRepository _refreshTokenRepository;
+        private readonly PasswordHasher _passwordHasher;
         private readonly IConfiguration _configuration;
+        private readonly ILogger<AuthService> _logger;
 
-        public AuthService(IUserRepository userRepository, IConfiguration configuration)
+        public AuthService(IUserRepository userRepository, IRefreshTokenRepository refreshTokenRepository, PasswordHasher passwordHasher,
+            IConfiguration configuration, ILogger<AuthService> logger)
         {
             _userRepository = userRepository;
+            _refreshTokenRepository = refreshTokenRepository;
+            _passwordHasher = passwordHasher;
             _configuration = configuration;
+            _logger = logger;
         }
 
-        public async Task<string?> LoginAsync(string username, string password)
+        public async Task<AuthResult?> LoginAsync(string username, string password, CancellationToken cancellationToken = default)
         {
-            Console.WriteLine($"=== LOGIN ATTEMPT ===");
-            Console.WriteLine($"Username: {username}");
-            Console.WriteLine($"Password: {password}");
-            
+            // Parola, özet ve reddedilen kullanıcı adları hiçbir zaman loglanmaz (yanlış alana yazılmış parola olabilir)
             var user = await _userRepository.GetByUsernameAsync(username);
-            if (user == null)
+            if (user == null || !user.IsActive)
             {
-                Console.WriteLine("User not found");
+                _logger.LogInformation("Login rejected: unknown or inactive user");
                 return null;
             }
-            
-            if (!user.IsActive)
+
+            if (!await _passwordHasher.VerifyAsync(password, user.PasswordHash, cancellationToken))
             {
-                Console.WriteLine("User is not active");
+                _logger.LogInformation("Login rejected for user {UserId}: invalid password", user.Id);
                 return null;
             }
 
-            Console.WriteLine($"User found: {user.Username}");
-            Console.WriteLine($"Stored hash: {user.PasswordHash}");
-            
-            bool isValidPassword = BCrypt.Net.BCrypt.Verify(password, user.PasswordHash);
-            Console.WriteLine($"Password valid: {isValidPassword}");
+            // İş faktörü değiştiyse parola yeni maliyetle şeffaf olarak yeniden özetlenir
+            if (_passwordHasher.NeedsRehash(user.PasswordHash))
+            {
+                user.PasswordHash = await _passwordHasher.HashAsync(password, cancellationToken);
+                user.UpdatedAt = DateTime.UtcNow;
+                await _userRepository.UpdateAsync(user);
+                _logger.LogInformation("Password hash of user {UserId} rehashed with the configured work factor", user.Id);
+            }
+
+            var result = await IssueTokensAsync(user);
+            _logger.LogInformation("Login succeeded for user {UserId}", user.Id);
+            return result;
+        }
+
+        // Yenileme token'ı her kullanımda yenisiyle değiştirilir; iptal edilmiş token tekrar gelirse
+        // çalınmış sayılır ve kullanıcının tüm oturumları kapatılır
+        public async Task<AuthResult?> RefreshAsync(string refreshToken)
+        {
+            var stored = await _refreshTokenRepository.GetByTokenHashAsync(HashToken(refreshToken));
+            if (stored == null)
+                return null;
+
+            if (stored.RevokedAt.HasValue)
+            {
+                if (stored.ReplacedByTokenHash != null && stored.RevokedAt.Value < DateTime.UtcNow - RefreshReuseGracePeriod)
+                {
+                    await _refreshTokenRepository.RevokeAllForUserAsync(stored.UserId);
+                    _logger.LogWarning("Rotated refresh token reused for user {UserId}; all sessions revoked", stored.UserId);
+                }
+
+                return null;
+            }
+
+            if (stored.ExpiresAt <= DateTime.UtcNow || !stored.User.IsActive)
+                return null;
 
-            if (!isValidPassword)
+            var (token, tokenHash) = CreateRefreshToken();
+            if (!await _refreshTokenRepository.TryRevokeAsync(stored.Id, tokenHash))
                 return null;
 
-            Console.WriteLine("Login successful, generating token");
-            return GenerateJwtToken(user);
+            return await IssueTokensAsync(stored.User, token, tokenHash);
+        }
+
+        public async Task LogoutAsync(string refreshToken)
+        {
+            var stored = await _refreshTokenRepository.GetByTokenHashAsync(HashToken(refreshToken));
+            if (stored != null && !stored.RevokedAt.HasValue)
+                await _refreshTokenRepository.TryRevokeAsync(stored.Id, null);
         }
 
         public async Task<User?> RegisterAsync(User user, string password)
@@ -62,7 +117,7 @@ namespace BeautyCenterApi.Services
                 return null;
 
             // Hash password
-            user.PasswordHash = BCrypt.Net.BCrypt.HashPassword(password);
+            user.PasswordHash = await _passwordHasher.HashAsync(password);
             user.CreatedAt = DateTime.UtcNow;
             user.IsActive = true; // Ensure user is active by default
 
@@ -74,7 +129,45 @@ namespace BeautyCenterApi.Services
             return await _userRepository.GetByUsernameAsync(username);
         }
 
-        private string GenerateJwtToken(User user)
+        private async Task<AuthResult> IssueTokensAsync(User user, string? refreshToken = null, string? refreshTokenHash = null)
+        {
+            if (refreshToken == null || refreshTokenHash == null)
+                (refreshToken, refreshTokenHash) = CreateRefreshToken();
+
+            var refreshTokenExpiresAt = DateTime.UtcNow.AddDays(_configuration.GetValue("Jwt:RefreshTokenDays", 14));
+
+            // Süresi dolmuş token'lar kullanıcı başına birikmesin
+            await _refreshTokenRepository.DeleteExpiredForUserAsync(user.Id);
+            await _refreshTokenRepository.AddAsync(new RefreshToken
+            {
+                UserId = user.Id,
+                TokenHash = refreshTokenHash,
+                ExpiresAt = refreshTokenExpiresAt
+            });
+
+            var expiresAt = DateTime.UtcNow.AddMinutes(_configuration.GetValue("Jwt:AccessTokenMinutes", 60));
+            return new AuthResult
+            {
+                User = user,
+                Token = GenerateJwtToken(user, expiresAt),
+                ExpiresAt = expiresAt,
+                RefreshToken = refreshToken,
+                RefreshTokenExpiresAt = refreshTokenExpiresAt
+            };
+        }
+
+        private static (string Token, string TokenHash) CreateRefreshToken()
+        {
+            var token = WebEncoders.Base64UrlEncode(RandomNumberGenerator.GetBytes(32));
+            return (token, HashToken(token));
+        }
+
+        private static string HashToken(string token)
+        {
+            return Convert.ToHexString(SHA256.HashData(Encoding.UTF8.GetBytes(token)));
+        }
+
+        private string GenerateJwtToken(User user, DateTime expiresAt)
         {
             var jwtKey = _configuration["Jwt:Key"];
             var jwtIssuer = _configuration["Jwt:Issuer"];
@@ -106,7 +199,7 @@ namespace BeautyCenterApi.Services
                 issuer: jwtIssuer,
                 audience: jwtAudience,
                 claims: claims,
-                expires: DateTime.Now.AddHours(24),
+                expires: expiresAt,
                 signingCredentials: creds);
 
             return new JwtSecurityTokenHandler().WriteToken(token);
@@ -0,0 +1,44 @@
+using BeautyCenterApi.Data;
+
+namespace BeautyCenterApi.Services
+{
+    // Denormalize bakiyeleri periyodik olarak ödemelerle karşılaştırır ve sapmaları düzeltir
+    public class BalanceReconciliationService : BackgroundService
+    {
+        private readonly IServiceScopeFactory _scopeFactory;
+        private readonly ILogger<BalanceReconciliationService> _logger;
+        private readonly TimeSpan _interval;
+
+        public BalanceReconciliationService(IServiceScopeFactory scopeFactory, IConfiguration configuration, ILogger<BalanceReconciliationService> logger)
+        {
+            _scopeFactory = scopeFactory;
+            _logger = logger;
+            _interval = TimeSpan.FromMinutes(configuration.GetValue("BalanceReconciliation:IntervalMinutes", 60));
+        }
+
+        protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+        {
+            using var timer = new PeriodicTimer(_interval);
+
+            while (await timer.WaitForNextTickAsync(stoppingToken))
+            {
+                try
+                {
+                    using var scope = _scopeFactory.CreateScope();
+                    var context = scope.ServiceProvider.GetRequiredService<BeautyCenterDbContext>();
+                    var result = await BalanceBuilder.ReconcileAsync(context, cancellationToken: stoppingToken);
+
+                    if (result.AppointmentsRepaired > 0 || result.CustomersRepaired > 0)
+                    {
+                        _logger.LogWarning("Balance drift repaired: {AppointmentCount} appointments, {CustomerCount} customers",
+                            result.AppointmentsRepaired, result.CustomersRepaired);
+                    }
+                }
+                catch (Exception ex) when (ex is not OperationCanceledException)
+                {
+                    _logger.LogError(ex, "Balance reconciliation failed");
+                }
+            }
+        }
+    }
+}
@@ -0,0 +1,185 @@
+using System.Globalization;
+using System.Text;
+using System.Text.Json;
+using BeautyCenterApi.Data;
+using BeautyCenterApi.DTOs;
+using Microsoft.EntityFrameworkCore;
+
+namespace BeautyCenterApi.Services
+{
+    // Tenant verisini sorgudan doğrudan yanıt akışına yazar; satırlar AsAsyncEnumerable ile tek tek okunur
+    // ve hiçbir aşamada liste olarak tutulmaz. Sütun adları içe aktarma ile aynıdır (dışa aktarılan dosya geri yüklenebilir)
+    public class BulkExportService
+    {
+        private const int FlushInterval = 1000;
+
+        private readonly BeautyCenterDbContext _context;
+
+        public BulkExportService(BeautyCenterDbContext context)
+        {
+            _context = context;
+        }
+
+        public async Task ExportCustomersAsync(Stream output, int tenantId, BulkFormat format, CancellationToken cancellationToken = default)
+        {
+            var customers = _context.Customers
+                .IgnoreQueryFilters()
+                .AsNoTracking()
+                .Where(c => c.TenantId == tenantId)
+                .OrderBy(c => c.Id)
+                .Select(c => new
+                {
+                    c.Id, c.FirstName, c.LastName, c.Phone, c.Email, c.Address, c.DateOfBirth, c.Gender, c.Notes, c.IsActive,
+                    c.TotalPaid, c.RemainingBalance, c.CreatedAt
+                })
+                .AsAsyncEnumerable();
+
+            await WriteAsync(output, format, new[]
+            {
+                "Id", "FirstName", "LastName", "Phone", "Email", "Address", "BirthDate", "Gender", "Notes", "IsActive",
+                "TotalPaid", "RemainingBalance", "CreatedAt"
+            }, customers, c => new object?[]
+            {
+                c.Id, c.FirstName, c.LastName, c.Phone, c.Email, c.Address, c.DateOfBirth, c.Gender, c.Notes, c.IsActive,
+                c.TotalPaid, c.RemainingBalance, c.CreatedAt
+            }, cancellationToken);
+        }
+
+        public async Task ExportAppointmentsAsync(Stream output, int tenantId, BulkFormat format, CancellationToken cancellationToken = default)
+        {
+            var appointments = _context.Appointments
+                .IgnoreQueryFilters()
+                .AsNoTracking()
+                .Where(a => a.TenantId == tenantId)
+                .OrderBy(a => a.Id)
+                .Select(a => new
+                {
+                    a.Id, a.CustomerId, CustomerPhone = a.Customer.Phone, a.ServiceTypeId, ServiceTypeName = a.ServiceType.Name,
+                    a.UserId, a.User.Username, a.AppointmentDate, a.Status, a.TotalPrice, a.DiscountAmount, a.FinalPrice,
+                    a.PaidAmount, a.RemainingAmount, a.SessionsTotal, a.SessionsCompleted, a.Notes, a.CreatedAt
+                })
+                .AsAsyncEnumerable();
+
+            await WriteAsync(output, format, new[]
+            {
+                "Id", "CustomerId", "CustomerPhone", "ServiceTypeId", "ServiceTypeName", "UserId", "Username",
+                "AppointmentDate", "Status", "TotalPrice", "DiscountAmount", "FinalPrice", "PaidAmount", "RemainingAmount",
+                "SessionsTotal", "SessionsCompleted", "Notes", "CreatedAt"
+            }, appointments, a => new object?[]
+            {
+                a.Id, a.CustomerId, a.CustomerPhone, a.ServiceTypeId, a.ServiceTypeName, a.UserId, a.Username,
+                a.AppointmentDate, a.Status, a.TotalPrice, a.DiscountAmount, a.FinalPrice, a.PaidAmount, a.RemainingAmount,
+                a.SessionsTotal, a.SessionsCompleted, a.Notes, a.CreatedAt
+            }, cancellationToken);
+        }
+
+        public async Task ExportPaymentsAsync(Stream output, int tenantId, BulkFormat format, CancellationToken cancellationToken = default)
+        {
+            var payments = _context.Payments
+                .IgnoreQueryFilters()
+                .AsNoTracking()
+                .Where(p => p.TenantId == tenantId)
+                .OrderBy(p => p.Id)
+                .Select(p => new
+                {
+                    p.Id, p.CustomerId, p.AppointmentId, p.TotalAmount, p.PaidAmount, p.RemainingAmount, p.PaymentMethod,
+                    p.PaymentStatus, p.PaymentDate, p.Description, p.ReferenceNumber, p.CreatedAt,
+                    Installments = p.Installments
+                        .OrderBy(i => i.DueDate)
+                        .Select(i => new BulkInstallmentDto
+                        {
+                            Amount = i.Amount,
+                            DueDate = i.DueDate,
+                            PaidDate = i.PaidDate,
+                            IsPaid = i.IsPaid,
+                            PaymentMethod = i.PaymentMethod,
+                            Notes = i.Notes
+                        })
+                        .ToList()
+                })
+                .AsAsyncEnumerable();
+
+            await WriteAsync(output, format, new[]
+            {
+                "Id", "CustomerId", "AppointmentId", "TotalAmount", "PaidAmount", "RemainingAmount", "PaymentMethod",
+                "PaymentStatus", "PaymentDate", "Description", "ReferenceNumber", "CreatedAt", "Installments"
+            }, payments, p => new object?[]
+            {
+                p.Id, p.CustomerId, p.AppointmentId, p.TotalAmount, p.PaidAmount, p.RemainingAmount, p.PaymentMethod,
+                p.PaymentStatus, p.PaymentDate, p.Description, p.ReferenceNumber, p.CreatedAt, p.Installments
+            }, cancellationToken);
+        }
+
+        private static async Task WriteAsync<T>(Stream output, BulkFormat format, string[] columns, IAsyncEnumerable<T> rows,
+            Func<T, object?[]> getValues, CancellationToken cancellationToken)
+        {
+            await using var writer = new StreamWriter(output, new UTF8Encoding(false), bufferSize: 64 * 1024, leaveOpen: true);
+
+            if (format == BulkFormat.Csv)
+                await writer.WriteLineAsync(string.Join(",", columns.Select(EscapeCsv)));
+
+            var count = 0;
+            var line = new StringBuilder();
+            await foreach (var item in rows.WithCancellation(cancellationToken))
+            {
+                var row = getValues(item);
+                line.Clear();
+                if (format == BulkFormat.Csv)
+                    AppendCsvRow(line, row);
+                else
+                    AppendJsonRow(line, columns, row);
+
+                await writer.WriteLineAsync(line, cancellationToken);
+
+                if (++count % FlushInterval == 0)
+                    await writer.FlushAsync(cancellationToken);
+            }
+
+            await writer.FlushAsync(cancellationToken);
+        }
+
+        private static void AppendCsvRow(StringBuilder line, object?[] row)
+        {
+            for (var i = 0; i < row.Length; i++)
+            {
+                if (i > 0)
+                    line.Append(',');
+
+                line.Append(EscapeCsv(FormatValue(row[i])));
+            }
+        }
+
+        private static void AppendJsonRow(StringBuilder line, string[] columns, object?[] row)
+        {
+            var values = new Dictionary<string, object?>(columns.Length);
+            for (var i = 0; i < columns.Length; i++)
+            {
+                values[columns[i]] = row[i];
+            }
+
+            line.Append(JsonSerializer.Serialize(values));
+        }
+
+        private static string FormatValue(object? value)
+        {
+            return value switch
+            {
+                null => string.Empty,
+                DateTime date => date.ToString("O", CultureInfo.InvariantCulture),
+                bool flag => flag ? "true" : "false",
+                IFormattable formattable => formattable.ToString(null, CultureInfo.InvariantCulture),
+                string text => text,
+                // Taksitler CSV hücresinde JSON dizisi olarak yazılır
+                _ => JsonSerializer.Serialize(value)
+            };
+        }
+
+        private static string EscapeCsv(string value)
+        {
+            if (value.IndexOfAny(new[] { ',', '"', '\n', '\r', ';' }) < 0)
+                return value;
+
+            return $"\"{value.Replace("\"", "\"\"")}\"";
+        }
+    }
+}
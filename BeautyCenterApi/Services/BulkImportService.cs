@@ -0,0 +1,578 @@
+using System.ComponentModel.DataAnnotations;
+using System.Text.Json;
+using BeautyCenterApi.Data;
+using BeautyCenterApi.DTOs;
+using BeautyCenterApi.Models;
+using Microsoft.EntityFrameworkCore;
+
+namespace BeautyCenterApi.Services
+{
+    // Toplu içe aktarma: kayıtlar akıştan partiler halinde okunur, parti bazında doğrulanır ve
+    // tek SaveChanges ile yazılır. Her partiden sonra ChangeTracker temizlenir; bellek kullanımı
+    // dosya boyutundan bağımsızdır. Arama sütunları SaveChanges kancasıyla parti başına güncellenir;
+    // rapor özetleri ve bakiyeler partilerde askıya alınır ve içe aktarma sonunda tenant ve tarih aralığı
+    // için küme bazlı tek seferde yeniden hesaplanır
+    public class BulkImportService
+    {
+        public const int DefaultBatchSize = 500;
+        public const int MaxBatchSize = 5000;
+        private const int MaxReportedErrors = 1000;
+
+        private static readonly string[] AppointmentStatuses = { "Scheduled", "Completed", "Cancelled", "NoShow" };
+        private static readonly string[] PaymentStatuses = { "Completed", "Partial", "Pending" };
+        private static readonly EmailAddressAttribute EmailValidator = new();
+        private static readonly JsonSerializerOptions InstallmentJsonOptions = new() { PropertyNameCaseInsensitive = true };
+
+        private readonly BeautyCenterDbContext _context;
+        private readonly ILogger<BulkImportService> _logger;
+
+        // Kaydedilen randevu/ödeme tarihlerinin aralığı; türetilmiş veriler bu aralık için yenilenir
+        private DateTime? _importedFrom;
+        private DateTime? _importedTo;
+
+        public BulkImportService(BeautyCenterDbContext context, ILogger<BulkImportService> logger)
+        {
+            _context = context;
+            _logger = logger;
+        }
+
+        public Task<BulkImportResultDto> ImportCustomersAsync(IAsyncEnumerable<BulkRecord> records, int tenantId, int batchSize, CancellationToken cancellationToken = default)
+        {
+            return ImportAsync("customers", tenantId, records, batchSize,
+                (batch, result) => ImportCustomerBatchAsync(batch, tenantId, result, cancellationToken), cancellationToken);
+        }
+
+        public Task<BulkImportResultDto> ImportAppointmentsAsync(IAsyncEnumerable<BulkRecord> records, int tenantId, int batchSize, CancellationToken cancellationToken = default)
+        {
+            // Hizmet türleri ve kullanıcılar tenant başına az sayıdadır; içe aktarma boyunca bir kez yüklenir
+            var lookups = new Lazy<Task<AppointmentLookups>>(() => LoadAppointmentLookupsAsync(tenantId, cancellationToken));
+
+            return ImportAsync("appointments", tenantId, records, batchSize,
+                async (batch, result) => await ImportAppointmentBatchAsync(batch, tenantId, await lookups.Value, result, cancellationToken), cancellationToken);
+        }
+
+        public Task<BulkImportResultDto> ImportPaymentsAsync(IAsyncEnumerable<BulkRecord> records, int tenantId, int batchSize, CancellationToken cancellationToken = default)
+        {
+            return ImportAsync("payments", tenantId, records, batchSize,
+                (batch, result) => ImportPaymentBatchAsync(batch, tenantId, result, cancellationToken), cancellationToken);
+        }
+
+        private async Task<BulkImportResultDto> ImportAsync(string entity, int tenantId, IAsyncEnumerable<BulkRecord> records, int batchSize,
+            Func<List<BulkRecord>, BulkImportResultDto, Task> importBatch, CancellationToken cancellationToken)
+        {
+            batchSize = Math.Clamp(batchSize, 1, MaxBatchSize);
+            var result = new BulkImportResultDto { Entity = entity };
+            var batch = new List<BulkRecord>(batchSize);
+            _importedFrom = null;
+            _importedTo = null;
+
+            _context.DerivedDataRefreshSuspended = true;
+            try
+            {
+                await foreach (var record in records.WithCancellation(cancellationToken))
+                {
+                    result.TotalRows++;
+                    if (!record.IsValid)
+                    {
+                        AddErrors(result, record);
+                        continue;
+                    }
+
+                    batch.Add(record);
+                    if (batch.Count >= batchSize)
+                    {
+                        await importBatch(batch, result);
+                        batch.Clear();
+                    }
+                }
+
+                if (batch.Count > 0)
+                    await importBatch(batch, result);
+            }
+            finally
+            {
+                _context.DerivedDataRefreshSuspended = false;
+            }
+
+            await RefreshDerivedDataAsync(entity, tenantId, cancellationToken);
+
+            _logger.LogInformation("Bulk import of {Entity} finished: {Imported}/{Total} rows imported, {Failed} failed",
+                entity, result.ImportedRows, result.TotalRows, result.FailedRows);
+
+            return result;
+        }
+
+        private async Task ImportCustomerBatchAsync(List<BulkRecord> batch, int tenantId, BulkImportResultDto result, CancellationToken cancellationToken)
+        {
+            var rows = new List<(BulkRecord Record, Customer Customer)>(batch.Count);
+            foreach (var record in batch)
+            {
+                var customer = new Customer
+                {
+                    TenantId = tenantId,
+                    FirstName = record.RequiredString("FirstName", 100),
+                    LastName = record.RequiredString("LastName", 100),
+                    Phone = record.RequiredString("Phone", 15),
+                    Email = record.OptionalString("Email", 150),
+                    Address = record.OptionalString("Address", 500),
+                    DateOfBirth = record.Get("BirthDate") != null ? record.Date("BirthDate") : record.Date("DateOfBirth"),
+                    Gender = record.OptionalString("Gender", 10),
+                    Notes = record.OptionalString("Notes", 1000),
+                    IsActive = record.Bool("IsActive") ?? true,
+                    CreatedAt = DateTime.UtcNow
+                };
+
+                if (customer.Email != null && !EmailValidator.IsValid(customer.Email))
+                    record.Errors.Add("Email is not a valid e-mail address");
+
+                if (customer.Phone.Length > 0 && CustomerSearchNormalizer.NormalizePhone(customer.Phone).Length == 0)
+                    record.Errors.Add("Phone must contain digits");
+
+                rows.Add((record, customer));
+            }
+
+            // Telefon benzersizliği: önceki partiler zaten kaydedildiği için veritabanı kontrolü dosya içi tekrarları da yakalar
+            var phones = rows
+                .Where(r => r.Record.IsValid)
+                .Select(r => CustomerSearchNormalizer.NormalizePhone(r.Customer.Phone))
+                .Distinct()
+                .ToList();
+            var existingPhones = (await _context.Customers
+                .IgnoreQueryFilters()
+                .Where(c => c.TenantId == tenantId && phones.Contains(c.SearchPhone))
+                .Select(c => c.SearchPhone)
+                .ToListAsync(cancellationToken))
+                .ToHashSet();
+
+            foreach (var (record, customer) in rows.Where(r => r.Record.IsValid))
+            {
+                if (!existingPhones.Add(CustomerSearchNormalizer.NormalizePhone(customer.Phone)))
+                    record.Errors.Add("A customer with this phone number already exists");
+            }
+
+            await SaveBatchAsync(rows.Select(r => (r.Record, (object)r.Customer)).ToList(), result, cancellationToken);
+        }
+
+        private async Task ImportAppointmentBatchAsync(List<BulkRecord> batch, int tenantId, AppointmentLookups lookups, BulkImportResultDto result, CancellationToken cancellationToken)
+        {
+            // Müşteriler Id veya telefonla eşlenebilir (başka sistemden gelen dosyalarda Id bulunmaz)
+            var customerIds = PeekIds(batch, "CustomerId");
+            var customerPhones = batch
+                .Select(r => r.Get("CustomerPhone"))
+                .Where(phone => phone != null)
+                .Select(phone => CustomerSearchNormalizer.NormalizePhone(phone))
+                .Distinct()
+                .ToList();
+
+            var knownCustomerIds = (await _context.Customers
+                .IgnoreQueryFilters()
+                .Where(c => c.TenantId == tenantId && customerIds.Contains(c.Id))
+                .Select(c => c.Id)
+                .ToListAsync(cancellationToken))
+                .ToHashSet();
+            var customersByPhone = (await _context.Customers
+                .IgnoreQueryFilters()
+                .Where(c => c.TenantId == tenantId && customerPhones.Contains(c.SearchPhone))
+                .Select(c => new { c.Id, c.SearchPhone })
+                .ToListAsync(cancellationToken))
+                .GroupBy(c => c.SearchPhone)
+                .ToDictionary(g => g.Key, g => g.Min(c => c.Id));
+
+            var rows = new List<(BulkRecord Record, object Entity)>(batch.Count);
+            foreach (var record in batch)
+            {
+                var customerId = ResolveCustomerId(record, knownCustomerIds, customersByPhone);
+                var serviceType = ResolveServiceType(record, lookups);
+                var userId = ResolveUserId(record, lookups);
+
+                var status = record.OptionalString("Status", 50) ?? "Scheduled";
+                if (!AppointmentStatuses.Contains(status, StringComparer.OrdinalIgnoreCase))
+                    record.Errors.Add($"Status must be one of: {string.Join(", ", AppointmentStatuses)}");
+                status = AppointmentStatuses.FirstOrDefault(s => s.Equals(status, StringComparison.OrdinalIgnoreCase)) ?? status;
+
+                var totalPrice = record.Decimal("TotalPrice") ?? serviceType?.Price ?? 0;
+                var discount = record.Decimal("DiscountAmount");
+                var finalPrice = record.Decimal("FinalPrice") ?? totalPrice - (discount ?? 0);
+                if (totalPrice < 0 || finalPrice < 0 || discount < 0)
+                    record.Errors.Add("Prices cannot be negative");
+
+                var sessionsTotal = record.Int("SessionsTotal");
+                var sessionsCompleted = record.Int("SessionsCompleted");
+
+                var appointment = new Appointment
+                {
+                    TenantId = tenantId,
+                    CustomerId = customerId ?? 0,
+                    ServiceTypeId = serviceType?.Id ?? 0,
+                    UserId = userId ?? 0,
+                    AppointmentDate = record.Date("AppointmentDate", required: true) ?? default,
+                    Status = status,
+                    TotalPrice = totalPrice,
+                    DiscountAmount = discount,
+                    FinalPrice = finalPrice,
+                    SessionsTotal = sessionsTotal,
+                    SessionsCompleted = sessionsCompleted,
+                    SessionsRemaining = sessionsTotal.HasValue ? sessionsTotal.Value - (sessionsCompleted ?? 0) : null,
+                    Notes = record.OptionalString("Notes", 1000),
+                    CreatedAt = DateTime.UtcNow
+                };
+
+                rows.Add((record, appointment));
+            }
+
+            await SaveBatchAsync(rows, result, cancellationToken);
+        }
+
+        private async Task ImportPaymentBatchAsync(List<BulkRecord> batch, int tenantId, BulkImportResultDto result, CancellationToken cancellationToken)
+        {
+            var appointmentIds = PeekIds(batch, "AppointmentId");
+            var appointments = await _context.Appointments
+                .IgnoreQueryFilters()
+                .Where(a => a.TenantId == tenantId && appointmentIds.Contains(a.Id))
+                .Select(a => new { a.Id, a.CustomerId, a.FinalPrice })
+                .ToDictionaryAsync(a => a.Id, cancellationToken);
+
+            var rows = new List<(BulkRecord Record, object Entity)>(batch.Count);
+            foreach (var record in batch)
+            {
+                var appointmentId = record.Int("AppointmentId", required: true);
+                var appointment = appointmentId.HasValue && appointments.TryGetValue(appointmentId.Value, out var found) ? found : null;
+                if (appointmentId.HasValue && appointment == null)
+                    record.Errors.Add($"Appointment {appointmentId} not found");
+
+                var customerId = record.Int("CustomerId");
+                if (appointment != null && customerId.HasValue && customerId != appointment.CustomerId)
+                    record.Errors.Add("CustomerId does not match the appointment's customer");
+
+                var totalAmount = record.Decimal("TotalAmount") ?? appointment?.FinalPrice ?? 0;
+                var paidAmount = record.Decimal("PaidAmount", required: true) ?? 0;
+                if (totalAmount < 0 || paidAmount < 0)
+                    record.Errors.Add("Amounts cannot be negative");
+
+                var status = record.OptionalString("PaymentStatus", 50)
+                    ?? (paidAmount >= totalAmount ? "Completed" : "Partial");
+                if (!PaymentStatuses.Contains(status, StringComparer.OrdinalIgnoreCase))
+                    record.Errors.Add($"PaymentStatus must be one of: {string.Join(", ", PaymentStatuses)}");
+                status = PaymentStatuses.FirstOrDefault(s => s.Equals(status, StringComparison.OrdinalIgnoreCase)) ?? status;
+
+                var paymentMethod = record.OptionalString("PaymentMethod", 50) ?? "Nakit";
+
+                var payment = new Payment
+                {
+                    TenantId = tenantId,
+                    CustomerId = appointment?.CustomerId ?? 0,
+                    AppointmentId = appointment?.Id ?? 0,
+                    TotalAmount = totalAmount,
+                    PaidAmount = paidAmount,
+                    RemainingAmount = totalAmount - paidAmount,
+                    PaymentMethod = paymentMethod,
+                    PaymentStatus = status,
+                    PaymentDate = record.Date("PaymentDate", required: true) ?? default,
+                    Description = record.OptionalString("Description", 500),
+                    ReferenceNumber = record.OptionalString("ReferenceNumber", 100),
+                    CreatedAt = DateTime.UtcNow
+                };
+
+                foreach (var installment in ParseInstallments(record, paymentMethod))
+                {
+                    payment.Installments.Add(installment);
+                }
+
+                rows.Add((record, payment));
+            }
+
+            await SaveBatchAsync(rows, result, cancellationToken);
+        }
+
+        // Geçerli satırlar tek SaveChanges ile yazılır; parti hata verirse hatalı satırı bulmak için satır satır yeniden denenir.
+        // Türetilmiş veri kilidi zaman aşımına uğrarsa (SqlAppLock) parti hatalı sayılır ve sonraki partiyle devam edilir
+        private async Task SaveBatchAsync(List<(BulkRecord Record, object Entity)> rows, BulkImportResultDto result, CancellationToken cancellationToken)
+        {
+            var validRows = new List<(BulkRecord Record, object Entity)>(rows.Count);
+            foreach (var row in rows)
+            {
+                if (row.Record.IsValid)
+                    validRows.Add(row);
+                else
+                    AddErrors(result, row.Record);
+            }
+
+            if (validRows.Count == 0)
+                return;
+
+            try
+            {
+                _context.AddRange(validRows.Select(r => r.Entity));
+                await _context.SaveChangesAsync(cancellationToken);
+                result.ImportedRows += validRows.Count;
+                foreach (var (_, entity) in validRows)
+                {
+                    TrackImportedDate(entity);
+                }
+                return;
+            }
+            catch (DbUpdateException ex)
+            {
+                _logger.LogWarning(ex, "Bulk import batch of {Count} rows failed, retrying row by row", validRows.Count);
+            }
+            catch (TimeoutException ex)
+            {
+                // Satır satır denemek aynı kilitleri yeniden bekler; partinin tamamı hatalı olarak raporlanır
+                _logger.LogWarning(ex, "Bulk import batch of {Count} rows timed out waiting for a lock", validRows.Count);
+                foreach (var (record, _) in validRows)
+                {
+                    record.Errors.Add($"Batch could not be saved: {ex.Message}");
+                    AddErrors(result, record);
+                }
+                return;
+            }
+            finally
+            {
+                _context.ChangeTracker.Clear();
+            }
+
+            foreach (var (record, entity) in validRows)
+            {
+                try
+                {
+                    _context.Add(entity);
+                    await _context.SaveChangesAsync(cancellationToken);
+                    result.ImportedRows++;
+                    TrackImportedDate(entity);
+                }
+                catch (DbUpdateException ex)
+                {
+                    record.Errors.Add(ex.InnerException?.Message ?? ex.Message);
+                    AddErrors(result, record);
+                }
+                catch (TimeoutException ex)
+                {
+                    record.Errors.Add(ex.Message);
+                    AddErrors(result, record);
+                }
+                finally
+                {
+                    _context.ChangeTracker.Clear();
+                }
+            }
+        }
+
+        private void TrackImportedDate(object entity)
+        {
+            DateTime date;
+            switch (entity)
+            {
+                case Appointment appointment:
+                    date = appointment.AppointmentDate.Date;
+                    break;
+                case Payment payment:
+                    date = payment.PaymentDate.Date;
+                    break;
+                default:
+                    return;
+            }
+
+            if (!_importedFrom.HasValue || date < _importedFrom)
+                _importedFrom = date;
+            if (!_importedTo.HasValue || date > _importedTo)
+                _importedTo = date;
+        }
+
+        // Partiler bakiyeleri ve özetleri yenilemeden yazıldı; içe aktarılan tenant için bakiyeler tek küme bazlı
+        // düzeltmeyle, özetler kaydedilen tarih aralığı için yeniden hesaplanır. Müşteri satırları yeni olduğundan
+        // bakiyeleri zaten sıfırdır
+        private async Task RefreshDerivedDataAsync(string entity, int tenantId, CancellationToken cancellationToken)
+        {
+            if (!_importedFrom.HasValue || !_importedTo.HasValue)
+                return;
+
+            try
+            {
+                var balances = await BalanceBuilder.ReconcileAsync(_context, tenantId, cancellationToken);
+                await ReportRollupBuilder.RefreshRangeAsync(_context, tenantId, _importedFrom.Value, _importedTo.Value.AddDays(1), cancellationToken);
+
+                _logger.LogInformation("Derived data refreshed after {Entity} import for tenant {TenantId}: {Appointments} appointment and {Customers} customer balances, rollups {From:yyyy-MM-dd}..{To:yyyy-MM-dd}",
+                    entity, tenantId, balances.AppointmentsRepaired, balances.CustomersRepaired, _importedFrom, _importedTo);
+            }
+            catch (TimeoutException ex)
+            {
+                // Kayıtlar yazılmıştır; kalan sapmayı periyodik bakiye düzeltmesi ve özet yeniden oluşturma giderir
+                _logger.LogWarning(ex, "Derived data refresh after {Entity} import for tenant {TenantId} timed out", entity, tenantId);
+                _context.ChangeTracker.Clear();
+            }
+        }
+
+        private async Task<AppointmentLookups> LoadAppointmentLookupsAsync(int tenantId, CancellationToken cancellationToken)
+        {
+            var serviceTypes = await _context.ServiceTypes
+                .IgnoreQueryFilters()
+                .AsNoTracking()
+                .Where(s => s.TenantId == tenantId)
+                .Select(s => new ServiceTypeLookup(s.Id, s.Name, s.Price))
+                .ToListAsync(cancellationToken);
+
+            var users = await _context.Users
+                .IgnoreQueryFilters()
+                .AsNoTracking()
+                .Where(u => u.TenantId == tenantId)
+                .Select(u => new { u.Id, u.Username })
+                .ToListAsync(cancellationToken);
+
+            return new AppointmentLookups(
+                serviceTypes.ToDictionary(s => s.Id),
+                serviceTypes.GroupBy(s => s.Name, StringComparer.OrdinalIgnoreCase).ToDictionary(g => g.Key, g => g.First(), StringComparer.OrdinalIgnoreCase),
+                users.Select(u => u.Id).ToHashSet(),
+                users.ToDictionary(u => u.Username, u => u.Id, StringComparer.OrdinalIgnoreCase));
+        }
+
+        // Parti sorguları için Id'leri toplar; geçersiz değerler satır doğrulanırken raporlanır
+        private static List<int> PeekIds(List<BulkRecord> batch, string name)
+        {
+            var ids = new HashSet<int>();
+            foreach (var record in batch)
+            {
+                if (int.TryParse(record.Get(name), out var id))
+                    ids.Add(id);
+            }
+
+            return ids.ToList();
+        }
+
+        private static int? ResolveCustomerId(BulkRecord record, HashSet<int> knownCustomerIds, Dictionary<string, int> customersByPhone)
+        {
+            var customerId = record.Int("CustomerId");
+            if (customerId.HasValue)
+            {
+                if (knownCustomerIds.Contains(customerId.Value))
+                    return customerId;
+
+                record.Errors.Add($"Customer {customerId} not found");
+                return null;
+            }
+
+            var phone = record.Get("CustomerPhone");
+            if (phone == null)
+            {
+                record.Errors.Add("CustomerId or CustomerPhone is required");
+                return null;
+            }
+
+            if (customersByPhone.TryGetValue(CustomerSearchNormalizer.NormalizePhone(phone), out var id))
+                return id;
+
+            record.Errors.Add($"No customer found with phone {phone}");
+            return null;
+        }
+
+        private static ServiceTypeLookup? ResolveServiceType(BulkRecord record, AppointmentLookups lookups)
+        {
+            var serviceTypeId = record.Int("ServiceTypeId");
+            if (serviceTypeId.HasValue)
+            {
+                if (lookups.ServiceTypesById.TryGetValue(serviceTypeId.Value, out var byId))
+                    return byId;
+
+                record.Errors.Add($"Service type {serviceTypeId} not found");
+                return null;
+            }
+
+            var name = record.Get("ServiceTypeName");
+            if (name == null)
+            {
+                record.Errors.Add("ServiceTypeId or ServiceTypeName is required");
+                return null;
+            }
+
+            if (lookups.ServiceTypesByName.TryGetValue(name, out var byName))
+                return byName;
+
+            record.Errors.Add($"Service type '{name}' not found");
+            return null;
+        }
+
+        private static int? ResolveUserId(BulkRecord record, AppointmentLookups lookups)
+        {
+            var userId = record.Int("UserId");
+            if (userId.HasValue)
+            {
+                if (lookups.UserIds.Contains(userId.Value))
+                    return userId;
+
+                record.Errors.Add($"User {userId} not found");
+                return null;
+            }
+
+            var username = record.Get("Username");
+            if (username == null)
+            {
+                record.Errors.Add("UserId or Username is required");
+                return null;
+            }
+
+            if (lookups.UserIdsByUsername.TryGetValue(username, out var id))
+                return id;
+
+            record.Errors.Add($"User '{username}' not found");
+            return null;
+        }
+
+        private static IEnumerable<PaymentInstallment> ParseInstallments(BulkRecord record, string paymentMethod)
+        {
+            var json = record.Get("Installments");
+            if (json == null)
+                return Enumerable.Empty<PaymentInstallment>();
+
+            List<BulkInstallmentDto>? installments;
+            try
+            {
+                installments = JsonSerializer.Deserialize<List<BulkInstallmentDto>>(json, InstallmentJsonOptions);
+            }
+            catch (JsonException)
+            {
+                record.Errors.Add("Installments must be a JSON array");
+                return Enumerable.Empty<PaymentInstallment>();
+            }
+
+            if (installments == null)
+                return Enumerable.Empty<PaymentInstallment>();
+
+            if (installments.Any(i => i.Amount <= 0))
+                record.Errors.Add("Installment amounts must be positive");
+
+            return installments.Select(i => new PaymentInstallment
+            {
+                Amount = i.Amount,
+                DueDate = i.DueDate,
+                PaidDate = i.PaidDate,
+                IsPaid = i.IsPaid,
+                PaymentMethod = i.PaymentMethod ?? paymentMethod,
+                Notes = i.Notes,
+                CreatedAt = DateTime.UtcNow
+            }).ToList();
+        }
+
+        private static void AddErrors(BulkImportResultDto result, BulkRecord record)
+        {
+            result.FailedRows++;
+            if (result.Errors.Count >= MaxReportedErrors)
+            {
+                result.ErrorsTruncated = true;
+                return;
+            }
+
+            result.Errors.Add(new BulkImportErrorDto
+            {
+                RowNumber = record.RowNumber,
+                Message = string.Join("; ", record.Errors)
+            });
+        }
+
+        private record ServiceTypeLookup(int Id, string Name, decimal Price);
+
+        private record AppointmentLookups(
+            Dictionary<int, ServiceTypeLookup> ServiceTypesById,
+            Dictionary<string, ServiceTypeLookup> ServiceTypesByName,
+            HashSet<int> UserIds,
+            Dictionary<string, int> UserIdsByUsername);
+    }
+}
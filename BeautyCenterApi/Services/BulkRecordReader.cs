@@ -0,0 +1,449 @@
+using System.Globalization;
+using System.Runtime.CompilerServices;
+using System.Text;
+using System.Text.Json;
+using System.Text.RegularExpressions;
+
+namespace BeautyCenterApi.Services
+{
+    public enum BulkFormat
+    {
+        Csv,
+        NdJson
+    }
+
+    // Tek bir içe aktarma satırı; alan okuyucuları hataları satıra biriktirir
+    public class BulkRecord
+    {
+        private static readonly CultureInfo TurkishCulture = CultureInfo.GetCultureInfo("tr-TR");
+
+        // Yalnızca tam biçimler kabul edilir: serbest ayrıştırma "05.03.2024"ü 3 Mayıs okuyup gün/ayı sessizce değiştirir
+        private static readonly string[] DateFormats =
+        {
+            "O",
+            // System.Text.Json kesirli saniyenin sondaki sıfırlarını atar ("...:30.5Z"); "O" yalnızca 7 haneyi kabul eder
+            "yyyy-MM-ddTHH:mm:ss.FFFFFFF", "yyyy-MM-ddTHH:mm:ss.FFFFFFFK",
+            "yyyy-MM-dd", "yyyy-MM-ddTHH:mm", "yyyy-MM-ddTHH:mm:ss", "yyyy-MM-dd HH:mm", "yyyy-MM-dd HH:mm:ss",
+            "d.M.yyyy HH:mm:ss", "d.M.yyyy HH:mm", "d.M.yyyy"
+        };
+
+        // Türkçe sayı biçimleri: "1.234", "1.234,50" (binlik ayraçlı) ve "1234,50"
+        private static readonly Regex TurkishNumberPattern = new(@"^-?([1-9]\d{0,2}(\.\d{3})+|\d+)(,\d+)?$", RegexOptions.Compiled);
+
+        private readonly Dictionary<string, string?> _fields;
+
+        public BulkRecord(int rowNumber, Dictionary<string, string?> fields, string? parseError = null)
+        {
+            RowNumber = rowNumber;
+            _fields = fields;
+            if (parseError != null)
+                Errors.Add(parseError);
+        }
+
+        public int RowNumber { get; }
+        public List<string> Errors { get; } = new();
+        public bool IsValid => Errors.Count == 0;
+
+        public string? Get(string name)
+        {
+            return _fields.TryGetValue(name, out var value) && !string.IsNullOrWhiteSpace(value) ? value.Trim() : null;
+        }
+
+        public string RequiredString(string name, int maxLength)
+        {
+            var value = Get(name);
+            if (value == null)
+            {
+                Errors.Add($"{name} is required");
+                return string.Empty;
+            }
+
+            return CheckLength(name, value, maxLength);
+        }
+
+        public string? OptionalString(string name, int maxLength)
+        {
+            var value = Get(name);
+            return value == null ? null : CheckLength(name, value, maxLength);
+        }
+
+        public int? Int(string name, bool required = false)
+        {
+            var value = Get(name);
+            if (value == null)
+                return Missing<int>(name, required);
+
+            if (int.TryParse(value, NumberStyles.Integer, CultureInfo.InvariantCulture, out var result))
+                return result;
+
+            Errors.Add($"{name} is not a valid integer");
+            return null;
+        }
+
+        // Dışa aktarımın "1234.50" biçimi ve Türkçe Excel çıktısındaki "1234,50" / "1.234,50" kabul edilir.
+        // Virgülle gruplanmış değerler ("1,234.50") reddedilir; yanlış büyüklükte sessizce içe aktarılmasınlar
+        public decimal? Decimal(string name, bool required = false)
+        {
+            var value = Get(name);
+            if (value == null)
+                return Missing<decimal>(name, required);
+
+            // Tutarlar iki ondalıkla dışa aktarılır; "1.234" gibi üç haneli gruplar Türkçe binlik ayracı sayılır
+            var parsed = TurkishNumberPattern.IsMatch(value)
+                ? decimal.TryParse(value, NumberStyles.AllowLeadingSign | NumberStyles.AllowThousands | NumberStyles.AllowDecimalPoint, TurkishCulture, out var result)
+                : decimal.TryParse(value, NumberStyles.AllowLeadingSign | NumberStyles.AllowDecimalPoint, CultureInfo.InvariantCulture, out result);
+
+            if (parsed)
+                return result;
+
+            Errors.Add($"{name} is not a valid number");
+            return null;
+        }
+
+        public DateTime? Date(string name, bool required = false)
+        {
+            var value = Get(name);
+            if (value == null)
+                return Missing<DateTime>(name, required);
+
+            if (DateTime.TryParseExact(value, DateFormats, CultureInfo.InvariantCulture, DateTimeStyles.RoundtripKind, out var result))
+                return result;
+
+            Errors.Add($"{name} is not a valid date");
+            return null;
+        }
+
+        public bool? Bool(string name)
+        {
+            var value = Get(name);
+            if (value == null)
+                return null;
+
+            switch (value.ToLowerInvariant())
+            {
+                case "true": case "1": case "yes": case "evet": case "aktif":
+                    return true;
+                case "false": case "0": case "no": case "hayır": case "hayir": case "pasif":
+                    return false;
+                default:
+                    Errors.Add($"{name} is not a valid boolean");
+                    return null;
+            }
+        }
+
+        private string CheckLength(string name, string value, int maxLength)
+        {
+            if (value.Length > maxLength)
+                Errors.Add($"{name} must be at most {maxLength} characters");
+
+            return value;
+        }
+
+        private T? Missing<T>(string name, bool required) where T : struct
+        {
+            if (required)
+                Errors.Add($"{name} is required");
+
+            return null;
+        }
+    }
+
+    // CSV ve NDJSON dosyalarını satır satır okur; dosyanın tamamı hiçbir zaman belleğe alınmaz.
+    // CSV'de satır numarası başlık hariç kayıt sırası, NDJSON'da dosyadaki satır numarasıdır
+    public static class BulkRecordReader
+    {
+        // Tek satırlık dev bir dosya ya da kapanmamış tırnak tüm dosyayı tek kayda çekmesin
+        private const int MaxRecordLength = 64 * 1024;
+
+        public static BulkFormat? ResolveFormat(string? format, string? contentType)
+        {
+            var value = (format ?? contentType ?? string.Empty).ToLowerInvariant();
+
+            if (value.Contains("csv"))
+                return BulkFormat.Csv;
+
+            if (value.Contains("ndjson") || value.Contains("jsonl") || value.Contains("json"))
+                return BulkFormat.NdJson;
+
+            return null;
+        }
+
+        public static IAsyncEnumerable<BulkRecord> ReadAsync(Stream stream, BulkFormat format, CancellationToken cancellationToken = default)
+        {
+            return format == BulkFormat.Csv
+                ? ReadCsvAsync(stream, cancellationToken)
+                : ReadNdJsonAsync(stream, cancellationToken);
+        }
+
+        private static async IAsyncEnumerable<BulkRecord> ReadCsvAsync(Stream stream, [EnumeratorCancellation] CancellationToken cancellationToken)
+        {
+            using var streamReader = new StreamReader(stream, Encoding.UTF8, detectEncodingFromByteOrderMarks: true, bufferSize: 64 * 1024, leaveOpen: true);
+            var reader = new BoundedLineReader(streamReader, MaxRecordLength);
+
+            var headerLine = await reader.ReadLineAsync(cancellationToken);
+            if (reader.Overflowed)
+                throw new InvalidDataException("CSV header is too long");
+
+            if (string.IsNullOrWhiteSpace(headerLine))
+                yield break;
+
+            // Türkçe Excel CSV çıktısı ayraç olarak ';' kullanır
+            var delimiter = headerLine.Contains(';') && !headerLine.Contains(',') ? ';' : ',';
+            var fields = new List<string>();
+            if (!TryParseCsvLine(headerLine, delimiter, fields))
+                throw new InvalidDataException("CSV header is malformed");
+
+            var header = fields.Select(f => f.Trim()).ToArray();
+            var rowNumber = 0;
+            var pending = new StringBuilder();
+
+            string? line;
+            while ((line = await reader.ReadLineAsync(cancellationToken)) != null)
+            {
+                if (reader.Overflowed || pending.Length + line.Length > MaxRecordLength)
+                {
+                    pending.Clear();
+                    yield return new BulkRecord(++rowNumber, new Dictionary<string, string?>(), RecordTooLongError);
+                    continue;
+                }
+
+                if (pending.Length == 0 && string.IsNullOrWhiteSpace(line))
+                    continue;
+
+                if (pending.Length > 0)
+                    pending.Append('\n');
+                pending.Append(line);
+
+                if (!TryParseCsvLine(pending.ToString(), delimiter, fields))
+                {
+                    // Tırnak içinde satır sonu: kayıt bir sonraki satırda devam eder
+                    continue;
+                }
+
+                pending.Clear();
+                rowNumber++;
+
+                if (fields.Count != header.Length)
+                {
+                    yield return new BulkRecord(rowNumber, new Dictionary<string, string?>(),
+                        $"Expected {header.Length} columns but found {fields.Count}");
+                    continue;
+                }
+
+                var values = new Dictionary<string, string?>(header.Length, StringComparer.OrdinalIgnoreCase);
+                for (var i = 0; i < header.Length; i++)
+                {
+                    values[header[i]] = fields[i];
+                }
+
+                yield return new BulkRecord(rowNumber, values);
+            }
+
+            if (pending.Length > 0)
+                yield return new BulkRecord(++rowNumber, new Dictionary<string, string?>(), "Row has an unterminated quoted field");
+        }
+
+        private static async IAsyncEnumerable<BulkRecord> ReadNdJsonAsync(Stream stream, [EnumeratorCancellation] CancellationToken cancellationToken)
+        {
+            using var streamReader = new StreamReader(stream, Encoding.UTF8, detectEncodingFromByteOrderMarks: true, bufferSize: 64 * 1024, leaveOpen: true);
+            var reader = new BoundedLineReader(streamReader, MaxRecordLength);
+
+            var lineNumber = 0;
+            string? line;
+            while ((line = await reader.ReadLineAsync(cancellationToken)) != null)
+            {
+                lineNumber++;
+                if (reader.Overflowed)
+                {
+                    yield return new BulkRecord(lineNumber, new Dictionary<string, string?>(), RecordTooLongError);
+                    continue;
+                }
+
+                if (string.IsNullOrWhiteSpace(line))
+                    continue;
+
+                Dictionary<string, string?>? values = null;
+                string? error = null;
+                try
+                {
+                    using var document = JsonDocument.Parse(line);
+                    if (document.RootElement.ValueKind != JsonValueKind.Object)
+                    {
+                        error = "Line is not a JSON object";
+                    }
+                    else
+                    {
+                        values = new Dictionary<string, string?>(StringComparer.OrdinalIgnoreCase);
+                        foreach (var property in document.RootElement.EnumerateObject())
+                        {
+                            values[property.Name] = property.Value.ValueKind switch
+                            {
+                                JsonValueKind.String => property.Value.GetString(),
+                                JsonValueKind.Null or JsonValueKind.Undefined => null,
+                                _ => property.Value.GetRawText()
+                            };
+                        }
+                    }
+                }
+                catch (JsonException ex)
+                {
+                    error = $"Invalid JSON: {ex.Message}";
+                }
+
+                yield return new BulkRecord(lineNumber, values ?? new Dictionary<string, string?>(), error);
+            }
+        }
+
+        private static string RecordTooLongError => $"Row exceeds the maximum length of {MaxRecordLength} characters";
+
+        private static bool TryParseCsvLine(string line, char delimiter, List<string> fields)
+        {
+            fields.Clear();
+            var field = new StringBuilder();
+            var inQuotes = false;
+
+            for (var i = 0; i < line.Length; i++)
+            {
+                var ch = line[i];
+                if (inQuotes)
+                {
+                    if (ch != '"')
+                    {
+                        field.Append(ch);
+                    }
+                    else if (i + 1 < line.Length && line[i + 1] == '"')
+                    {
+                        field.Append('"');
+                        i++;
+                    }
+                    else
+                    {
+                        inQuotes = false;
+                    }
+                }
+                else if (ch == '"')
+                {
+                    inQuotes = true;
+                }
+                else if (ch == delimiter)
+                {
+                    fields.Add(field.ToString());
+                    field.Clear();
+                }
+                else
+                {
+                    field.Append(ch);
+                }
+            }
+
+            if (inQuotes)
+                return false;
+
+            fields.Add(field.ToString());
+            return true;
+        }
+    }
+
+    // StreamReader.ReadLineAsync satır uzunluğunu sınırlamaz; tek satırlık dev bir dosya tamamen belleğe alınırdı.
+    // Sınırı aşan satırın geri kalanı okunup atılır ve satır Overflowed olarak işaretlenir
+    internal sealed class BoundedLineReader
+    {
+        private readonly TextReader _reader;
+        private readonly int _maxLength;
+        private readonly char[] _buffer = new char[16 * 1024];
+        private readonly StringBuilder _line = new();
+        private int _position;
+        private int _length;
+        private bool _skipLineFeed;
+
+        public BoundedLineReader(TextReader reader, int maxLength)
+        {
+            _reader = reader;
+            _maxLength = maxLength;
+        }
+
+        // Son okunan satır sınırı aştı; bu durumda ReadLineAsync boş metin döndürür
+        public bool Overflowed { get; private set; }
+
+        public async ValueTask<string?> ReadLineAsync(CancellationToken cancellationToken = default)
+        {
+            _line.Clear();
+            Overflowed = false;
+            var hasContent = false;
+
+            while (true)
+            {
+                if (_position == _length)
+                {
+                    _length = await _reader.ReadAsync(_buffer.AsMemory(), cancellationToken);
+                    _position = 0;
+                    if (_length == 0)
+                        return hasContent ? CurrentLine() : null;
+                }
+
+                // "\r\n" iki parçaya bölünmüş olabilir
+                if (_skipLineFeed)
+                {
+                    _skipLineFeed = false;
+                    if (_buffer[_position] == '\n')
+                    {
+                        _position++;
+                        continue;
+                    }
+                }
+
+                var newline = IndexOfLineBreak();
+                if (newline < 0)
+                {
+                    Append(_position, _length - _position);
+                    hasContent = true;
+                    _position = _length;
+                    continue;
+                }
+
+                Append(_position, newline - _position);
+                _position = newline + 1;
+                if (_buffer[newline] == '\r')
+                {
+                    if (_position < _length)
+                    {
+                        if (_buffer[_position] == '\n')
+                            _position++;
+                    }
+                    else
+                    {
+                        _skipLineFeed = true;
+                    }
+                }
+
+                return CurrentLine();
+            }
+        }
+
+        private int IndexOfLineBreak()
+        {
+            var index = _buffer.AsSpan(_position, _length - _position).IndexOfAny('\r', '\n');
+            return index < 0 ? -1 : _position + index;
+        }
+
+        private void Append(int start, int count)
+        {
+            if (Overflowed)
+                return;
+
+            if (_line.Length + count > _maxLength)
+            {
+                Overflowed = true;
+                _line.Clear();
+                return;
+            }
+
+            _line.Append(_buffer, start, count);
+        }
+
+        private string CurrentLine()
+        {
+            return Overflowed ? string.Empty : _line.ToString();
+        }
+    }
+}
@@ -0,0 +1,40 @@
+using BeautyCenterApi.Data;
+
+namespace BeautyCenterApi.Services
+{
+    // Arama sütunları boş kalan müşterileri uygulama açıldıktan sonra arka planda doldurur; açılış
+    // müşteri sayısı kadar beklemez. Dolum bitene kadar bu müşteriler yalnızca aramada görünmez
+    public class CustomerSearchBackfillService : BackgroundService
+    {
+        private readonly IServiceScopeFactory _scopeFactory;
+        private readonly ILogger<CustomerSearchBackfillService> _logger;
+
+        public CustomerSearchBackfillService(IServiceScopeFactory scopeFactory, ILogger<CustomerSearchBackfillService> logger)
+        {
+            _scopeFactory = scopeFactory;
+            _logger = logger;
+        }
+
+        protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+        {
+            // Host başlangıcını bekletmemek için ilk await'ten önce iş yapılmaz
+            await Task.Yield();
+
+            try
+            {
+                using var scope = _scopeFactory.CreateScope();
+                var context = scope.ServiceProvider.GetRequiredService<BeautyCenterDbContext>();
+                var updated = await CustomerSearchNormalizer.BackfillAsync(context, cancellationToken: stoppingToken);
+
+                if (updated > 0)
+                {
+                    _logger.LogInformation("Customer search columns backfilled for {CustomerCount} customers", updated);
+                }
+            }
+            catch (Exception ex) when (ex is not OperationCanceledException)
+            {
+                _logger.LogError(ex, "Customer search backfill failed");
+            }
+        }
+    }
+}
@@ -0,0 +1,57 @@
+using BCrypt.Net;
+
+namespace BeautyCenterApi.Services
+{
+    // BCrypt işlemleri CPU yoğundur. İş faktörü yapılandırmadan okunur; eşzamanlı özetleme ve doğrulama sayısı
+    // birlikte sınırlanır ki sabah giriş yoğunluğunda thread pool tükenip diğer istekler beklemesin
+    public class PasswordHasher
+    {
+        private readonly int _workFactor;
+        private readonly SemaphoreSlim _limiter;
+
+        public PasswordHasher(IConfiguration configuration)
+        {
+            _workFactor = Math.Clamp(configuration.GetValue("Auth:BCryptWorkFactor", 11), 4, 31);
+
+            var maxConcurrentHashes = configuration.GetValue("Auth:MaxConcurrentHashes", 0);
+            _limiter = new SemaphoreSlim(maxConcurrentHashes > 0 ? maxConcurrentHashes : Environment.ProcessorCount);
+        }
+
+        public async Task<string> HashAsync(string password, CancellationToken cancellationToken = default)
+        {
+            await _limiter.WaitAsync(cancellationToken);
+            try
+            {
+                return BCrypt.Net.BCrypt.HashPassword(password, _workFactor);
+            }
+            finally
+            {
+                _limiter.Release();
+            }
+        }
+
+        public async Task<bool> VerifyAsync(string password, string passwordHash, CancellationToken cancellationToken = default)
+        {
+            await _limiter.WaitAsync(cancellationToken);
+            try
+            {
+                return BCrypt.Net.BCrypt.Verify(password, passwordHash);
+            }
+            catch (SaltParseException)
+            {
+                return false;
+            }
+            finally
+            {
+                _limiter.Release();
+            }
+        }
+
+        // Özet farklı bir iş faktörüyle üretilmişse (artırılmış ya da düşürülmüş) girişte yeniden özetlenir
+        public bool NeedsRehash(string passwordHash)
+        {
+            var parts = passwordHash.Split('$');
+            return parts.Length < 4 || !int.TryParse(parts[2], out var workFactor) || workFactor != _workFactor;
+        }
+    }
+}
@@ -0,0 +1,245 @@
+using System.Collections;
+using System.Collections.Concurrent;
+using System.Diagnostics.Metrics;
+using System.Security.Cryptography;
+using System.Text.Json;
+using BeautyCenterApi.DTOs;
+using BeautyCenterApi.Models;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.EntityFrameworkCore.ChangeTracking;
+using Microsoft.Extensions.Caching.Memory;
+
+namespace BeautyCenterApi.Services
+{
+    public class CachedValue<T>
+    {
+        public CachedValue(T value, string eTag)
+        {
+            Value = value;
+            ETag = eTag;
+        }
+
+        public T Value { get; }
+        public string ETag { get; }
+    }
+
+    // Yavaş değişen referans verilerini (hizmet türleri, aktif müşteriler, tenant bilgisi) tenant bazında önbellekler.
+    // Geçersiz kılma anahtar neslini artırarak yapılır; eski girişler süre ve boyut sınırıyla tahliye edilir
+    public class ReferenceDataCache : IDisposable
+    {
+        public const string ServiceTypes = "service-types";
+        public const string Customers = "customers";
+        public const string Tenants = "tenants";
+
+        private static readonly string[] Categories = { ServiceTypes, Customers, Tenants };
+
+        // dotnet-counters / OpenTelemetry ile izlenebilir
+        private static readonly Meter CacheMeter = new("BeautyCenterApi.ReferenceDataCache");
+        private static readonly Counter<long> HitCounter = CacheMeter.CreateCounter<long>("reference_cache.hits");
+        private static readonly Counter<long> MissCounter = CacheMeter.CreateCounter<long>("reference_cache.misses");
+        private static readonly Counter<long> EvictionCounter = CacheMeter.CreateCounter<long>("reference_cache.evictions");
+
+        private readonly MemoryCache _cache;
+        private readonly long _sizeLimit;
+        private readonly TimeSpan _expiration;
+        private readonly ConcurrentDictionary<string, long> _generations = new();
+        private readonly ConcurrentDictionary<string, CategoryCounters> _counters = new();
+
+        public ReferenceDataCache(IConfiguration configuration)
+        {
+            _sizeLimit = configuration.GetValue("ReferenceDataCache:SizeLimit", 50_000L);
+            _expiration = TimeSpan.FromMinutes(configuration.GetValue("ReferenceDataCache:ExpirationMinutes", 30));
+            _cache = new MemoryCache(new MemoryCacheOptions
+            {
+                SizeLimit = _sizeLimit,
+                TrackStatistics = true
+            });
+        }
+
+        // tenantId null ise (SuperAdmin) tüm tenant'ları kapsayan ayrı bir kapsam kullanılır
+        public async Task<CachedValue<T>> GetOrCreateAsync<T>(string category, int? tenantId, string key, Func<Task<T>> factory)
+        {
+            var counters = GetCounters(category);
+            var cacheKey = $"{category}:{FormatScope(tenantId)}:{GetGeneration(category, tenantId)}:{key}";
+
+            if (_cache.TryGetValue(cacheKey, out CachedValue<T>? cached) && cached != null)
+            {
+                Interlocked.Increment(ref counters.Hits);
+                HitCounter.Add(1, new KeyValuePair<string, object?>("category", category));
+                return cached;
+            }
+
+            Interlocked.Increment(ref counters.Misses);
+            MissCounter.Add(1, new KeyValuePair<string, object?>("category", category));
+
+            var value = await factory();
+            cached = new CachedValue<T>(value, ComputeETag(value));
+
+            // Bulunamayan kayıtlar önbelleğe alınmaz; sonradan oluşturulduklarında hemen görünürler
+            if (value == null)
+                return cached;
+
+            var options = new MemoryCacheEntryOptions
+            {
+                Size = EstimateSize(value),
+                AbsoluteExpirationRelativeToNow = _expiration
+            };
+            options.RegisterPostEvictionCallback(OnEvicted, category);
+            _cache.Set(cacheKey, cached, options);
+
+            return cached;
+        }
+
+        // Tenant'a ait girişlerle birlikte tüm tenant'ları kapsayan SuperAdmin girişleri de geçersiz olur
+        public void Invalidate(string category, int? tenantId)
+        {
+            _generations.AddOrUpdate(GenerationKey(category, tenantId), 1, (_, generation) => generation + 1);
+            if (tenantId.HasValue)
+                _generations.AddOrUpdate(GenerationKey(category, null), 1, (_, generation) => generation + 1);
+
+            Interlocked.Increment(ref GetCounters(category).Invalidations);
+        }
+
+        public void Invalidate(IEnumerable<(string Category, int? TenantId)> scopes)
+        {
+            foreach (var (category, tenantId) in scopes)
+            {
+                Invalidate(category, tenantId);
+            }
+        }
+
+        // Kayıttan önce çağrılır: silinen/değişen kayıtların tenant bilgisi orijinal değerlerden okunur
+        public static HashSet<(string Category, int? TenantId)> CollectInvalidations(ChangeTracker changeTracker)
+        {
+            var scopes = new HashSet<(string Category, int? TenantId)>();
+
+            foreach (var entry in changeTracker.Entries())
+            {
+                if (entry.State != EntityState.Added && entry.State != EntityState.Modified && entry.State != EntityState.Deleted)
+                    continue;
+
+                switch (entry.Entity)
+                {
+                    case ServiceType:
+                        AddScopes(scopes, ServiceTypes, entry, nameof(ServiceType.TenantId));
+                        break;
+
+                    case Customer:
+                        AddScopes(scopes, Customers, entry, nameof(Customer.TenantId));
+                        break;
+
+                    case Tenant tenant:
+                        scopes.Add((Tenants, tenant.Id));
+
+                        // Tenant silinince bağlı kayıtlar veritabanında kaskad silinir
+                        if (entry.State == EntityState.Deleted)
+                        {
+                            scopes.Add((ServiceTypes, tenant.Id));
+                            scopes.Add((Customers, tenant.Id));
+                        }
+                        break;
+                }
+            }
+
+            return scopes;
+        }
+
+        public CacheStatisticsDto GetStatistics()
+        {
+            var categories = Categories
+                .Select(category =>
+                {
+                    var counters = GetCounters(category);
+                    return new CacheCategoryStatisticsDto
+                    {
+                        Category = category,
+                        Hits = Interlocked.Read(ref counters.Hits),
+                        Misses = Interlocked.Read(ref counters.Misses),
+                        Invalidations = Interlocked.Read(ref counters.Invalidations),
+                        Evictions = Interlocked.Read(ref counters.Evictions)
+                    };
+                })
+                .ToList();
+
+            var hits = categories.Sum(c => c.Hits);
+            var misses = categories.Sum(c => c.Misses);
+            var memoryStatistics = _cache.GetCurrentStatistics();
+
+            return new CacheStatisticsDto
+            {
+                Hits = hits,
+                Misses = misses,
+                HitRatio = hits + misses > 0 ? (double)hits / (hits + misses) : 0,
+                EntryCount = memoryStatistics?.CurrentEntryCount ?? 0,
+                EstimatedSize = memoryStatistics?.CurrentEstimatedSize ?? 0,
+                SizeLimit = _sizeLimit,
+                Categories = categories
+            };
+        }
+
+        public void Dispose()
+        {
+            _cache.Dispose();
+        }
+
+        private void OnEvicted(object key, object? value, EvictionReason reason, object? state)
+        {
+            if (reason != EvictionReason.Capacity && reason != EvictionReason.Expired)
+                return;
+
+            var category = (string)state!;
+            Interlocked.Increment(ref GetCounters(category).Evictions);
+            EvictionCounter.Add(1, new KeyValuePair<string, object?>("category", category));
+        }
+
+        private long GetGeneration(string category, int? tenantId)
+        {
+            return _generations.TryGetValue(GenerationKey(category, tenantId), out var generation) ? generation : 0;
+        }
+
+        private CategoryCounters GetCounters(string category)
+        {
+            return _counters.GetOrAdd(category, _ => new CategoryCounters());
+        }
+
+        private static void AddScopes(HashSet<(string Category, int? TenantId)> scopes, string category, EntityEntry entry, string tenantProperty)
+        {
+            if (entry.State != EntityState.Deleted)
+                scopes.Add((category, (int)entry.CurrentValues[tenantProperty]!));
+
+            if (entry.State != EntityState.Added)
+                scopes.Add((category, (int)entry.OriginalValues[tenantProperty]!));
+        }
+
+        private static string GenerationKey(string category, int? tenantId)
+        {
+            return $"{category}:{FormatScope(tenantId)}";
+        }
+
+        private static string FormatScope(int? tenantId)
+        {
+            return tenantId?.ToString() ?? "*";
+        }
+
+        // İçerik özeti: aynı veri yeniden yüklense de (ör. uygulama yeniden başladığında) ETag değişmez
+        private static string ComputeETag<T>(T value)
+        {
+            var hash = SHA256.HashData(JsonSerializer.SerializeToUtf8Bytes(value));
+            return $"\"{Convert.ToHexString(hash, 0, 16)}\"";
+        }
+
+        // Liste girişleri eleman sayısı kadar yer kaplar; büyük müşteri listeleri sınırı orantılı doldurur
+        private static long EstimateSize(object value)
+        {
+            return value is ICollection collection ? collection.Count + 1 : 1;
+        }
+
+        private class CategoryCounters
+        {
+            public long Hits;
+            public long Misses;
+            public long Invalidations;
+            public long Evictions;
+        }
+    }
+}
@@ -0,0 +1,56 @@
+using BeautyCenterApi.Data;
+using Microsoft.EntityFrameworkCore;
+
+namespace BeautyCenterApi.Services
+{
+    // Rapor özetlerini periyodik olarak kaynak tablolardan yeniden oluşturur; anlık yenilemenin kaçırdığı
+    // sapmalar (elle yapılan veri düzeltmeleri, toplu SQL işlemleri) elle rebuild çağrısını beklemez
+    public class ReportRollupRebuildService : BackgroundService
+    {
+        private readonly IServiceScopeFactory _scopeFactory;
+        private readonly ILogger<ReportRollupRebuildService> _logger;
+        private readonly TimeSpan _interval;
+
+        public ReportRollupRebuildService(IServiceScopeFactory scopeFactory, IConfiguration configuration, ILogger<ReportRollupRebuildService> logger)
+        {
+            _scopeFactory = scopeFactory;
+            _logger = logger;
+            _interval = TimeSpan.FromHours(configuration.GetValue("ReportRollups:RebuildIntervalHours", 24));
+        }
+
+        protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+        {
+            using var timer = new PeriodicTimer(_interval);
+
+            while (await timer.WaitForNextTickAsync(stoppingToken))
+            {
+                try
+                {
+                    using var scope = _scopeFactory.CreateScope();
+                    var context = scope.ServiceProvider.GetRequiredService<BeautyCenterDbContext>();
+                    var tenantIds = await context.Tenants.Select(t => t.Id).ToListAsync(stoppingToken);
+
+                    // Her tenant gün pencereleri halinde yeniden oluşturulur; bir tenant'ın hatası diğerlerini durdurmaz
+                    foreach (var tenantId in tenantIds)
+                    {
+                        try
+                        {
+                            await ReportRollupBuilder.RebuildTenantAsync(context, tenantId, stoppingToken);
+                        }
+                        catch (Exception ex) when (ex is not OperationCanceledException)
+                        {
+                            _logger.LogError(ex, "Report rollup rebuild failed for tenant {TenantId}", tenantId);
+                            context.ChangeTracker.Clear();
+                        }
+                    }
+
+                    _logger.LogInformation("Report rollups rebuilt for {TenantCount} tenants", tenantIds.Count);
+                }
+                catch (Exception ex) when (ex is not OperationCanceledException)
+                {
+                    _logger.LogError(ex, "Report rollup rebuild failed");
+                }
+            }
+        }
+    }
+}
@@ -2,10 +2,14 @@ using System.Security.Claims;
 
 namespace BeautyCenterApi.Services
 {
+    // İsteğin tenant bilgisi claim'lerden bir kez çözülür; TenantMiddleware, repository'ler ve
+    // DbContext sorgu filtreleri (her sorguda IsSuperAdmin/GetCurrentTenantId çağırır) aynı sonucu paylaşır
     public class TenantService : ITenantService
     {
         private readonly IHttpContextAccessor _httpContextAccessor;
+        private bool _resolved;
         private int? _currentTenantId;
+        private bool _isSuperAdmin;
 
         public TenantService(IHttpContextAccessor httpContextAccessor)
         {
@@ -14,37 +18,20 @@ namespace BeautyCenterApi.Services
 
         public int? GetCurrentTenantId()
         {
-            if (_currentTenantId.HasValue)
-                return _currentTenantId;
-
-            var context = _httpContextAccessor.HttpContext;
-            if (context?.User?.Identity?.IsAuthenticated == true)
-            {
-                var tenantIdClaim = context.User.FindFirst("TenantId");
-                if (tenantIdClaim != null && int.TryParse(tenantIdClaim.Value, out int tenantId))
-                {
-                    _currentTenantId = tenantId;
-                    return tenantId;
-                }
-            }
-
-            return null;
+            Resolve();
+            return _currentTenantId;
         }
 
         public void SetCurrentTenantId(int? tenantId)
         {
+            Resolve();
             _currentTenantId = tenantId;
         }
 
         public bool IsSuperAdmin()
         {
-            var context = _httpContextAccessor.HttpContext;
-            if (context?.User?.Identity?.IsAuthenticated == true)
-            {
-                var roleClaim = context.User.FindFirst(ClaimTypes.Role);
-                return roleClaim?.Value == "SuperAdmin";
-            }
-            return false;
+            Resolve();
+            return _isSuperAdmin;
         }
 
         public bool HasTenantAccess(int tenantId)
@@ -57,5 +44,25 @@ namespace BeautyCenterApi.Services
             var currentTenantId = GetCurrentTenantId();
             return currentTenantId.HasValue && currentTenantId.Value == tenantId;
         }
+
+        private void Resolve()
+        {
+            if (_resolved)
+                return;
+
+            // Kimlik doğrulamadan önce çağrılırsa sonuç saklanmaz; doğrulama sonrası ilk çağrıda çözülür
+            var user = _httpContextAccessor.HttpContext?.User;
+            if (user?.Identity?.IsAuthenticated != true)
+                return;
+
+            _resolved = true;
+            foreach (var claim in user.Claims)
+            {
+                if (claim.Type == "TenantId" && int.TryParse(claim.Value, out var tenantId))
+                    _currentTenantId ??= tenantId;
+                else if (claim.Type == ClaimTypes.Role && claim.Value == "SuperAdmin")
+                    _isSuperAdmin = true;
+            }
+        }
     }
-}
\ No newline at end of file
+}
@@ -0,0 +1,74 @@
+using System.Globalization;
+
+namespace BeautyCenterFrontend.Models
+{
+    public class PagedResultModel<T>
+    {
+        public List<T> Items { get; set; } = new();
+        public int PageSize { get; set; }
+        public bool HasMore { get; set; }
+        public string? NextCursor { get; set; }
+    }
+
+    public class PageQueryModel
+    {
+        public string? Cursor { get; set; }
+        public int PageSize { get; set; } = 50;
+        public bool Descending { get; set; } = true;
+        public DateTime? StartDate { get; set; }
+        public DateTime? EndDate { get; set; }
+        public string? Search { get; set; }
+        public int? CustomerId { get; set; }
+
+        public virtual Dictionary<string, string?> ToQueryParameters()
+        {
+            var parameters = new Dictionary<string, string?>
+            {
+                ["pageSize"] = PageSize.ToString(),
+                ["descending"] = Descending ? "true" : "false"
+            };
+
+            if (!string.IsNullOrEmpty(Cursor))
+                parameters["cursor"] = Cursor;
+            if (StartDate.HasValue)
+                parameters["startDate"] = StartDate.Value.ToString("yyyy-MM-ddTHH:mm:ss", CultureInfo.InvariantCulture);
+            if (EndDate.HasValue)
+                parameters["endDate"] = EndDate.Value.ToString("yyyy-MM-ddTHH:mm:ss", CultureInfo.InvariantCulture);
+            if (!string.IsNullOrWhiteSpace(Search))
+                parameters["search"] = Search.Trim();
+            if (CustomerId.HasValue)
+                parameters["customerId"] = CustomerId.Value.ToString();
+
+            return parameters;
+        }
+    }
+
+    public class AppointmentPageQuery : PageQueryModel
+    {
+        public string? Status { get; set; }
+
+        public override Dictionary<string, string?> ToQueryParameters()
+        {
+            var parameters = base.ToQueryParameters();
+            if (!string.IsNullOrEmpty(Status))
+                parameters["status"] = Status;
+            return parameters;
+        }
+    }
+
+    public class PaymentPageQuery : PageQueryModel
+    {
+        public string? PaymentStatus { get; set; }
+        public string? PaymentMethod { get; set; }
+
+        public override Dictionary<string, string?> ToQueryParameters()
+        {
+            var parameters = base.ToQueryParameters();
+            if (!string.IsNullOrEmpty(PaymentStatus))
+                parameters["paymentStatus"] = PaymentStatus;
+            if (!string.IsNullOrEmpty(PaymentMethod))
+                parameters["paymentMethod"] = PaymentMethod;
+            return parameters;
+        }
+    }
+}
\ No newline at end of file
@@ -0,0 +1,47 @@
+namespace BeautyCenterFrontend.Models
+{
+    public class ReportPeriodModel
+    {
+        public DateTime? StartDate { get; set; }
+        public DateTime? EndDate { get; set; }
+        public decimal TotalRevenue { get; set; }
+        public decimal TotalBilled { get; set; }
+        public decimal TotalRemaining { get; set; }
+        public int PaymentCount { get; set; }
+        public int AppointmentCount { get; set; }
+        public decimal AppointmentRevenue { get; set; }
+        public int NewCustomers { get; set; }
+        public List<ReportServiceStatModel> ServiceStats { get; set; } = new();
+        public List<ReportPaymentMethodStatModel> PaymentMethodStats { get; set; } = new();
+        public List<ReportStatusCountModel> AppointmentStatusStats { get; set; } = new();
+        public List<ReportStatusCountModel> PaymentStatusStats { get; set; } = new();
+    }
+
+    public class ReportDashboardModel
+    {
+        public ReportPeriodModel Current { get; set; } = new();
+        public ReportPeriodModel? Previous { get; set; }
+        public int ActiveCustomers { get; set; }
+    }
+
+    public class ReportServiceStatModel
+    {
+        public int ServiceTypeId { get; set; }
+        public string ServiceName { get; set; } = string.Empty;
+        public int AppointmentCount { get; set; }
+        public decimal Revenue { get; set; }
+    }
+
+    public class ReportPaymentMethodStatModel
+    {
+        public string PaymentMethod { get; set; } = string.Empty;
+        public int Count { get; set; }
+        public decimal Amount { get; set; }
+    }
+
+    public class ReportStatusCountModel
+    {
+        public string Status { get; set; } = string.Empty;
+        public int Count { get; set; }
+    }
+}
@@ -9,9 +9,16 @@ namespace BeautyCenterFrontend.Models
     public class LoginResponse
     {
         public string Token { get; set; } = string.Empty;
+        public DateTime ExpiresAt { get; set; }
+        public string RefreshToken { get; set; } = string.Empty;
         public UserInfo User { get; set; } = new();
     }
 
+    public class RefreshTokenRequest
+    {
+        public string RefreshToken { get; set; } = string.Empty;
+    }
+
     public class UserInfo
     {
         public int Id { get; set; }
@@ -17,6 +17,7 @@ builder.Services.AddRazorComponents()
 
 // Add Circuit Handler for better error management
 builder.Services.AddScoped<CircuitHandler, CustomCircuitHandler>();
+builder.Services.AddSingleton<CircuitServicesAccessor>();
 
 // Configure Blazor Server options
 builder.Services.AddServerSideBlazor(options =>
@@ -28,10 +29,13 @@ builder.Services.AddServerSideBlazor(options =>
 });
 
 // Add HttpClient for API calls
-builder.Services.AddHttpClient<ApiService>(client =>
+// Tek adlandırılmış istemci: bağlantı havuzu paylaşılır, token her isteğe AuthHeaderHandler ile eklenir
+builder.Services.AddTransient<AuthHeaderHandler>();
+builder.Services.AddHttpClient(ApiService.HttpClientName, client =>
 {
     client.BaseAddress = new Uri("http://localhost:5001/"); // API base address
-});
+})
+.AddHttpMessageHandler<AuthHeaderHandler>();
 
 // Add LocalStorage
 builder.Services.AddBlazoredLocalStorage();
@@ -42,12 +46,17 @@ builder.Services.AddScoped<CustomAuthStateProvider>();
 builder.Services.AddScoped<AuthenticationStateProvider>(provider => provider.GetRequiredService<CustomAuthStateProvider>());
 
 // Add Services
+// Scoped servisler devre (circuit) başına tek örnektir
+builder.Services.AddScoped<TokenCache>();
+builder.Services.AddScoped<ApiCallMetrics>();
+builder.Services.AddScoped<ClientStateContainer>();
 builder.Services.AddScoped<ApiService>();
 builder.Services.AddScoped<AuthService>();
 builder.Services.AddScoped<CustomerService>();
 builder.Services.AddScoped<AppointmentService>();
 builder.Services.AddScoped<ServiceTypeService>();
 builder.Services.AddScoped<PaymentService>();
+builder.Services.AddScoped<ReportService>();
 
 var app = builder.Build();
 
@@ -0,0 +1,65 @@
+namespace BeautyCenterFrontend.Services
+{
+    // Devre başına API çağrı sayısı ve gecikme istatistikleri; CustomCircuitHandler devre kapanırken raporlar
+    public class ApiCallMetrics
+    {
+        private long _callCount;
+        private long _failedCount;
+        private long _totalTicks;
+        private long _maxTicks;
+        private long _coalescedCount;
+        private long _stateHitCount;
+
+        public long CallCount => Interlocked.Read(ref _callCount);
+        public long FailedCount => Interlocked.Read(ref _failedCount);
+
+        // Devam eden aynı GET'e eklenen çağrılar
+        public long CoalescedCount => Interlocked.Read(ref _coalescedCount);
+
+        // ClientStateContainer'dan HTTP isteği yapılmadan karşılanan çağrılar
+        public long StateHitCount => Interlocked.Read(ref _stateHitCount);
+
+        public TimeSpan AverageLatency
+        {
+            get
+            {
+                var count = CallCount;
+                return count == 0 ? TimeSpan.Zero : TimeSpan.FromTicks(Interlocked.Read(ref _totalTicks) / count);
+            }
+        }
+
+        public TimeSpan MaxLatency => TimeSpan.FromTicks(Interlocked.Read(ref _maxTicks));
+
+        public void RecordCall(TimeSpan elapsed, bool succeeded)
+        {
+            Interlocked.Increment(ref _callCount);
+            Interlocked.Add(ref _totalTicks, elapsed.Ticks);
+            if (!succeeded)
+            {
+                Interlocked.Increment(ref _failedCount);
+            }
+
+            var max = Interlocked.Read(ref _maxTicks);
+            while (elapsed.Ticks > max)
+            {
+                var previous = Interlocked.CompareExchange(ref _maxTicks, elapsed.Ticks, max);
+                if (previous == max)
+                {
+                    break;
+                }
+
+                max = previous;
+            }
+        }
+
+        public void RecordCoalesced()
+        {
+            Interlocked.Increment(ref _coalescedCount);
+        }
+
+        public void RecordStateHit()
+        {
+            Interlocked.Increment(ref _stateHitCount);
+        }
+    }
+}
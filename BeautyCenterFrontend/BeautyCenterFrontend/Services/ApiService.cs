@@ -1,114 +1,147 @@
+using System.Collections.Concurrent;
+using System.Net;
 using System.Net.Http.Headers;
 using System.Text;
 using System.Text.Json;
 using BeautyCenterFrontend.Models;
-using Blazored.LocalStorage;
 
 namespace BeautyCenterFrontend.Services
 {
     public class ApiService
     {
-        private readonly HttpClient _httpClient;
-        private readonly ILocalStorageService _localStorage;
-        private readonly JsonSerializerOptions _jsonOptions;
+        public const string HttpClientName = "BeautyCenterApi";
 
-        public ApiService(HttpClient httpClient, ILocalStorageService localStorage)
+        private static readonly JsonSerializerOptions JsonOptions = new() { PropertyNamingPolicy = JsonNamingPolicy.CamelCase };
+
+        private readonly IHttpClientFactory _httpClientFactory;
+        private readonly ClientStateContainer _state;
+        private readonly ApiCallMetrics _metrics;
+
+        // ETag dönen GET yanıtları; aynı uç nokta If-None-Match ile yeniden doğrulanır, 304'te gövde buradan okunur
+        private readonly ConcurrentDictionary<string, (EntityTagHeaderValue ETag, string Content)> _etagCache = new();
+
+        // Devam eden GET istekleri; aynı uç noktaya eşzamanlı çağrılar tek HTTP isteğini paylaşır
+        private readonly ConcurrentDictionary<string, Lazy<Task<string?>>> _inflightGets = new();
+
+        public ApiService(IHttpClientFactory httpClientFactory, ClientStateContainer state, ApiCallMetrics metrics)
         {
-            _httpClient = httpClient;
-            _localStorage = localStorage;
-            
-            // Ensure BaseAddress is set
-            if (_httpClient.BaseAddress == null)
-            {
-                _httpClient.BaseAddress = new Uri("http://localhost:5001/");
-            }
-            
-            Console.WriteLine($"ApiService initialized with BaseAddress: {_httpClient.BaseAddress}");
-            
-            _jsonOptions = new JsonSerializerOptions
-            {
-                PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
-                WriteIndented = true
-            };
+            _httpClientFactory = httpClientFactory;
+            _state = state;
+            _metrics = metrics;
         }
 
-        private async Task SetAuthorizationHeaderAsync()
+        // İstemci her çağrıda fabrikadan alınır; bağlantı havuzu paylaşılır, Authorization başlığı AuthHeaderHandler'da eklenir
+        private HttpClient Client => _httpClientFactory.CreateClient(HttpClientName);
+
+        public async Task<T?> GetAsync<T>(string endpoint)
         {
             try
             {
-                var token = await _localStorage.GetItemAsync<string>("authToken");
-                Console.WriteLine($"Retrieved token from localStorage: {(string.IsNullOrEmpty(token) ? "null/empty" : "exists")}");
-                
-                if (!string.IsNullOrEmpty(token))
+                string? content;
+                if (_state.TryGet(endpoint, out var stateContent))
                 {
-                    _httpClient.DefaultRequestHeaders.Authorization = new AuthenticationHeaderValue("Bearer", token);
-                    Console.WriteLine("Authorization header set with token");
+                    _metrics.RecordStateHit();
+                    content = stateContent;
                 }
                 else
                 {
-                    // Clear any existing authorization header
-                    _httpClient.DefaultRequestHeaders.Authorization = null;
-                    Console.WriteLine("No token found, authorization header cleared");
+                    content = await GetContentAsync(endpoint);
                 }
+
+                // Her çağıran gövdeyi kendi nesnesine çözer; paylaşılan yanıt üzerinden nesne paylaşılmaz
+                return content == null ? default(T) : JsonSerializer.Deserialize<T>(content, JsonOptions);
             }
-            catch (InvalidOperationException ex)
+            catch (Exception ex)
             {
-                Console.WriteLine($"LocalStorage not available: {ex.Message}");
-                // LocalStorage is not available during static rendering
-                // This is expected and can be ignored for login requests
+                Console.WriteLine($"GET Error: {ex.Message}");
+                return default(T);
             }
         }
 
-        public async Task<T?> GetAsync<T>(string endpoint)
+        private async Task<string?> GetContentAsync(string endpoint)
         {
+            var fetch = new Lazy<Task<string?>>(() => FetchAsync(endpoint));
+            var inflight = _inflightGets.GetOrAdd(endpoint, fetch);
+            if (!ReferenceEquals(inflight, fetch))
+            {
+                _metrics.RecordCoalesced();
+            }
+
             try
             {
-                await SetAuthorizationHeaderAsync();
-                var response = await _httpClient.GetAsync(endpoint);
-                
-                if (response.IsSuccessStatusCode)
+                return await inflight.Value;
+            }
+            finally
+            {
+                _inflightGets.TryRemove(new KeyValuePair<string, Lazy<Task<string?>>>(endpoint, inflight));
+            }
+        }
+
+        private async Task<string?> FetchAsync(string endpoint)
+        {
+            var stateVersion = _state.Version;
+
+            using var request = new HttpRequestMessage(HttpMethod.Get, endpoint);
+            var hasCachedResponse = _etagCache.TryGetValue(endpoint, out var cachedResponse);
+            if (hasCachedResponse)
+            {
+                request.Headers.IfNoneMatch.Add(cachedResponse.ETag);
+            }
+
+            using var response = await Client.SendAsync(request);
+
+            string? content = null;
+            if (response.StatusCode == HttpStatusCode.NotModified && hasCachedResponse)
+            {
+                content = cachedResponse.Content;
+            }
+            else if (response.IsSuccessStatusCode)
+            {
+                content = await response.Content.ReadAsStringAsync();
+                if (response.Headers.ETag != null)
                 {
-                    var content = await response.Content.ReadAsStringAsync();
-                    return JsonSerializer.Deserialize<T>(content, _jsonOptions);
+                    _etagCache[endpoint] = (response.Headers.ETag, content);
+                }
+                else
+                {
+                    _etagCache.TryRemove(endpoint, out _);
                 }
-                
-                return default(T);
             }
-            catch (Exception ex)
+
+            if (content != null)
             {
-                Console.WriteLine($"GET Error: {ex.Message}");
-                return default(T);
+                _state.Set(endpoint, content, stateVersion);
             }
+
+            return content;
+        }
+
+        // Yazma işlemi hangi listeleri etkilediğini bilmediğimizden devrenin tüm GET durumu düşürülür
+        private void InvalidateState()
+        {
+            _state.Clear();
+            _inflightGets.Clear();
         }
 
         public async Task<T?> PostAsync<T>(string endpoint, object data)
         {
             try
             {
-                // Don't set auth header for login endpoint
-                if (!endpoint.Contains("auth/login"))
-                {
-                    await SetAuthorizationHeaderAsync();
-                }
-                
-                var json = JsonSerializer.Serialize(data, _jsonOptions);
+                // İstek ve yanıt gövdeleri loglanmaz: parola ve token içerebilirler
+                var json = JsonSerializer.Serialize(data, JsonOptions);
                 var content = new StringContent(json, Encoding.UTF8, "application/json");
                 
-                var fullUrl = new Uri(_httpClient.BaseAddress, endpoint).ToString();
-                Console.WriteLine($"POST to {fullUrl} with data: {json}");
-                var response = await _httpClient.PostAsync(endpoint, content);
-                Console.WriteLine($"Response status: {response.StatusCode}");
+                var response = await Client.PostAsync(endpoint, content);
                 
                 if (response.IsSuccessStatusCode)
                 {
+                    InvalidateState();
                     var responseContent = await response.Content.ReadAsStringAsync();
-                    Console.WriteLine($"Response content: {responseContent}");
-                    return JsonSerializer.Deserialize<T>(responseContent, _jsonOptions);
+                    return JsonSerializer.Deserialize<T>(responseContent, JsonOptions);
                 }
                 else
                 {
-                    var errorContent = await response.Content.ReadAsStringAsync();
-                    Console.WriteLine($"Error response: {response.StatusCode} - {errorContent}");
+                    Console.WriteLine($"POST {endpoint} failed: {response.StatusCode}");
                 }
                 
                 return default(T);
@@ -124,11 +157,15 @@ namespace BeautyCenterFrontend.Services
         {
             try
             {
-                await SetAuthorizationHeaderAsync();
-                var json = JsonSerializer.Serialize(data, _jsonOptions);
+                var json = JsonSerializer.Serialize(data, JsonOptions);
                 var content = new StringContent(json, Encoding.UTF8, "application/json");
                 
-                var response = await _httpClient.PutAsync(endpoint, content);
+                var response = await Client.PutAsync(endpoint, content);
+                if (response.IsSuccessStatusCode)
+                {
+                    InvalidateState();
+                }
+
                 return response.IsSuccessStatusCode;
             }
             catch (Exception ex)
@@ -142,8 +179,12 @@ namespace BeautyCenterFrontend.Services
         {
             try
             {
-                await SetAuthorizationHeaderAsync();
-                var response = await _httpClient.DeleteAsync(endpoint);
+                var response = await Client.DeleteAsync(endpoint);
+                if (response.IsSuccessStatusCode)
+                {
+                    InvalidateState();
+                }
+
                 return response.IsSuccessStatusCode;
             }
             catch (Exception ex)
@@ -157,21 +198,16 @@ namespace BeautyCenterFrontend.Services
         {
             try
             {
-                // Don't set auth header for login endpoint
-                if (!endpoint.Contains("auth/login"))
-                {
-                    await SetAuthorizationHeaderAsync();
-                }
-                
-                var json = JsonSerializer.Serialize(data, _jsonOptions);
+                var json = JsonSerializer.Serialize(data, JsonOptions);
                 var content = new StringContent(json, Encoding.UTF8, "application/json");
                 
-                var response = await _httpClient.PostAsync(endpoint, content);
+                var response = await Client.PostAsync(endpoint, content);
                 
                 if (response.IsSuccessStatusCode)
                 {
+                    InvalidateState();
                     var responseContent = await response.Content.ReadAsStringAsync();
-                    var result = JsonSerializer.Deserialize<T>(responseContent, _jsonOptions);
+                    var result = JsonSerializer.Deserialize<T>(responseContent, JsonOptions);
                     return ApiResult<T>.SuccessResult(result);
                 }
                 else
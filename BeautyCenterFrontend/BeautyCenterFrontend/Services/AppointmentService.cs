@@ -1,4 +1,5 @@
 using BeautyCenterFrontend.Models;
+using Microsoft.AspNetCore.WebUtilities;
 
 namespace BeautyCenterFrontend.Services
 {
@@ -17,6 +18,13 @@ namespace BeautyCenterFrontend.Services
             return result ?? new List<AppointmentModel>();
         }
 
+        public async Task<PagedResultModel<AppointmentModel>> GetAppointmentsPageAsync(AppointmentPageQuery query)
+        {
+            var endpoint = QueryHelpers.AddQueryString("api/appointments/paged", query.ToQueryParameters());
+            var result = await _apiService.GetAsync<PagedResultModel<AppointmentModel>>(endpoint);
+            return result ?? new PagedResultModel<AppointmentModel>();
+        }
+
         public async Task<AppointmentModel?> GetAppointmentByIdAsync(int id)
         {
             return await _apiService.GetAsync<AppointmentModel>($"api/appointments/{id}");
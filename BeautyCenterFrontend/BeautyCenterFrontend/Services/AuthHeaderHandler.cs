@@ -0,0 +1,54 @@
+using System.Diagnostics;
+using System.Net;
+using System.Net.Http.Headers;
+
+namespace BeautyCenterFrontend.Services
+{
+    // Authorization başlığı paylaşılan HttpClient'ın DefaultRequestHeaders'ına değil, her isteğin kendisine eklenir;
+    // aynı devrede paralel istekler birbirinin başlığını ezmez. Çağrı süreleri devrenin ApiCallMetrics'ine yazılır
+    public class AuthHeaderHandler : DelegatingHandler
+    {
+        private readonly CircuitServicesAccessor _circuitServicesAccessor;
+
+        public AuthHeaderHandler(CircuitServicesAccessor circuitServicesAccessor)
+        {
+            _circuitServicesAccessor = circuitServicesAccessor;
+        }
+
+        protected override async Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+        {
+            // Statik ön render sırasında devre yoktur; istek başlıksız gider
+            var services = _circuitServicesAccessor.Services;
+
+            // api/auth uç noktaları token gerektirmez; refresh çağrısı burada yeniden yenileme tetiklememeli
+            if (services != null && request.Headers.Authorization == null && !IsAuthEndpoint(request.RequestUri))
+            {
+                var token = await services.GetRequiredService<TokenCache>().GetAccessTokenAsync();
+                if (!string.IsNullOrEmpty(token))
+                {
+                    request.Headers.Authorization = new AuthenticationHeaderValue("Bearer", token);
+                }
+            }
+
+            var metrics = services?.GetService<ApiCallMetrics>();
+            var startedAt = Stopwatch.GetTimestamp();
+            try
+            {
+                var response = await base.SendAsync(request, cancellationToken);
+                metrics?.RecordCall(Stopwatch.GetElapsedTime(startedAt), response.IsSuccessStatusCode || response.StatusCode == HttpStatusCode.NotModified);
+                return response;
+            }
+            catch
+            {
+                metrics?.RecordCall(Stopwatch.GetElapsedTime(startedAt), false);
+                throw;
+            }
+        }
+
+        private static bool IsAuthEndpoint(Uri? requestUri)
+        {
+            var path = requestUri == null ? string.Empty : requestUri.IsAbsoluteUri ? requestUri.AbsolutePath : requestUri.OriginalString;
+            return path.TrimStart('/').StartsWith("api/auth/", StringComparison.OrdinalIgnoreCase);
+        }
+    }
+}
@@ -10,12 +10,14 @@ namespace BeautyCenterFrontend.Services
     {
         private readonly ApiService _apiService;
         private readonly ILocalStorageService _localStorage;
+        private readonly TokenCache _tokenCache;
         private readonly AuthenticationStateProvider _authStateProvider;
 
-        public AuthService(ApiService apiService, ILocalStorageService localStorage, AuthenticationStateProvider authStateProvider)
+        public AuthService(ApiService apiService, ILocalStorageService localStorage, TokenCache tokenCache, AuthenticationStateProvider authStateProvider)
         {
             _apiService = apiService;
             _localStorage = localStorage;
+            _tokenCache = tokenCache;
             _authStateProvider = authStateProvider;
         }
 
@@ -37,8 +39,7 @@ namespace BeautyCenterFrontend.Services
                     {
                         try
                         {
-                            await _localStorage.SetItemAsync("authToken", response.Token);
-                            await _localStorage.SetItemAsync("currentUser", response.User);
+                            await _tokenCache.SetAsync(response);
                             Console.WriteLine("Token and user saved to localStorage successfully");
                             
                             // Force update authentication state
@@ -90,8 +91,14 @@ namespace BeautyCenterFrontend.Services
         {
             try
             {
-                await _localStorage.RemoveItemAsync("authToken");
-                await _localStorage.RemoveItemAsync("currentUser");
+                // Yenileme token'ı sunucuda da iptal edilir
+                var refreshToken = await _tokenCache.GetRefreshTokenAsync();
+                if (!string.IsNullOrEmpty(refreshToken))
+                {
+                    await _apiService.PostAsync<object>("api/auth/logout", new RefreshTokenRequest { RefreshToken = refreshToken });
+                }
+
+                await _tokenCache.ClearAsync();
                 Console.WriteLine("Logout: Tokens removed from localStorage");
                 
                 // Force update authentication state
@@ -109,7 +116,8 @@ namespace BeautyCenterFrontend.Services
 
         public async Task<bool> IsAuthenticatedAsync()
         {
-            var token = await _localStorage.GetItemAsync<string>("authToken");
+            // Süresi dolmak üzere olan token TokenCache tarafından yenilenir
+            var token = await _tokenCache.GetAccessTokenAsync();
             return !string.IsNullOrEmpty(token) && !IsTokenExpired(token);
         }
 
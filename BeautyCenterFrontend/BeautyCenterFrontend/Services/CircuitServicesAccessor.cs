@@ -0,0 +1,16 @@
+namespace BeautyCenterFrontend.Services
+{
+    // IHttpClientFactory mesaj işleyicilerini devreden (circuit) bağımsız kendi DI kapsamında oluşturur.
+    // CustomCircuitHandler gelen her devre etkinliğinde devrenin servis sağlayıcısını buraya yazar;
+    // AuthHeaderHandler devreye ait TokenCache ve ApiCallMetrics örneklerine bu yolla ulaşır
+    public class CircuitServicesAccessor
+    {
+        private static readonly AsyncLocal<IServiceProvider?> CircuitServices = new();
+
+        public IServiceProvider? Services
+        {
+            get => CircuitServices.Value;
+            set => CircuitServices.Value = value;
+        }
+    }
+}
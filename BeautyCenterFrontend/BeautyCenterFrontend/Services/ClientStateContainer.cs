@@ -0,0 +1,66 @@
+using System.Collections.Concurrent;
+
+namespace BeautyCenterFrontend.Services
+{
+    // Devre başına GET yanıt gövdeleri. Müşteriler, Randevular ve Ödemeler arasında gezinirken aynı veri
+    // kısa süre içinde yeniden çekilmez; herhangi bir başarılı yazma işleminde kapsayıcı tamamen temizlenir
+    public class ClientStateContainer
+    {
+        private const int PurgeThreshold = 256;
+
+        private readonly ConcurrentDictionary<string, (DateTime StoredAt, string Content)> _entries = new();
+        private readonly TimeSpan _timeToLive;
+        private long _version;
+
+        public ClientStateContainer(IConfiguration configuration)
+        {
+            _timeToLive = TimeSpan.FromSeconds(configuration.GetValue("ClientState:TimeToLiveSeconds", 60));
+        }
+
+        // Her temizlemede artar; temizlemeden önce başlamış bir isteğin eski yanıtı kapsayıcıya yazılmaz
+        public long Version => Interlocked.Read(ref _version);
+
+        public bool TryGet(string key, out string content)
+        {
+            if (_entries.TryGetValue(key, out var entry))
+            {
+                if (DateTime.UtcNow - entry.StoredAt < _timeToLive)
+                {
+                    content = entry.Content;
+                    return true;
+                }
+
+                _entries.TryRemove(new KeyValuePair<string, (DateTime, string)>(key, entry));
+            }
+
+            content = string.Empty;
+            return false;
+        }
+
+        public void Set(string key, string content, long version)
+        {
+            if (_timeToLive <= TimeSpan.Zero || version != Version)
+            {
+                return;
+            }
+
+            // Tarih aralığı gibi değişken uç noktalar birikmesin
+            if (_entries.Count >= PurgeThreshold)
+            {
+                var expiredBefore = DateTime.UtcNow - _timeToLive;
+                foreach (var entry in _entries.Where(e => e.Value.StoredAt < expiredBefore))
+                {
+                    _entries.TryRemove(entry);
+                }
+            }
+
+            _entries[key] = (DateTime.UtcNow, content);
+        }
+
+        public void Clear()
+        {
+            Interlocked.Increment(ref _version);
+            _entries.Clear();
+        }
+    }
+}
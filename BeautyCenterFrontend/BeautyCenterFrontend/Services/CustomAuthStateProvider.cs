@@ -1,26 +1,24 @@
 using Microsoft.AspNetCore.Components.Authorization;
 using System.Security.Claims;
 using System.IdentityModel.Tokens.Jwt;
-using Blazored.LocalStorage;
 
 namespace BeautyCenterFrontend.Services
 {
     public class CustomAuthStateProvider : AuthenticationStateProvider
     {
-        private readonly ILocalStorageService _localStorage;
-        private readonly HttpClient _httpClient;
+        private readonly TokenCache _tokenCache;
 
-        public CustomAuthStateProvider(ILocalStorageService localStorage, HttpClient httpClient)
+        public CustomAuthStateProvider(TokenCache tokenCache)
         {
-            _localStorage = localStorage;
-            _httpClient = httpClient;
+            _tokenCache = tokenCache;
         }
 
         public override async Task<AuthenticationState> GetAuthenticationStateAsync()
         {
             try
             {
-                var token = await _localStorage.GetItemAsync<string>("authToken");
+                // Token devre boyunca bellekte tutulur; localStorage yalnızca ilk çağrıda okunur
+                var token = await _tokenCache.GetAccessTokenAsync();
                 Console.WriteLine($"CustomAuthStateProvider: Token retrieved: {(string.IsNullOrEmpty(token) ? "null/empty" : "exists")}");
                 
                 if (string.IsNullOrEmpty(token))
@@ -41,9 +39,10 @@ namespace BeautyCenterFrontend.Services
                 var jwt = handler.ReadJwtToken(token);
                 Console.WriteLine($"CustomAuthStateProvider: Token expires at: {jwt.ValidTo}, Current time: {DateTime.UtcNow}");
 
+                // Yenileme başarısız olduysa TokenCache oturum bilgilerini zaten silmiştir
                 if (jwt.ValidTo < DateTime.UtcNow)
                 {
-                    Console.WriteLine("CustomAuthStateProvider: Token expired, clearing storage");
+                    Console.WriteLine("CustomAuthStateProvider: Token expired and could not be refreshed, clearing storage");
                     await ClearAuthenticationAsync();
                     return CreateUnauthenticatedState();
                 }
@@ -81,8 +80,7 @@ namespace BeautyCenterFrontend.Services
         {
             try
             {
-                await _localStorage.RemoveItemAsync("authToken");
-                await _localStorage.RemoveItemAsync("currentUser");
+                await _tokenCache.ClearAsync();
             }
             catch (InvalidOperationException)
             {
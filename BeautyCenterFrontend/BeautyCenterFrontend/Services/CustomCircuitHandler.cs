@@ -5,10 +5,29 @@ namespace BeautyCenterFrontend.Services
     public class CustomCircuitHandler : CircuitHandler
     {
         private readonly ILogger<CustomCircuitHandler> _logger;
+        private readonly IServiceProvider _services;
+        private readonly CircuitServicesAccessor _circuitServicesAccessor;
+        private readonly ApiCallMetrics _metrics;
 
-        public CustomCircuitHandler(ILogger<CustomCircuitHandler> logger)
+        public CustomCircuitHandler(ILogger<CustomCircuitHandler> logger, IServiceProvider services,
+            CircuitServicesAccessor circuitServicesAccessor, ApiCallMetrics metrics)
         {
             _logger = logger;
+            _services = services;
+            _circuitServicesAccessor = circuitServicesAccessor;
+            _metrics = metrics;
+        }
+
+        // Devreye gelen her etkinlik (olay işleyici, JS interop dönüşü, ilk render) devrenin servisleriyle çalışır;
+        // AuthHeaderHandler bu sayede devreye ait token önbelleğine ulaşır
+        public override Func<CircuitInboundActivityContext, Task> CreateInboundActivityHandler(Func<CircuitInboundActivityContext, Task> next)
+        {
+            return async context =>
+            {
+                _circuitServicesAccessor.Services = _services;
+                await next(context);
+                _circuitServicesAccessor.Services = null;
+            };
         }
 
         public override Task OnCircuitOpenedAsync(Circuit circuit, CancellationToken cancellationToken)
@@ -20,12 +39,14 @@ namespace BeautyCenterFrontend.Services
         public override Task OnCircuitClosedAsync(Circuit circuit, CancellationToken cancellationToken)
         {
             _logger.LogInformation($"Circuit {circuit.Id} closed");
+            LogApiCallMetrics(circuit);
             return base.OnCircuitClosedAsync(circuit, cancellationToken);
         }
 
         public override Task OnConnectionDownAsync(Circuit circuit, CancellationToken cancellationToken)
         {
             _logger.LogWarning($"Circuit {circuit.Id} connection down");
+            LogApiCallMetrics(circuit);
             return base.OnConnectionDownAsync(circuit, cancellationToken);
         }
 
@@ -34,5 +55,14 @@ namespace BeautyCenterFrontend.Services
             _logger.LogInformation($"Circuit {circuit.Id} connection up");
             return base.OnConnectionUpAsync(circuit, cancellationToken);
         }
+
+        // Değerler devrenin başından itibaren birikimlidir
+        private void LogApiCallMetrics(Circuit circuit)
+        {
+            _logger.LogInformation(
+                "Circuit {CircuitId} API calls: {CallCount} sent ({FailedCount} failed), {CoalescedCount} coalesced, {StateHitCount} served from state; latency avg {AverageLatencyMs:F1} ms, max {MaxLatencyMs:F1} ms",
+                circuit.Id, _metrics.CallCount, _metrics.FailedCount, _metrics.CoalescedCount, _metrics.StateHitCount,
+                _metrics.AverageLatency.TotalMilliseconds, _metrics.MaxLatency.TotalMilliseconds);
+        }
     }
 }
\ No newline at end of file
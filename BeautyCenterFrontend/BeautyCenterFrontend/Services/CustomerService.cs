@@ -35,7 +35,14 @@ namespace BeautyCenterFrontend.Services
 
         public async Task<List<CustomerModel>> SearchCustomersAsync(string searchTerm)
         {
-            var result = await _apiService.GetAsync<List<CustomerModel>>($"api/customers/search?searchTerm={searchTerm}");
+            var result = await _apiService.GetAsync<List<CustomerModel>>($"api/customers/search?searchTerm={Uri.EscapeDataString(searchTerm)}");
+            return result ?? new List<CustomerModel>();
+        }
+
+        public async Task<List<CustomerModel>> TypeaheadCustomersAsync(string searchTerm, bool activeOnly, int limit = 10)
+        {
+            var result = await _apiService.GetAsync<List<CustomerModel>>(
+                $"api/customers/typeahead?q={Uri.EscapeDataString(searchTerm)}&limit={limit}&activeOnly={activeOnly.ToString().ToLowerInvariant()}");
             return result ?? new List<CustomerModel>();
         }
 
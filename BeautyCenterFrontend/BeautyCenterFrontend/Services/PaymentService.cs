@@ -1,4 +1,5 @@
 using BeautyCenterFrontend.Models;
+using Microsoft.AspNetCore.WebUtilities;
 
 namespace BeautyCenterFrontend.Services
 {
@@ -17,6 +18,13 @@ namespace BeautyCenterFrontend.Services
             return result ?? new List<PaymentModel>();
         }
 
+        public async Task<PagedResultModel<PaymentModel>> GetPaymentsPageAsync(PaymentPageQuery query)
+        {
+            var endpoint = QueryHelpers.AddQueryString("api/payments/paged", query.ToQueryParameters());
+            var result = await _apiService.GetAsync<PagedResultModel<PaymentModel>>(endpoint);
+            return result ?? new PagedResultModel<PaymentModel>();
+        }
+
         public async Task<PaymentModel?> GetPaymentByIdAsync(int id)
         {
             return await _apiService.GetAsync<PaymentModel>($"api/payments/{id}");
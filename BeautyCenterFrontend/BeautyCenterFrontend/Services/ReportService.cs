@@ -0,0 +1,25 @@
+using BeautyCenterFrontend.Models;
+
+namespace BeautyCenterFrontend.Services
+{
+    public class ReportService
+    {
+        private readonly ApiService _apiService;
+
+        public ReportService(ApiService apiService)
+        {
+            _apiService = apiService;
+        }
+
+        public async Task<ReportDashboardModel?> GetDashboardAsync(DateTime startDate, DateTime endDate, DateTime? previousStartDate = null, DateTime? previousEndDate = null)
+        {
+            var endpoint = $"api/reports/dashboard?startDate={startDate:yyyy-MM-dd}&endDate={endDate:yyyy-MM-dd}";
+            if (previousStartDate.HasValue && previousEndDate.HasValue)
+            {
+                endpoint += $"&previousStartDate={previousStartDate.Value:yyyy-MM-dd}&previousEndDate={previousEndDate.Value:yyyy-MM-dd}";
+            }
+
+            return await _apiService.GetAsync<ReportDashboardModel>(endpoint);
+        }
+    }
+}
@@ -0,0 +1,195 @@
+using System.IdentityModel.Tokens.Jwt;
+using System.Net;
+using System.Text;
+using System.Text.Json;
+using BeautyCenterFrontend.Models;
+using Blazored.LocalStorage;
+
+namespace BeautyCenterFrontend.Services
+{
+    // Devre başına token önbelleği. Token'lar localStorage'dan bir kez okunur ve bellekte tutulur,
+    // değişiklikler localStorage'a da yazılır; böylece her API çağrısında JS interop yapılmaz
+    public class TokenCache
+    {
+        // Süresi dolmak üzere olan token yenileme token'ıyla tazelenir; eşzamanlı istekler tek yenileme çağrısını bekler
+        private static readonly TimeSpan TokenRefreshMargin = TimeSpan.FromMinutes(1);
+        private static readonly JsonSerializerOptions JsonOptions = new() { PropertyNamingPolicy = JsonNamingPolicy.CamelCase };
+
+        private readonly ILocalStorageService _localStorage;
+        private readonly IHttpClientFactory _httpClientFactory;
+        private readonly SemaphoreSlim _refreshLock = new(1, 1);
+
+        private bool _loaded;
+        private string? _accessToken;
+        private string? _refreshToken;
+
+        public TokenCache(ILocalStorageService localStorage, IHttpClientFactory httpClientFactory)
+        {
+            _localStorage = localStorage;
+            _httpClientFactory = httpClientFactory;
+        }
+
+        // Geçerli access token'ı döndürür; süresi dolmak üzereyse önce yeniler
+        public async Task<string?> GetAccessTokenAsync()
+        {
+            await EnsureLoadedAsync();
+            if (!string.IsNullOrEmpty(_accessToken) && ExpiresSoon(_accessToken))
+            {
+                return await RefreshAsync();
+            }
+
+            return _accessToken;
+        }
+
+        public async Task<string?> GetRefreshTokenAsync()
+        {
+            await EnsureLoadedAsync();
+            return _refreshToken;
+        }
+
+        public async Task SetAsync(LoginResponse response)
+        {
+            _accessToken = response.Token;
+            _refreshToken = response.RefreshToken;
+            _loaded = true;
+
+            await _localStorage.SetItemAsync("authToken", response.Token);
+            await _localStorage.SetItemAsync("refreshToken", response.RefreshToken);
+            await _localStorage.SetItemAsync("currentUser", response.User);
+        }
+
+        public async Task ClearAsync()
+        {
+            _accessToken = null;
+            _refreshToken = null;
+
+            await _localStorage.RemoveItemAsync("authToken");
+            await _localStorage.RemoveItemAsync("refreshToken");
+            await _localStorage.RemoveItemAsync("currentUser");
+        }
+
+        // Yeni access token'ı döndürür. Oturum bilgileri yalnızca sunucu yenileme token'ını reddederse (401) silinir;
+        // geçici hatalarda (5xx, ağ) token'lar korunur ve sonraki çağrı yeniden dener
+        public async Task<string?> RefreshAsync()
+        {
+            await _refreshLock.WaitAsync();
+            try
+            {
+                // Beklerken bu devre ya da aynı tarayıcıdaki başka bir sekme token'ı yenilemiş olabilir;
+                // dönmüş (rotated) eski yenileme token'ını göndermek sunucuda yeniden kullanım tespitini tetikler
+                await ReloadAsync();
+                if (!string.IsNullOrEmpty(_accessToken) && !ExpiresSoon(_accessToken))
+                {
+                    return _accessToken;
+                }
+
+                if (string.IsNullOrEmpty(_refreshToken))
+                {
+                    return null;
+                }
+
+                var json = JsonSerializer.Serialize(new RefreshTokenRequest { RefreshToken = _refreshToken }, JsonOptions);
+                using var content = new StringContent(json, Encoding.UTF8, "application/json");
+
+                HttpResponseMessage response;
+                try
+                {
+                    response = await _httpClientFactory.CreateClient(ApiService.HttpClientName).PostAsync("api/auth/refresh", content);
+                }
+                catch (HttpRequestException ex)
+                {
+                    Console.WriteLine($"Token refresh failed: {ex.Message}");
+                    return CurrentTokenIfValid();
+                }
+
+                using (response)
+                {
+                    if (response.StatusCode == HttpStatusCode.Unauthorized)
+                    {
+                        Console.WriteLine("Token refresh rejected: refresh token is invalid or revoked");
+                        await ClearAsync();
+                        return null;
+                    }
+
+                    if (!response.IsSuccessStatusCode)
+                    {
+                        Console.WriteLine($"Token refresh failed: {response.StatusCode}");
+                        return CurrentTokenIfValid();
+                    }
+
+                    var tokens = JsonSerializer.Deserialize<LoginResponse>(await response.Content.ReadAsStringAsync(), JsonOptions);
+                    if (tokens == null || string.IsNullOrEmpty(tokens.Token))
+                    {
+                        return null;
+                    }
+
+                    _accessToken = tokens.Token;
+                    _refreshToken = tokens.RefreshToken;
+                    await _localStorage.SetItemAsync("authToken", tokens.Token);
+                    await _localStorage.SetItemAsync("refreshToken", tokens.RefreshToken);
+                    return tokens.Token;
+                }
+            }
+            finally
+            {
+                _refreshLock.Release();
+            }
+        }
+
+        // Token'ları localStorage'dan yeniden okur; ön render sırasında erişilemiyorsa bellekteki değerler kalır
+        private async Task ReloadAsync()
+        {
+            _loaded = false;
+            await EnsureLoadedAsync();
+        }
+
+        // Yenileme geçici olarak başarısızsa henüz süresi dolmamış token kullanılmaya devam eder
+        private string? CurrentTokenIfValid()
+        {
+            if (string.IsNullOrEmpty(_accessToken))
+            {
+                return null;
+            }
+
+            try
+            {
+                return new JwtSecurityTokenHandler().ReadJwtToken(_accessToken).ValidTo > DateTime.UtcNow ? _accessToken : null;
+            }
+            catch (ArgumentException)
+            {
+                return null;
+            }
+        }
+
+        private async Task EnsureLoadedAsync()
+        {
+            if (_loaded)
+            {
+                return;
+            }
+
+            try
+            {
+                _accessToken = await _localStorage.GetItemAsync<string>("authToken");
+                _refreshToken = await _localStorage.GetItemAsync<string>("refreshToken");
+                _loaded = true;
+            }
+            catch (InvalidOperationException)
+            {
+                // LocalStorage is not available during static rendering; devre bağlandığında yeniden denenir
+            }
+        }
+
+        private static bool ExpiresSoon(string token)
+        {
+            try
+            {
+                return new JwtSecurityTokenHandler().ReadJwtToken(token).ValidTo < DateTime.UtcNow + TokenRefreshMargin;
+            }
+            catch (ArgumentException)
+            {
+                return true;
+            }
+        }
+    }
+}